@@ -2,6 +2,8 @@
 # Exit on error
 set -o errexit
 
+export DJANGO_SETTINGS_MODULE="${DJANGO_SETTINGS_MODULE:-doctors_patients_service.settings.prod}"
+
 # Modify this line as needed for your package manager (pip, poetry, etc.)
 pip install -r requirements.txt
 
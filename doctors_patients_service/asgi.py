@@ -11,6 +11,8 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "doctors_patients_service.settings")
+os.environ.setdefault(
+    "DJANGO_SETTINGS_MODULE", "doctors_patients_service.settings.prod"
+)
 
 application = get_asgi_application()
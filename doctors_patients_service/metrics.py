@@ -0,0 +1,115 @@
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseForbidden
+)
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+COUNTERS = (
+    ("db_queries_total", "SQL queries executed"),
+    ("db_query_seconds_total", "Time spent in SQL queries"),
+    ("template_render_seconds_total", "Time spent rendering templates"),
+    ("response_bytes_total", "Size of response bodies"),
+)
+
+PREFIX = "doctors_service"
+
+
+class MetricsRegistry:
+    # Process-local aggregates: every worker process exposes its own
+    # numbers and Prometheus sums them up across scrape targets.
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.requests = defaultdict(int)
+        self.counters = defaultdict(float)
+        self.buckets = defaultdict(int)
+        self.durations = defaultdict(float)
+        self.observations = defaultdict(int)
+
+    def record(self, view, method, status, duration, db_queries,
+               db_seconds, template_seconds, response_bytes):
+        with self.lock:
+            self.requests[(view, method, status)] += 1
+            self.counters[("db_queries_total", view)] += db_queries
+            self.counters[("db_query_seconds_total", view)] += db_seconds
+            self.counters[("template_render_seconds_total", view)] += (
+                template_seconds
+            )
+            self.counters[("response_bytes_total", view)] += response_bytes
+            self.durations[view] += duration
+            self.observations[view] += 1
+            for bound in DURATION_BUCKETS:
+                if duration <= bound:
+                    self.buckets[(view, bound)] += 1
+
+    def render(self) -> str:
+        with self.lock:
+            lines = [
+                f"# HELP {PREFIX}_http_requests_total HTTP requests served",
+                f"# TYPE {PREFIX}_http_requests_total counter",
+            ]
+            for (view, method, status), count in sorted(
+                self.requests.items()
+            ):
+                lines.append(
+                    f"{PREFIX}_http_requests_total{{view=\"{view}\","
+                    f"method=\"{method}\",status=\"{status}\"}} {count}"
+                )
+
+            name = f"{PREFIX}_http_request_duration_seconds"
+            lines += [
+                f"# HELP {name} Wall time of HTTP requests",
+                f"# TYPE {name} histogram",
+            ]
+            for view in sorted(self.observations):
+                for bound in DURATION_BUCKETS:
+                    lines.append(
+                        f"{name}_bucket{{view=\"{view}\",le=\"{bound}\"}} "
+                        f"{self.buckets[(view, bound)]}"
+                    )
+                lines += [
+                    f"{name}_bucket{{view=\"{view}\",le=\"+Inf\"}} "
+                    f"{self.observations[view]}",
+                    f"{name}_sum{{view=\"{view}\"}} {self.durations[view]}",
+                    f"{name}_count{{view=\"{view}\"}} "
+                    f"{self.observations[view]}",
+                ]
+
+            for counter, description in COUNTERS:
+                name = f"{PREFIX}_{counter}"
+                lines += [
+                    f"# HELP {name} {description}",
+                    f"# TYPE {name} counter",
+                ]
+                for (metric, view), value in sorted(self.counters.items()):
+                    if metric == counter:
+                        lines.append(f"{name}{{view=\"{view}\"}} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    # Served without a token only where METRICS_REQUIRE_TOKEN is off, i.e.
+    # not in production.
+    token = settings.METRICS_TOKEN
+    if not token:
+        if settings.METRICS_REQUIRE_TOKEN:
+            raise Http404
+    elif request.headers.get("Authorization") != f"Bearer {token}":
+        return HttpResponseForbidden()
+    return HttpResponse(
+        registry.render(),
+        content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
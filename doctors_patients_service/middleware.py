@@ -0,0 +1,88 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db import connection
+
+from doctors_patients_service.metrics import registry
+
+
+class QueryTimer:
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - started
+
+
+class PerformanceMetricsMiddleware:
+    # Keep it first in MIDDLEWARE: the timings then cover the whole
+    # middleware stack, and its process_template_response runs last, right
+    # before a TemplateResponse is rendered. Templates rendered inside a
+    # view with render() are counted as view time. Async capable, so under
+    # ASGI it doesn't push async views onto a thread.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        queries = QueryTimer()
+        request.template_render_seconds = 0.0
+        started = time.perf_counter()
+        with connection.execute_wrapper(queries):
+            response = self.get_response(request)
+        return self.record(request, response, queries, started)
+
+    async def __acall__(self, request):
+        queries = QueryTimer()
+        request.template_render_seconds = 0.0
+        started = time.perf_counter()
+        with connection.execute_wrapper(queries):
+            response = await self.get_response(request)
+        return self.record(request, response, queries, started)
+
+    def record(self, request, response, queries, started):
+        duration = time.perf_counter() - started
+        template_seconds = request.template_render_seconds
+        response_bytes = (
+            0 if response.streaming else len(response.content)
+        )
+        match = getattr(request, "resolver_match", None)
+        registry.record(
+            view=match.view_name if match else "unresolved",
+            method=request.method,
+            status=response.status_code,
+            duration=duration,
+            db_queries=queries.count,
+            db_seconds=queries.seconds,
+            template_seconds=template_seconds,
+            response_bytes=response_bytes,
+        )
+        response["Server-Timing"] = ", ".join([
+            f"total;dur={duration * 1000:.1f}",
+            f"db;dur={queries.seconds * 1000:.1f};"
+            f"desc=\"{queries.count} queries\"",
+            f"tpl;dur={template_seconds * 1000:.1f}",
+        ])
+        return response
+
+    def process_template_response(self, request, response):
+        started = time.perf_counter()
+
+        def rendered(response):
+            request.template_render_seconds = time.perf_counter() - started
+
+        response.add_post_render_callback(rendered)
+        return response
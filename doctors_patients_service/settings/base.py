@@ -15,7 +15,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
-BASE_DIR = Path(__file__).resolve().parent.parent
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.0/howto/deployment/checklist/
@@ -25,9 +25,6 @@ load_dotenv()
 
 SECRET_KEY = os.environ["DJANGO_SECRET_KEY"]
 
-# SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = os.environ.get("DJANGO_DEBUG", "") != "False"
-
 ALLOWED_HOSTS = ["127.0.0.1", "doctors-and-patients-service.onrender.com"]
 
 # Application definition
@@ -41,16 +38,15 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     "phonenumber_field",
     "bootstrap5",
-    "debug_toolbar",
     "crispy_forms",
     "crispy_bootstrap4",
     "doctors_service",
 ]
 
 MIDDLEWARE = [
+    "doctors_patients_service.middleware.PerformanceMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -89,8 +85,22 @@ DATABASES = {
     }
 }
 
-db_from_env = dj_database_url.config(conn_max_age=500)
-DATABASES["default"].update(db_from_env)
+DATABASES["default"].update(dj_database_url.config())
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+if os.environ.get("REDIS_URL"):
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ["REDIS_URL"],
+    }
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -141,9 +151,29 @@ CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap4"
 
 CRISPY_TEMPLATE_PACK = "bootstrap4"
 
-INTERNAL_IPS = [
-    # ...
-    "127.0.0.1",
-    # ...
-]
 LOGIN_REDIRECT_URL = "/"
+
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+# /metrics/ answers 404 while no METRICS_TOKEN is set.
+METRICS_REQUIRE_TOKEN = False
+
+# Background tasks
+# Any class implementing doctors_service.queue.BaseBackend
+
+TASK_QUEUE_BACKEND = os.environ.get(
+    "TASK_QUEUE_BACKEND", "doctors_service.queue.DatabaseBackend"
+)
+
+APPOINTMENT_REMINDER_HOURS = 24
+
+# Slots and appointments older than this are moved to the archive tables.
+ARCHIVE_AFTER_DAYS = int(os.environ.get("ARCHIVE_AFTER_DAYS", 365))
+
+EMAIL_BACKEND = os.environ.get(
+    "EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend"
+)
+
+DEFAULT_FROM_EMAIL = os.environ.get(
+    "DEFAULT_FROM_EMAIL", "no-reply@doctors-and-patients-service.onrender.com"
+)
@@ -0,0 +1,19 @@
+import os
+
+from doctors_patients_service.settings.base import *  # noqa: F401,F403
+from doctors_patients_service.settings.base import INSTALLED_APPS, MIDDLEWARE
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = os.environ.get("DJANGO_DEBUG", "") != "False"
+
+INSTALLED_APPS = INSTALLED_APPS + ["debug_toolbar"]
+
+MIDDLEWARE = MIDDLEWARE.copy()
+MIDDLEWARE.insert(
+    MIDDLEWARE.index("whitenoise.middleware.WhiteNoiseMiddleware") + 1,
+    "debug_toolbar.middleware.DebugToolbarMiddleware"
+)
+
+INTERNAL_IPS = [
+    "127.0.0.1",
+]
@@ -0,0 +1,61 @@
+import os
+
+from doctors_patients_service.settings.base import *  # noqa: F401,F403
+from doctors_patients_service.settings.base import DATABASES, TEMPLATES
+
+DEBUG = False
+
+# Per-route traffic data is only served with METRICS_TOKEN set.
+METRICS_REQUIRE_TOKEN = True
+
+# Persistent connections, checked before reuse so a connection dropped by
+# the database server doesn't fail the next request.
+DATABASES = {
+    "default": {
+        **DATABASES["default"],
+        "CONN_MAX_AGE": 500,
+        "CONN_HEALTH_CHECKS": True,
+    }
+}
+
+TEMPLATES = [
+    {
+        **TEMPLATES[0],
+        "APP_DIRS": False,
+        "OPTIONS": {
+            **TEMPLATES[0]["OPTIONS"],
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
+        },
+    },
+]
+
+# Page fragments, counters and version stamps have to be shared by all the
+# worker processes, the local-memory cache of base can't do that.
+if not os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": os.environ.get(
+                "DJANGO_CACHE_DIR", "/var/tmp/doctors_patients_service"
+            ),
+        }
+    }
+
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": (
+            "django.contrib.staticfiles.storage.ManifestStaticFilesStorage"
+        ),
+    },
+}
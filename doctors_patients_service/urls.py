@@ -15,15 +15,21 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 
+from doctors_patients_service.metrics import metrics_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path(
         "",
         include("doctors_service.urls", namespace="doctors_service")
     ),
-    path("__debug__/", include("debug_toolbar.urls")),
     path("accounts/", include("django.contrib.auth.urls")),
+    path("metrics/", metrics_view, name="metrics"),
 ]
+
+if "debug_toolbar" in settings.INSTALLED_APPS:
+    urlpatterns.append(path("__debug__/", include("debug_toolbar.urls")))
@@ -11,6 +11,8 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "doctors_patients_service.settings")
+os.environ.setdefault(
+    "DJANGO_SETTINGS_MODULE", "doctors_patients_service.settings.prod"
+)
 
 application = get_wsgi_application()
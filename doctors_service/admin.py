@@ -1,10 +1,23 @@
-from django.contrib import admin
+import io
+
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponseRedirect
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
 
 from doctors_service.models import (Doctor,
                                     DoctorSpecialty,
                                     DoctorSchedule,
-                                    Appointment)
+                                    WeeklySchedule,
+                                    Appointment,
+                                    ArchivedAppointment,
+                                    Task)
+from doctors_service.forms import DataImportForm
+from doctors_service.imports import IMPORTS, import_format_for, read_rows
+
+IMPORT_ERRORS_SHOWN = 50
 
 
 @admin.register(Doctor)
@@ -37,6 +50,65 @@ class DoctorAdmin(UserAdmin):
             ),
         )
     )
+    change_list_template = "admin/doctors_service/doctor/change_list.html"
+
+    def get_urls(self):
+        return [
+            path(
+                "import/",
+                self.admin_site.admin_view(self.import_view),
+                name="doctors_service_doctor_import",
+            ),
+        ] + super().get_urls()
+
+    def has_import_permission(self, request) -> bool:
+        # An import creates doctors, specialties and slots.
+        return self.has_add_permission(request) and all(
+            request.user.has_perm(
+                f"{model._meta.app_label}.add_{model._meta.model_name}"
+            )
+            for model in (DoctorSpecialty, DoctorSchedule)
+        )
+
+    def changelist_view(self, request, extra_context=None):
+        return super().changelist_view(request, {
+            "has_import_permission": self.has_import_permission(request),
+            **(extra_context or {}),
+        })
+
+    def import_view(self, request):
+        if not self.has_import_permission(request):
+            raise PermissionDenied
+        form = DataImportForm(request.POST or None, request.FILES or None)
+        if request.method == "POST" and form.is_valid():
+            upload = form.cleaned_data["file"]
+            import_name = form.cleaned_data["import_name"]
+            file = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+            result = IMPORTS[import_name](
+                read_rows(file, import_format_for(upload.name))
+            )
+            self.message_user(
+                request,
+                f"Created {result['created']} {import_name}, "
+                f"skipped {len(result['errors'])} rows"
+            )
+            for number, message in result["errors"][:IMPORT_ERRORS_SHOWN]:
+                self.message_user(
+                    request, f"Row {number}: {message}", messages.WARNING
+                )
+            return HttpResponseRedirect(
+                reverse("admin:doctors_service_doctor_changelist")
+            )
+        return TemplateResponse(
+            request,
+            "admin/doctors_service/doctor/import_form.html",
+            {
+                **self.admin_site.each_context(request),
+                "opts": self.model._meta,
+                "title": "Import data",
+                "form": form,
+            }
+        )
 
 
 @admin.register(DoctorSpecialty)
@@ -49,6 +121,31 @@ class DoctorScheduleAdmin(admin.ModelAdmin):
     list_display = ("doctor", "date", "time",)
 
 
+@admin.register(WeeklySchedule)
+class WeeklyScheduleAdmin(admin.ModelAdmin):
+    list_display = ("doctor", "weekday", "timeslot",)
+
+
 @admin.register(Appointment)
 class AppointmentAdmin(admin.ModelAdmin):
     list_display = ("doctor", "doctor_schedule", "first_name", "last_name",)
+    list_select_related = ("doctor", "doctor_schedule")
+
+
+@admin.register(ArchivedAppointment)
+class ArchivedAppointmentAdmin(admin.ModelAdmin):
+    list_display = ("doctor", "doctor_schedule", "first_name", "last_name",)
+    list_select_related = ("doctor", "doctor_schedule")
+    search_fields = ("insurance_number",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ("name", "status", "run_at", "started_at", "attempts",)
+    list_filter = ("status", "name",)
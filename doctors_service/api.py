@@ -0,0 +1,288 @@
+import hashlib
+import re
+from datetime import datetime, time
+from functools import wraps
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import F
+from django.http import HttpRequest, HttpResponseNotAllowed, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.views.decorators.http import condition, require_GET
+
+from doctors_service import versions
+from doctors_service.caching import (
+    FREE_SLOTS_CACHE_TIMEOUT,
+    free_slots_cache_key
+)
+from doctors_service.forms import AvailabilitySearchForm
+from doctors_service.models import Doctor, DoctorSchedule, DoctorSpecialty
+from doctors_service.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_filter
+)
+from doctors_service.search import search_doctors
+
+API_PAGE_SIZE = 20
+API_MAX_PAGE_SIZE = 100
+
+SPECIALTY_FIELDS = ("id", "specialty")
+DOCTOR_FIELDS = ("id", "first_name", "last_name", "city", "hospital",
+                 "specialty")
+SLOT_FIELDS = ("id", "date", "timeslot", "time")
+AVAILABILITY_FIELDS = SLOT_FIELDS + ("doctor_id", "doctor_first_name",
+                                     "doctor_last_name", "doctor_city",
+                                     "doctor_hospital")
+
+SPECIALTY_ORDERING = ("specialty", "id")
+DOCTOR_ORDERING = ("first_name", "last_name", "id")
+SLOT_ORDERING = ("date", "timeslot", "id")
+SEARCH_ORDERING = ("-rank", "id")
+
+
+class ApiError(Exception):
+    pass
+
+
+def started_timeslots() -> list:
+    return DoctorSchedule.started_timeslots(timezone.localtime().time())
+
+
+def availability_changed_at() -> datetime:
+    # Slots drop out of the "free" lists as days pass and as today's
+    # timeslots start, without any write: the start of the latest started
+    # timeslot, or midnight.
+    started = started_timeslots()
+    start = time.min
+    if started:
+        label = DoctorSchedule.TIMESLOT_LIST[started[-1]][1]
+        start = time.fromisoformat(label[:5])
+    return timezone.make_aware(datetime.combine(timezone.localdate(), start))
+
+
+def api_versions(*scopes):
+    def etag(request, *args, **kwargs):
+        key = "|".join(
+            [
+                request.get_full_path(),
+                str(timezone.localdate()),
+                str(len(started_timeslots())),
+            ]
+            + [str(versions.get_version(scope)) for scope in scopes]
+        )
+        return hashlib.md5(key.encode()).hexdigest()
+
+    def last_modified(request, *args, **kwargs):
+        return max(
+            versions.last_modified(*scopes),
+            availability_changed_at()
+        )
+
+    return condition(etag_func=etag, last_modified_func=last_modified)
+
+
+def selected_fields(request: HttpRequest, fields: tuple) -> list:
+    requested = request.GET.get("fields")
+    if not requested:
+        return list(fields)
+    selected = [field for field in requested.split(",") if field in fields]
+    if not selected:
+        raise ApiError(f"fields must be a subset of: {', '.join(fields)}")
+    return selected
+
+
+def page_size(request: HttpRequest) -> int:
+    try:
+        size = int(request.GET.get("limit", API_PAGE_SIZE))
+    except ValueError:
+        raise ApiError("limit must be a number")
+    return max(1, min(size, API_MAX_PAGE_SIZE))
+
+
+def paginate(request, queryset, fields, ordering, computed=None):
+    selected = selected_fields(request, fields)
+    limit = page_size(request)
+    columns = [field.lstrip("-") for field in ordering]
+    columns += [
+        field for field in selected
+        if field not in columns and field not in (computed or {})
+    ]
+    cursor = request.GET.get("cursor")
+    try:
+        if cursor:
+            queryset = queryset.filter(
+                keyset_filter(ordering, decode_cursor(cursor))
+            )
+        rows = list(
+            queryset.order_by(*ordering).values(*columns)[:limit + 1]
+        )
+    except (ValueError, TypeError, OverflowError, ValidationError):
+        raise ApiError("Invalid cursor")
+    next_url = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        query = request.GET.copy()
+        query["cursor"] = encode_cursor(
+            rows[-1][field.lstrip("-")] for field in ordering
+        )
+        next_url = f"{request.path}?{query.urlencode()}"
+
+    for name, compute in (computed or {}).items():
+        if name in selected:
+            compute(rows)
+
+    return JsonResponse({
+        "results": [
+            {field: row[field] for field in selected} for row in rows
+        ],
+        "next": next_url,
+    })
+
+
+def api_response(view):
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        try:
+            return view(request, *args, **kwargs)
+        except ApiError as error:
+            return JsonResponse({"error": str(error)}, status=400)
+
+    return wrapper
+
+
+def add_doctor_specialties(rows):
+    specialties = {row["id"]: [] for row in rows}
+    links = Doctor.specialty.through.objects.filter(
+        doctor_id__in=specialties
+    ).values_list("doctor_id", "doctorspecialty_id")
+    for doctor_id, specialty_id in links:
+        specialties[doctor_id].append(specialty_id)
+    for row in rows:
+        row["specialty"] = specialties[row["id"]]
+
+
+def add_slot_time(rows):
+    times = dict(DoctorSchedule.TIMESLOT_LIST)
+    for row in rows:
+        row["time"] = times[row["timeslot"]]
+
+
+def doctors_response(request, queryset):
+    city = request.GET.get("city")
+    if city:
+        queryset = queryset.filter(city__icontains=city)
+    ordering = DOCTOR_ORDERING
+    search = request.GET.get("search", "")
+    if re.search(r"\w", search):
+        # Best matches first, as on the doctor list page.
+        queryset = search_doctors(queryset, search)
+        ordering = SEARCH_ORDERING
+    return paginate(
+        request,
+        queryset,
+        DOCTOR_FIELDS,
+        ordering,
+        computed={"specialty": add_doctor_specialties}
+    )
+
+
+@require_GET
+@api_versions("specialties")
+@api_response
+def api_specialties_list(request: HttpRequest) -> JsonResponse:
+    return paginate(
+        request,
+        DoctorSpecialty.objects.all(),
+        SPECIALTY_FIELDS,
+        SPECIALTY_ORDERING
+    )
+
+
+@require_GET
+@api_versions("doctors")
+@api_response
+def api_doctors_list(request: HttpRequest) -> JsonResponse:
+    return doctors_response(request, Doctor.objects.all())
+
+
+@require_GET
+@api_versions("doctors", "specialties")
+@api_response
+def api_specialty_doctors_list(
+    request: HttpRequest,
+    pk: int
+) -> JsonResponse:
+    specialty = get_object_or_404(DoctorSpecialty, pk=pk)
+    return doctors_response(request, specialty.doctors.all())
+
+
+@require_GET
+@api_versions("doctors", "schedules")
+@api_response
+def api_doctor_slots_list(request: HttpRequest, pk: int) -> JsonResponse:
+    doctor = get_object_or_404(Doctor.objects.only("pk"), pk=pk)
+    return paginate(
+        request,
+        doctor.doctor_schedule.available(),
+        SLOT_FIELDS,
+        SLOT_ORDERING,
+        computed={"time": add_slot_time}
+    )
+
+
+@require_GET
+@api_versions("specialties", "doctors", "schedules")
+@api_response
+def api_availability_search(request: HttpRequest) -> JsonResponse:
+    # Earliest free slots of every doctor matching ?specialty=&city=
+    # &date_from=&date_to=, one query per page.
+    form = AvailabilitySearchForm(request.GET)
+    if not form.is_valid():
+        raise ApiError(" ".join(
+            f"{field}: {message}"
+            for field, messages in form.errors.items()
+            for message in messages
+        ))
+    queryset = form.filter_slots(DoctorSchedule.objects.available())
+    return paginate(
+        request,
+        queryset.annotate(
+            doctor_first_name=F("doctor__first_name"),
+            doctor_last_name=F("doctor__last_name"),
+            doctor_city=F("doctor__city"),
+            doctor_hospital=F("doctor__hospital"),
+        ),
+        AVAILABILITY_FIELDS,
+        SLOT_ORDERING,
+        computed={"time": add_slot_time}
+    )
+
+
+async def api_doctor_free_slots(
+    request: HttpRequest,
+    pk: int
+) -> JsonResponse:
+    # Polled by the appointment form on every doctor change: async, so
+    # under ASGI it waits on the cache and the database without holding a
+    # worker, and cached per doctor until the next booking or schedule
+    # change. Slots are [id, date, timeslot] and the labels of the
+    # timeslots are sent once.
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+    key = free_slots_cache_key(pk)
+    slots = await cache.aget(key)
+    if slots is None:
+        rows = DoctorSchedule.objects.available().filter(
+            doctor_id=pk
+        ).order_by("date", "timeslot").values_list("id", "date", "timeslot")
+        slots = [
+            [slot_id, slot_date.isoformat(), timeslot]
+            async for slot_id, slot_date, timeslot in rows
+        ]
+        await cache.aset(key, slots, FREE_SLOTS_CACHE_TIMEOUT)
+    return JsonResponse({
+        "times": dict(DoctorSchedule.TIMESLOT_LIST),
+        "slots": slots,
+    })
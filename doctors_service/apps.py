@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class DoctorsServiceConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "doctors_service"
+
+    def ready(self):
+        from doctors_service import signals, tasks  # noqa: F401
@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from doctors_service import versions
+from doctors_service.bulk import delete_rows
+from doctors_service.models import (
+    Appointment,
+    ArchivedAppointment,
+    ArchivedDoctorSchedule,
+    DailyAvailability,
+    DoctorSchedule
+)
+
+BATCH_SIZE = 1000
+
+
+def column_names(model) -> list:
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+def archive_slots(slot_ids) -> int:
+    # Copies the slots and their appointments to the archive tables and
+    # deletes them from the live ones in one transaction. Rows are deleted
+    # without the per-row signals: the dashboard counters include the
+    # archive, so they don't change.
+    slots = DoctorSchedule.objects.filter(pk__in=slot_ids)
+    appointments = Appointment.objects.filter(doctor_schedule_id__in=slot_ids)
+    with transaction.atomic():
+        ArchivedDoctorSchedule.objects.bulk_create(
+            ArchivedDoctorSchedule(**row)
+            for row in slots.values(*column_names(DoctorSchedule))
+        )
+        archived = ArchivedAppointment.objects.bulk_create(
+            ArchivedAppointment(**row)
+            for row in appointments.values(*column_names(Appointment))
+        )
+        delete_rows(Appointment, [appointment.pk for appointment in archived])
+        delete_rows(DoctorSchedule, slot_ids)
+    return len(archived)
+
+
+def archive_past_records(days: int = None,
+                         batch_size: int = BATCH_SIZE) -> dict:
+    # Moves slots older than "days" days, with their appointments, out of
+    # the live tables, so these and their indexes (the unique insurance
+    # number included) only hold recent and upcoming visits.
+    if days is None:
+        days = settings.ARCHIVE_AFTER_DAYS
+    cutoff = timezone.localdate() - timedelta(days=days)
+    old_slots = DoctorSchedule.objects.filter(
+        date__lt=cutoff
+    ).order_by("pk").values_list("pk", flat=True)
+    result = {"slots": 0, "appointments": 0}
+    while batch := list(old_slots[:batch_size]):
+        result["appointments"] += archive_slots(batch)
+        result["slots"] += len(batch)
+    DailyAvailability.objects.filter(date__lt=cutoff).delete()
+    if result["slots"]:
+        versions.invalidate("schedules")
+    return result
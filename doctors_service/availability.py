@@ -0,0 +1,146 @@
+from itertools import groupby, islice
+
+from django.db import transaction
+from django.db.models import Count, F, Min, OuterRef, QuerySet, Subquery
+from django.utils import timezone
+
+from doctors_service.models import DailyAvailability, Doctor, DoctorSchedule
+
+BATCH_SIZE = 1000
+
+ALL_TIMESLOTS = (1 << len(DoctorSchedule.TIMESLOT_LIST)) - 1
+
+
+def daily_masks(rows):
+    # (doctor_id, date, timeslot) rows of free slots, ordered by doctor and
+    # date, folded into ((doctor_id, date), free_slots) pairs.
+    for key, group in groupby(rows, key=lambda row: row[:2]):
+        mask = 0
+        for _, _, timeslot in group:
+            mask |= 1 << timeslot
+        yield key, mask
+
+
+def refresh_daily_availability(doctor_ids, dates) -> None:
+    # Recomputes the rows of every given doctor on every given date from the
+    # schedule; days left without free slots are removed. The free slots are
+    # read locked in the same transaction as the upsert: a booking waits for
+    # it and clears its bit afterwards, or commits first and is not read.
+    doctor_ids, dates = set(doctor_ids), set(dates)
+    if not doctor_ids or not dates:
+        return
+    with transaction.atomic():
+        masks = dict(daily_masks(
+            DoctorSchedule.objects.select_for_update().filter(
+                doctor_id__in=doctor_ids,
+                date__in=dates,
+                is_booked=False
+            ).order_by("doctor_id", "date", "timeslot").values_list(
+                "doctor_id", "date", "timeslot"
+            )
+        ))
+        existing = DailyAvailability.objects.select_for_update().filter(
+            doctor_id__in=doctor_ids,
+            date__in=dates
+        ).order_by("doctor_id", "date").values_list("pk", "doctor_id", "date")
+        DailyAvailability.objects.filter(pk__in=[
+            pk for pk, doctor_id, day in existing
+            if (doctor_id, day) not in masks
+        ]).delete()
+        DailyAvailability.objects.bulk_create(
+            [
+                DailyAvailability(doctor_id=doctor_id, date=day,
+                                  free_slots=mask)
+                for (doctor_id, day), mask in masks.items()
+            ],
+            update_conflicts=True,
+            unique_fields=("doctor", "date"),
+            update_fields=("free_slots", ),
+        )
+
+
+def refresh_slots_availability(slots) -> None:
+    refresh_daily_availability(
+        {slot.doctor_id for slot in slots},
+        {slot.date for slot in slots}
+    )
+
+
+def book_daily_timeslot(slot: DoctorSchedule) -> None:
+    # A single "free_slots & ~bit" UPDATE, so concurrent bookings of the
+    # same day don't overwrite each other's bits.
+    DailyAvailability.objects.filter(
+        doctor_id=slot.doctor_id,
+        date=slot.date
+    ).update(
+        free_slots=F("free_slots").bitand(ALL_TIMESLOTS ^ 1 << slot.timeslot)
+    )
+
+
+def rebuild_daily_availability(batch_size: int = BATCH_SIZE) -> int:
+    rows = DoctorSchedule.objects.filter(is_booked=False).order_by(
+        "doctor_id", "date"
+    ).values_list("doctor_id", "date", "timeslot").iterator(
+        chunk_size=batch_size
+    )
+    masks = daily_masks(rows)
+    created = 0
+    with transaction.atomic():
+        DailyAvailability.objects.all().delete()
+        while batch := list(islice(masks, batch_size)):
+            created += len(DailyAvailability.objects.bulk_create(
+                DailyAvailability(doctor_id=doctor_id, date=day,
+                                  free_slots=mask)
+                for (doctor_id, day), mask in batch
+            ))
+    return created
+
+
+def annotate_next_free_slot(queryset: QuerySet) -> QuerySet:
+    # Adds next_free_date / next_free_slots to a doctor queryset. Both
+    # correlated subqueries read the first available day of the doctor,
+    # one row per day instead of one per slot.
+    next_day = DailyAvailability.objects.available().filter(
+        doctor=OuterRef("pk")
+    ).order_by("date")
+    return queryset.annotate(
+        next_free_date=Subquery(next_day.values("date")[:1]),
+        next_free_slots=Subquery(next_day.values("free_slots")[:1]),
+    )
+
+
+def add_next_free_time(doctors) -> None:
+    now = timezone.localtime()
+    started = DoctorSchedule.started_timeslots(now.time())
+    times = dict(DoctorSchedule.TIMESLOT_LIST)
+    for doctor in doctors:
+        timeslots = [
+            timeslot
+            for timeslot in DailyAvailability(
+                free_slots=doctor.next_free_slots or 0
+            ).timeslots
+            if doctor.next_free_date != now.date() or timeslot not in started
+        ]
+        doctor.next_free_timeslot = timeslots[0] if timeslots else None
+        doctor.next_free_time = times.get(doctor.next_free_timeslot)
+
+
+def annotate_specialty_availability(queryset: QuerySet) -> QuerySet:
+    # Adds doctors_count and next_free_date to a specialty queryset in the
+    # same query. The date is the minimum over the doctors of their first
+    # available day, an index seek per doctor, instead of aggregating
+    # every slot of every doctor of the specialty.
+    first_free_date = DailyAvailability.objects.available().filter(
+        doctor=OuterRef("doctor_id")
+    ).order_by("date").values("date")[:1]
+    next_free_date = Doctor.specialty.through.objects.filter(
+        doctorspecialty=OuterRef("pk")
+    ).annotate(
+        first_free_date=Subquery(first_free_date)
+    ).values("doctorspecialty").annotate(
+        next_free_date=Min("first_free_date")
+    ).values("next_free_date")
+    return queryset.annotate(
+        doctors_count=Count("doctors", distinct=True),
+        next_free_date=Subquery(next_free_date),
+    )
@@ -0,0 +1,119 @@
+import time
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from doctors_service.models import (
+    Appointment,
+    Doctor,
+    DoctorSchedule,
+    DoctorSpecialty
+)
+
+PERCENTILES = (50, 95, 99)
+
+# Requests come from outside INTERNAL_IPS so the debug toolbar stays off.
+CLIENT_DEFAULTS = {"HTTP_HOST": "127.0.0.1", "REMOTE_ADDR": "192.0.2.1"}
+
+
+def route_requests() -> dict:
+    # url name -> (url kwargs, query string) for every route of
+    # doctors_service.urls, pointed at the busiest rows of the dataset.
+    doctor = Doctor.objects.filter(
+        doctor_schedule__isnull=False
+    ).order_by("pk").first() or Doctor.objects.order_by("pk").first()
+    specialty = DoctorSpecialty.objects.order_by("pk").first()
+    appointment = Appointment.objects.order_by("pk").first()
+    schedule = DoctorSchedule.objects.filter(
+        doctor=doctor
+    ).order_by("pk").first()
+    return {
+        "index": ({}, {}),
+        "specialties-list": ({}, {}),
+        "specialties-detail": ({"pk": specialty.pk}, {}),
+        "doctors-list": ({}, {}),
+        "doctors-detail": ({"pk": doctor.pk}, {}),
+        "availability-search": (
+            {}, {"specialty": specialty.pk, "city": doctor.city}
+        ),
+        "appointments-list": ({}, {}),
+        "appointment-detail": ({"pk": appointment.pk}, {}),
+        "doctor-schedule-form": ({"pk": doctor.pk}, {}),
+        "doctor-schedule-generate": ({"pk": doctor.pk}, {}),
+        "doctor-schedule-confirm-delete": (
+            {"doctor_id": doctor.pk, "pk": schedule.pk}, {}
+        ),
+        "doctor-form": ({}, {}),
+        "doctor-update": ({"pk": doctor.pk}, {}),
+        "doctor-delete": ({"pk": doctor.pk}, {}),
+        "appointment-form": ({}, {}),
+        "appointment-confirm": ({"pk": appointment.pk}, {}),
+        "appointments-export": ({}, {"doctor": doctor.pk}),
+        "schedules-export": ({}, {"doctor": doctor.pk}),
+        "api-specialties-list": ({}, {}),
+        "api-specialty-doctors-list": ({"pk": specialty.pk}, {}),
+        "api-doctors-list": ({}, {}),
+        "api-doctor-slots-list": ({"pk": doctor.pk}, {}),
+        "api-doctor-free-slots": ({"pk": doctor.pk}, {}),
+        "api-availability-search": (
+            {}, {"specialty": specialty.pk, "city": doctor.city}
+        ),
+    }
+
+
+def percentile(values: list, rank: int) -> float:
+    ordered = sorted(values)
+    index = round(rank / 100 * (len(ordered) - 1))
+    return ordered[index]
+
+
+def measure(client: Client, url: str, query: dict, repeat: int) -> dict:
+    timings = []
+    queries = []
+    status_code = None
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = client.get(url, query)
+            timings.append((time.perf_counter() - started) * 1000)
+        queries.append(len(captured))
+        status_code = response.status_code
+    result = {
+        "url": url,
+        "status_code": status_code,
+        # The first request warms caches, the steady state is reported.
+        "queries": queries[-1],
+        "max_queries": max(queries),
+    }
+    for rank in PERCENTILES:
+        result[f"p{rank}_ms"] = round(percentile(timings, rank), 3)
+    return result
+
+
+def run_benchmark(repeat: int = 20, user=None) -> dict:
+    client = Client(**CLIENT_DEFAULTS)
+    if user is not None:
+        client.force_login(user)
+    results = {}
+    for name, (kwargs, query) in route_requests().items():
+        url = reverse(f"doctors_service:{name}", kwargs=kwargs)
+        results[name] = measure(client, url, query, repeat)
+    return results
+
+
+def check_budget(results: dict, budget: dict) -> list:
+    violations = []
+    for name, limits in budget.items():
+        result = results.get(name)
+        if result is None:
+            violations.append(f"{name}: route was not measured")
+            continue
+        for metric, limit in limits.items():
+            if result[metric] > limit:
+                violations.append(
+                    f"{name}: {metric} is {result[metric]}, "
+                    f"the budget is {limit}"
+                )
+    return violations
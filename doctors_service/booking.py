@@ -0,0 +1,33 @@
+from django.db import transaction
+
+from doctors_service import versions
+from doctors_service.availability import book_daily_timeslot
+from doctors_service.caching import invalidate_free_slots
+from doctors_service.models import Appointment, DoctorSchedule
+from doctors_service.tasks import schedule_appointment_tasks
+
+
+class SlotAlreadyBooked(Exception):
+    pass
+
+
+def book_appointment(appointment: Appointment) -> Appointment:
+    # The slot is claimed with a single conditional UPDATE, so of several
+    # concurrent bookings for the same slot exactly one matches the
+    # "is_booked=False" row; the appointment is written in the same
+    # transaction and the claim is rolled back if saving it fails.
+    with transaction.atomic():
+        claimed = DoctorSchedule.objects.filter(
+            pk=appointment.doctor_schedule_id,
+            is_booked=False
+        ).update(is_booked=True)
+        if not claimed:
+            raise SlotAlreadyBooked(
+                "This time has already been booked, please choose another one"
+            )
+        appointment.save()
+        book_daily_timeslot(appointment.doctor_schedule)
+        versions.invalidate("schedules")
+        invalidate_free_slots(appointment.doctor_id)
+        schedule_appointment_tasks(appointment)
+    return appointment
@@ -0,0 +1,17 @@
+from django.db import connection
+
+
+def delete_rows(model, pks) -> int:
+    # One DELETE by primary key, without the ORM collector and the per-row
+    # signals: the callers invalidate caches and availability once for the
+    # whole run. Rows referencing these have to be deleted first.
+    pks = list(pks)
+    if not pks:
+        return 0
+    table = connection.ops.quote_name(model._meta.db_table)
+    placeholders = ", ".join(["%s"] * len(pks))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {table} WHERE id IN ({placeholders})", pks
+        )
+        return cursor.rowcount
@@ -0,0 +1,69 @@
+import hashlib
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from doctors_service import versions
+
+PAGE_CACHE_TIMEOUT = 60 * 10
+
+FREE_SLOTS_CACHE_TIMEOUT = 30
+
+
+def cache_version(scopes) -> str:
+    return "-".join(str(versions.get_version(scope)) for scope in scopes)
+
+
+def free_slots_cache_key(doctor_id) -> str:
+    # Slots stop being "future" at midnight, so the day is part of the key.
+    return f"free_slots:{doctor_id}:{timezone.localdate()}"
+
+
+def delete_free_slots(doctor_ids) -> None:
+    cache.delete_many([
+        free_slots_cache_key(doctor_id) for doctor_id in doctor_ids
+    ])
+
+
+def invalidate_free_slots(*doctor_ids) -> None:
+    # Same as versions.invalidate: dropped now and again on commit.
+    delete_free_slots(doctor_ids)
+    transaction.on_commit(partial(delete_free_slots, doctor_ids))
+
+
+def page_cache_key(request, scopes) -> str:
+    query = request.GET.urlencode()
+    key = "|".join([request.path, query, cache_version(scopes)])
+    return f"pages:{hashlib.md5(key.encode()).hexdigest()}"
+
+
+class PublicPageCacheMixin:
+    # Whole-page cache for anonymous visitors. The key contains the
+    # version stamps of cache_scopes, which model signals bump on every
+    # change, so stale pages are never served and simply expire.
+    cache_scopes = ()
+    cache_timeout = PAGE_CACHE_TIMEOUT
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method != "GET" or request.user.is_authenticated:
+            return super().dispatch(request, *args, **kwargs)
+
+        key = page_cache_key(request, self.cache_scopes)
+        response = cache.get(key)
+        if response is not None:
+            return response
+
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code == 200:
+            response.add_post_render_callback(
+                lambda rendered: cache.set(key, rendered, self.cache_timeout)
+            )
+        return response
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["cache_version"] = cache_version(self.cache_scopes)
+        context["cache_timeout"] = self.cache_timeout
+        return context
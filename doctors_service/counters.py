@@ -0,0 +1,57 @@
+from django.core.cache import cache
+
+from doctors_service.models import (
+    Appointment,
+    ArchivedAppointment,
+    Doctor,
+    DoctorSpecialty
+)
+
+CACHE_KEY_PREFIX = "counters"
+
+COUNTERS = {
+    "num_doctors": lambda: Doctor.objects.count(),
+    "num_specialties": lambda: DoctorSpecialty.objects.count(),
+    "num_appointments": lambda: (
+        Appointment.objects.count() + ArchivedAppointment.objects.count()
+    ),
+    "num_patients": lambda: Appointment.objects.order_by().values(
+        "insurance_number"
+    ).union(
+        ArchivedAppointment.objects.order_by().values("insurance_number")
+    ).count(),
+}
+
+
+def cache_key(name: str) -> str:
+    return f"{CACHE_KEY_PREFIX}:{name}"
+
+
+def reconcile(names=None) -> dict:
+    values = {name: COUNTERS[name]() for name in names or COUNTERS}
+    cache.set_many(
+        {cache_key(name): value for name, value in values.items()},
+        timeout=None
+    )
+    return values
+
+
+def get_counters() -> dict:
+    cached = cache.get_many([cache_key(name) for name in COUNTERS])
+    counters = {
+        name: cached[cache_key(name)]
+        for name in COUNTERS
+        if cache_key(name) in cached
+    }
+    missing = [name for name in COUNTERS if name not in counters]
+    if missing:
+        counters.update(reconcile(missing))
+    return counters
+
+
+def increment(name: str, delta: int = 1) -> None:
+    try:
+        cache.incr(cache_key(name), delta)
+    except ValueError:
+        # Not cached yet, the next read computes it from the database.
+        pass
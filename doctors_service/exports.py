@@ -0,0 +1,94 @@
+import csv
+import json
+
+from django.db.models import QuerySet
+
+from doctors_service.forms import AppointmentSearchForm
+from doctors_service.models import Appointment, DoctorSchedule
+
+CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = ("csv", "jsonl")
+
+CONTENT_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/jsonl",
+}
+
+# column -> lookup, rows are read with values_list() so no model instance
+# is built per row.
+APPOINTMENT_COLUMNS = {
+    "id": "id",
+    "date": "doctor_schedule__date",
+    "timeslot": "doctor_schedule__timeslot",
+    "doctor_id": "doctor_id",
+    "doctor_first_name": "doctor__first_name",
+    "doctor_last_name": "doctor__last_name",
+    "first_name": "first_name",
+    "last_name": "last_name",
+    "email": "email",
+    "phone": "phone",
+    "insurance_number": "insurance_number",
+}
+
+SCHEDULE_COLUMNS = {
+    "id": "id",
+    "doctor_id": "doctor_id",
+    "date": "date",
+    "timeslot": "timeslot",
+    "is_booked": "is_booked",
+}
+
+
+class Echo:
+    # Lets csv.writer hand every formatted line back instead of buffering.
+
+    def write(self, value):
+        return value
+
+
+def appointments_queryset(form: AppointmentSearchForm) -> QuerySet:
+    return form.filter_appointments(Appointment.objects.order_by(
+        "doctor_schedule__date",
+        "doctor_schedule__timeslot",
+        "pk"
+    ))
+
+
+def schedules_queryset(form: AppointmentSearchForm) -> QuerySet:
+    return form.filter_schedules(
+        DoctorSchedule.objects.order_by("date", "timeslot", "pk")
+    )
+
+
+EXPORTS = {
+    "appointments": (appointments_queryset, APPOINTMENT_COLUMNS),
+    "schedules": (schedules_queryset, SCHEDULE_COLUMNS),
+}
+
+
+def export_rows(queryset: QuerySet, columns: dict,
+                chunk_size: int = CHUNK_SIZE):
+    names = list(columns)
+    times = dict(DoctorSchedule.TIMESLOT_LIST)
+    rows = queryset.values_list(*columns.values()).iterator(
+        chunk_size=chunk_size
+    )
+    for values in rows:
+        row = dict(zip(names, values))
+        row["time"] = times[row["timeslot"]]
+        yield row
+
+
+def export_lines(queryset: QuerySet, columns: dict, export_format: str,
+                 chunk_size: int = CHUNK_SIZE):
+    rows = export_rows(queryset, columns, chunk_size)
+    if export_format == "jsonl":
+        for row in rows:
+            yield json.dumps(row, default=str) + "\n"
+        return
+
+    writer = csv.writer(Echo())
+    yield writer.writerow([*columns, "time"])
+    for row in rows:
+        yield writer.writerow(row.values())
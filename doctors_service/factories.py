@@ -0,0 +1,158 @@
+import random
+import string
+from datetime import date, timedelta
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from doctors_service import counters, versions
+from doctors_service.availability import refresh_slots_availability
+from doctors_service.models import (
+    Appointment,
+    Doctor,
+    DoctorSchedule,
+    DoctorSpecialty
+)
+
+BATCH_SIZE = 2000
+
+SPECIALTIES = (
+    "Cardiology",
+    "Dentistry",
+    "Dermatology",
+    "Endocrinology",
+    "Gastroenterology",
+    "Neurology",
+    "Ophthalmology",
+    "Pediatrics",
+    "Surgery",
+    "Therapist",
+)
+
+CITIES = ("Kyiv", "Lviv", "Odesa", "Kharkiv", "Dnipro", "Vinnytsia")
+
+FIRST_NAMES = ("Olena", "Taras", "Iryna", "Andrii", "Oksana", "Petro",
+               "Natalia", "Dmytro", "Sofiia", "Mykola")
+
+LAST_NAMES = ("Shevchenko", "Kovalenko", "Bondarenko", "Tkachenko",
+              "Kravchenko", "Melnyk", "Boyko", "Moroz", "Lysenko", "Savchuk")
+
+
+def licence_number(number: int) -> str:
+    letters = ""
+    prefix = number // 100000
+    for _ in range(3):
+        prefix, index = divmod(prefix, 26)
+        letters = string.ascii_uppercase[index] + letters
+    return f"{letters}{number % 100000:05d}"
+
+
+def batched(iterable, batch_size: int):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def seed_specialties() -> list:
+    existing = set(
+        DoctorSpecialty.objects.values_list("specialty", flat=True)
+    )
+    DoctorSpecialty.objects.bulk_create(
+        DoctorSpecialty(specialty=name)
+        for name in SPECIALTIES
+        if name not in existing
+    )
+    return list(DoctorSpecialty.objects.values_list("pk", flat=True))
+
+
+def seed_doctors(count: int, rng: random.Random,
+                 batch_size: int = BATCH_SIZE) -> list:
+    specialty_ids = seed_specialties()
+    # Hashing a password per doctor would dominate the seeding time, the
+    # seeded accounts get a single unusable one instead.
+    password = make_password(None)
+    offset = Doctor.objects.order_by("-pk").values_list(
+        "pk", flat=True
+    ).first() or 0
+    doctor_ids = []
+
+    def doctors():
+        for number in range(offset, offset + count):
+            yield Doctor(
+                username=f"seed_doctor_{number}",
+                password=password,
+                first_name=rng.choice(FIRST_NAMES),
+                last_name=rng.choice(LAST_NAMES),
+                email=f"seed_doctor_{number}@example.com",
+                licence_number=licence_number(number),
+                city=rng.choice(CITIES),
+                hospital=f"Hospital No. {rng.randint(1, 50)}",
+            )
+
+    for batch in batched(doctors(), batch_size):
+        created = Doctor.objects.bulk_create(batch)
+        Doctor.specialty.through.objects.bulk_create(
+            Doctor.specialty.through(
+                doctor_id=doctor.pk,
+                doctorspecialty_id=specialty_id,
+            )
+            for doctor in created
+            for specialty_id in rng.sample(specialty_ids, rng.randint(1, 2))
+        )
+        doctor_ids += [doctor.pk for doctor in created]
+    return doctor_ids
+
+
+def seed_schedule(doctor_ids, date_from: date, days: int,
+                  booked_ratio: float, rng: random.Random,
+                  batch_size: int = BATCH_SIZE) -> None:
+    insurance_number = Appointment.objects.count()
+
+    def slots():
+        for doctor_id in doctor_ids:
+            for day in range(days):
+                for timeslot, _ in DoctorSchedule.TIMESLOT_LIST:
+                    yield DoctorSchedule(
+                        doctor_id=doctor_id,
+                        date=date_from + timedelta(days=day),
+                        timeslot=timeslot,
+                        is_booked=rng.random() < booked_ratio,
+                    )
+
+    for batch in batched(slots(), batch_size):
+        created = DoctorSchedule.objects.bulk_create(batch)
+        appointments = []
+        for schedule in created:
+            if schedule.is_booked:
+                insurance_number += 1
+                appointments.append(Appointment(
+                    doctor_id=schedule.doctor_id,
+                    doctor_schedule_id=schedule.pk,
+                    first_name=rng.choice(FIRST_NAMES),
+                    last_name=rng.choice(LAST_NAMES),
+                    email=f"patient_{insurance_number}@example.com",
+                    phone="+380682222222",
+                    insurance_number=f"{insurance_number:010d}",
+                ))
+        Appointment.objects.bulk_create(appointments)
+        refresh_slots_availability(created)
+
+
+def seed(doctors: int, days: int, date_from: date = None,
+         booked_ratio: float = 0.3, random_seed: int = 0,
+         batch_size: int = BATCH_SIZE) -> None:
+    # Every slot of the period is published for every doctor, so the
+    # schedule table gets doctors * days * 8 rows.
+    rng = random.Random(random_seed)
+    doctor_ids = seed_doctors(doctors, rng, batch_size)
+    seed_schedule(
+        doctor_ids,
+        date_from or timezone.localdate(),
+        days,
+        booked_ratio,
+        rng,
+        batch_size
+    )
+    versions.invalidate("doctors", "specialties", "schedules")
+    counters.reconcile()
@@ -1,11 +1,13 @@
 from django.contrib.auth.forms import UserCreationForm
 from django import forms
 from django.core.exceptions import ValidationError
+from django.urls import reverse_lazy
 
 from doctors_service.models import (Doctor,
                                     DoctorSpecialty,
                                     Appointment,
-                                    DoctorSchedule)
+                                    DoctorSchedule,
+                                    WeeklySchedule)
 
 
 def validate_licence_number(licence_number):
@@ -75,8 +77,58 @@ class DoctorUpdateForm(forms.ModelForm):
         return validate_licence_number(self.cleaned_data["licence_number"])
 
 
+class DoctorPickerSelect(forms.Select):
+    # Renders only the selected doctor, the other options are loaded by
+    # the type-ahead of static/js/doctor_picker.js from the doctors API.
+
+    def __init__(self, attrs=None, empty_label="---------"):
+        attrs = {
+            "data-search-url": reverse_lazy(
+                "doctors_service:api-doctors-list"
+            ),
+            **(attrs or {}),
+        }
+        super().__init__(attrs)
+        self.empty_label = empty_label
+
+    def optgroups(self, name, value, attrs=None):
+        # A re-rendered bound form passes the raw submitted value.
+        selected = [pk for pk in value if str(pk).isdigit()]
+        options = [
+            self.create_option(name, "", self.empty_label, not selected, 0)
+        ]
+        doctors = self.choices.queryset.filter(pk__in=selected)
+        for index, doctor in enumerate(doctors, start=1):
+            options.append(self.create_option(
+                name, doctor.pk, str(doctor), True, index
+            ))
+        return [(None, options, 0)]
+
+
+class DoctorPickerField(forms.ModelChoiceField):
+    # Only the id is checked here, the doctor itself is loaded together
+    # with the chosen slot by AppointmentCreationForm.
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+
+
 class AppointmentCreationForm(forms.ModelForm):
 
+    doctor = DoctorPickerField(
+        queryset=Doctor.objects.all(),
+        widget=DoctorPickerSelect(),
+    )
+
     class Meta:
         model = Appointment
         fields = "__all__"
@@ -86,33 +138,108 @@ class AppointmentCreationForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields["doctor_schedule"].queryset = DoctorSchedule.objects.none()
-
+        # The slot is validated with one lookup on the free slots index:
+        # it has to belong to the chosen doctor, be free and not started.
+        field = self.fields["doctor_schedule"]
+        field.error_messages["invalid_choice"] = (
+            "This time is not available, please choose another one"
+        )
+        doctor_id = self.instance.doctor_id
         if "doctor" in self.data:
             try:
                 doctor_id = int(self.data.get("doctor"))
-                self.fields["doctor_schedule"].queryset = (
-                    DoctorSchedule.objects.filter(doctor_id=doctor_id)
-                )
             except (ValueError, TypeError):
-                pass
-        elif self.instance.pk:
-            self.fields["doctor_schedule"].queryset = (
-                self.instance.doctor.doctor_schedule_set
+                doctor_id = None
+        slots = DoctorSchedule.objects.available().filter(doctor_id=doctor_id)
+        if self.instance.pk:
+            slots |= DoctorSchedule.objects.filter(
+                pk=self.instance.doctor_schedule_id
             )
+        field.queryset = (
+            slots.select_related("doctor") if doctor_id
+            else DoctorSchedule.objects.none()
+        )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        doctor_schedule = cleaned_data.get("doctor_schedule")
+        if doctor_schedule:
+            cleaned_data["doctor"] = doctor_schedule.doctor
+        else:
+            cleaned_data.pop("doctor", None)
+        return cleaned_data
+
+    def _get_validation_exclusions(self):
+        # Both were loaded by the slot lookup, the model doesn't need to
+        # check again that they exist.
+        exclude = super()._get_validation_exclusions()
+        exclude.update({"doctor", "doctor_schedule"})
+        return exclude
+
+
+class DoctorScheduleGenerateForm(forms.Form):
+    MAX_DAYS = 366
+
+    date_from = forms.DateField(help_text="YYYY-MM-DD")
+    date_to = forms.DateField(help_text="YYYY-MM-DD")
+    weekdays = forms.TypedMultipleChoiceField(
+        choices=WeeklySchedule.WEEKDAY_LIST,
+        coerce=int,
+        widget=forms.CheckboxSelectMultiple(),
+    )
+    timeslots = forms.TypedMultipleChoiceField(
+        choices=DoctorSchedule.TIMESLOT_LIST,
+        coerce=int,
+        widget=forms.CheckboxSelectMultiple(),
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        date_from = cleaned_data.get("date_from")
+        date_to = cleaned_data.get("date_to")
+        if date_from and date_to:
+            if date_to < date_from:
+                raise ValidationError(
+                    "The end date should not be earlier than the start date"
+                )
+            if (date_to - date_from).days > self.MAX_DAYS:
+                raise ValidationError(
+                    f"The schedule can be generated for {self.MAX_DAYS} "
+                    f"days at most"
+                )
+        return cleaned_data
+
+    @property
+    def pattern(self):
+        return [
+            (weekday, timeslot)
+            for weekday in self.cleaned_data["weekdays"]
+            for timeslot in self.cleaned_data["timeslots"]
+        ]
 
 
 class DoctorSearchForm(forms.Form):
-    city = forms.CharField(
+    query = forms.CharField(
         max_length=255,
         required=False,
         label="",
         widget=forms.TextInput(
-            attrs={"placeholder": "Search by city"}
+            attrs={
+                "placeholder": "Search by name, city, hospital or specialty"
+            }
         )
     )
 
 
+class CitySearchForm(forms.Form):
+    city = forms.CharField(
+        max_length=255,
+        required=False,
+        label="",
+        widget=forms.TextInput(attrs={"placeholder": "Search by city"})
+    )
+
+
 class AppointmentSearchForm(forms.Form):
     date = forms.DateField(
         required=False,
@@ -121,3 +248,110 @@ class AppointmentSearchForm(forms.Form):
             attrs={"placeholder": "Search by date YYYY-MM-DD"}
         )
     )
+    date_from = forms.DateField(
+        required=False,
+        label="",
+        widget=forms.DateInput(
+            attrs={"placeholder": "From YYYY-MM-DD"}
+        )
+    )
+    date_to = forms.DateField(
+        required=False,
+        label="",
+        widget=forms.DateInput(
+            attrs={"placeholder": "To YYYY-MM-DD"}
+        )
+    )
+    doctor = DoctorPickerField(
+        queryset=Doctor.objects.all(),
+        required=False,
+        label="",
+        widget=DoctorPickerSelect(empty_label="All doctors"),
+    )
+
+    def filter_appointments(self, queryset):
+        return self.filter_by_slot(queryset, "doctor_schedule__date")
+
+    def filter_schedules(self, queryset):
+        return self.filter_by_slot(queryset, "date")
+
+    def filter_by_slot(self, queryset, date_field):
+        # Plain comparisons on the slot date, so the (date, timeslot)
+        # index of the schedule table can be used.
+        if not self.is_valid():
+            return queryset
+        filters = {
+            date_field: self.cleaned_data["date"],
+            f"{date_field}__gte": self.cleaned_data["date_from"],
+            f"{date_field}__lte": self.cleaned_data["date_to"],
+            "doctor": self.cleaned_data["doctor"],
+        }
+        return queryset.filter(**{
+            lookup: value
+            for lookup, value in filters.items()
+            if value is not None
+        })
+
+
+class AvailabilitySearchForm(forms.Form):
+    specialty = forms.ModelChoiceField(
+        queryset=DoctorSpecialty.objects.all(),
+        required=False,
+        label="",
+        empty_label="All specialties",
+    )
+    city = forms.CharField(
+        max_length=255,
+        required=False,
+        label="",
+        widget=forms.TextInput(attrs={"placeholder": "City"})
+    )
+    date_from = forms.DateField(
+        required=False,
+        label="",
+        widget=forms.DateInput(attrs={"placeholder": "From YYYY-MM-DD"})
+    )
+    date_to = forms.DateField(
+        required=False,
+        label="",
+        widget=forms.DateInput(attrs={"placeholder": "To YYYY-MM-DD"})
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        date_from = cleaned_data.get("date_from")
+        date_to = cleaned_data.get("date_to")
+        if date_from and date_to and date_to < date_from:
+            raise ValidationError(
+                "The end date should not be earlier than the start date"
+            )
+        return cleaned_data
+
+    def filter_slots(self, queryset):
+        if not self.is_valid():
+            return queryset.none()
+        filters = {
+            "doctor__specialty": self.cleaned_data["specialty"],
+            "date__gte": self.cleaned_data["date_from"],
+            "date__lte": self.cleaned_data["date_to"],
+        }
+        city = self.cleaned_data["city"].strip()
+        if city:
+            filters["doctor__city__icontains"] = city
+        return queryset.filter(**{
+            lookup: value
+            for lookup, value in filters.items()
+            if value is not None
+        })
+
+
+class DataImportForm(forms.Form):
+    import_name = forms.ChoiceField(
+        label="Data",
+        choices=(
+            ("specialties", "Specialties"),
+            ("doctors", "Doctors"),
+            ("slots", "Free slots"),
+        )
+    )
+    file = forms.FileField(help_text="CSV or JSON lines (.jsonl)")
@@ -0,0 +1,286 @@
+import csv
+import json
+from datetime import date
+
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+
+from doctors_service import counters, versions
+from doctors_service.availability import refresh_slots_availability
+from doctors_service.caching import invalidate_free_slots
+from doctors_service.factories import batched
+from doctors_service.forms import validate_licence_number
+from doctors_service.models import Doctor, DoctorSchedule, DoctorSpecialty
+
+BATCH_SIZE = 1000
+
+IMPORT_FORMATS = ("csv", "jsonl")
+
+DOCTOR_FIELDS = ("username", "first_name", "last_name", "email",
+                 "licence_number", "city", "hospital")
+
+# Several specialties of a doctor are separated by ";" in a CSV cell, a
+# JSON line may use a list instead.
+SPECIALTY_SEPARATOR = ";"
+
+
+class RowError(Exception):
+    pass
+
+
+def parse_line(line: str):
+    # Lines that can't be used are passed on as their error, which the
+    # import reports like any other invalid row.
+    try:
+        row = json.loads(line)
+    except ValueError:
+        return RowError("Invalid JSON")
+    if not isinstance(row, dict):
+        return RowError("Row should be a JSON object")
+    return row
+
+
+def read_rows(file, import_format: str):
+    # Yields (row number, row) pairs, the file is never loaded as a whole.
+    if import_format == "csv":
+        rows = csv.DictReader(file)
+    else:
+        rows = (parse_line(line) for line in file if line.strip())
+    return enumerate(rows, start=1)
+
+
+def checked(row) -> dict:
+    if isinstance(row, RowError):
+        raise row
+    return row
+
+
+def import_format_for(filename: str) -> str:
+    extension = filename.rsplit(".", 1)[-1].lower()
+    return extension if extension in IMPORT_FORMATS else "csv"
+
+
+def max_length(model, field: str) -> int:
+    return model._meta.get_field(field).max_length
+
+
+def required(row: dict, field: str, length: int = None) -> str:
+    value = str(row.get(field) or "").strip()
+    if not value:
+        raise RowError(f"{field} is required")
+    if length and len(value) > length:
+        raise RowError(f"{field} should be at most {length} characters")
+    return value
+
+
+def specialty_names(row: dict) -> list:
+    value = row.get("specialty") or []
+    if isinstance(value, str):
+        value = value.split(SPECIALTY_SEPARATOR)
+    if not isinstance(value, list) or not all(
+        isinstance(name, str) for name in value
+    ):
+        raise RowError("specialty should be a string or a list of strings")
+    names = [name.strip() for name in value if name.strip()]
+    length = max_length(DoctorSpecialty, "specialty")
+    if any(len(name) > length for name in names):
+        raise RowError(f"specialty should be at most {length} characters")
+    return names
+
+
+def specialty_ids(names) -> tuple:
+    # Returns name -> pk and the number of specialties that were missing
+    # and got created with one insert.
+    names = set(names)
+    existing = dict(
+        DoctorSpecialty.objects.filter(
+            specialty__in=names
+        ).values_list("specialty", "pk")
+    )
+    created = DoctorSpecialty.objects.bulk_create(
+        DoctorSpecialty(specialty=name)
+        for name in sorted(names - set(existing))
+    )
+    existing.update({specialty.specialty: specialty.pk
+                     for specialty in created})
+    return existing, len(created)
+
+
+def import_specialties(rows, batch_size: int = BATCH_SIZE) -> dict:
+    result = {"created": 0, "errors": []}
+    for batch in batched(rows, batch_size):
+        names = []
+        for number, row in batch:
+            try:
+                names.append(required(
+                    checked(row),
+                    "specialty",
+                    max_length(DoctorSpecialty, "specialty")
+                ))
+            except RowError as error:
+                result["errors"].append((number, str(error)))
+        result["created"] += specialty_ids(names)[1]
+    result["errors"].sort()
+    versions.invalidate("specialties")
+    counters.reconcile(["num_specialties"])
+    return result
+
+
+def clean_doctor(row: dict, password: str) -> Doctor:
+    doctor = Doctor(
+        password=password,
+        **{
+            field: required(row, field, max_length(Doctor, field))
+            for field in DOCTOR_FIELDS
+        }
+    )
+    try:
+        validate_licence_number(doctor.licence_number)
+        validate_email(doctor.email)
+    except ValidationError as error:
+        raise RowError(error.messages[0])
+    return doctor
+
+
+def import_doctors(rows, batch_size: int = BATCH_SIZE) -> dict:
+    # Replaces one DoctorCreateView submission per doctor: every batch is
+    # checked for duplicates with two queries and saved with three inserts.
+    # Imported doctors get an unusable password and set their own one
+    # through the password reset.
+    password = make_password(None)
+    seen_usernames = set()
+    seen_licences = set()
+    result = {"created": 0, "errors": []}
+
+    for batch in batched(rows, batch_size):
+        doctors = []
+        for number, row in batch:
+            try:
+                doctor = clean_doctor(checked(row), password)
+                names = specialty_names(row)
+                if not names:
+                    raise RowError("specialty is required")
+                if doctor.username in seen_usernames:
+                    raise RowError(f"Duplicate username {doctor.username}")
+                if doctor.licence_number in seen_licences:
+                    raise RowError(
+                        f"Duplicate licence number {doctor.licence_number}"
+                    )
+            except RowError as error:
+                result["errors"].append((number, str(error)))
+                continue
+            seen_usernames.add(doctor.username)
+            seen_licences.add(doctor.licence_number)
+            doctors.append((number, doctor, names))
+
+        taken_usernames = set(Doctor.objects.filter(
+            username__in=[doctor.username for _, doctor, _ in doctors]
+        ).values_list("username", flat=True))
+        taken_licences = set(Doctor.objects.filter(
+            licence_number__in=[
+                doctor.licence_number for _, doctor, _ in doctors
+            ]
+        ).values_list("licence_number", flat=True))
+        valid = []
+        for number, doctor, names in doctors:
+            if doctor.username in taken_usernames:
+                result["errors"].append(
+                    (number, f"Username {doctor.username} already exists")
+                )
+            elif doctor.licence_number in taken_licences:
+                result["errors"].append((
+                    number,
+                    f"Licence number {doctor.licence_number} already exists"
+                ))
+            else:
+                valid.append((doctor, names))
+
+        with transaction.atomic():
+            specialties, _ = specialty_ids(
+                name for _, names in valid for name in names
+            )
+            created = Doctor.objects.bulk_create(
+                doctor for doctor, _ in valid
+            )
+            Doctor.specialty.through.objects.bulk_create(
+                Doctor.specialty.through(
+                    doctor_id=doctor.pk,
+                    doctorspecialty_id=specialties[name],
+                )
+                for doctor, (_, names) in zip(created, valid)
+                for name in set(names)
+            )
+        result["created"] += len(created)
+
+    result["errors"].sort()
+    versions.invalidate("doctors", "specialties")
+    counters.reconcile(["num_doctors", "num_specialties"])
+    return result
+
+
+def clean_slot(row: dict) -> tuple:
+    try:
+        slot_date = date.fromisoformat(required(row, "date"))
+    except ValueError:
+        raise RowError("date should be YYYY-MM-DD")
+    try:
+        timeslot = int(required(row, "timeslot"))
+    except ValueError:
+        timeslot = None
+    if timeslot not in dict(DoctorSchedule.TIMESLOT_LIST):
+        raise RowError(
+            f"timeslot should be 0-{len(DoctorSchedule.TIMESLOT_LIST) - 1}"
+        )
+    return required(row, "licence_number"), slot_date, timeslot
+
+
+def import_slots(rows, batch_size: int = BATCH_SIZE) -> dict:
+    # Free slots, the doctor is referenced by the licence number. Slots
+    # that already exist are reported and left as they are.
+    result = {"created": 0, "errors": []}
+    for batch in batched(rows, batch_size):
+        slots = []
+        for number, row in batch:
+            try:
+                slots.append((number, *clean_slot(checked(row))))
+            except RowError as error:
+                result["errors"].append((number, str(error)))
+
+        doctor_ids = dict(Doctor.objects.filter(
+            licence_number__in={slot[1] for slot in slots}
+        ).values_list("licence_number", "pk"))
+        existing = set(DoctorSchedule.objects.filter(
+            doctor_id__in=doctor_ids.values(),
+            date__in={slot[2] for slot in slots},
+        ).values_list("doctor_id", "date", "timeslot"))
+        new_slots = []
+        for number, licence_number, slot_date, timeslot in slots:
+            doctor_id = doctor_ids.get(licence_number)
+            if doctor_id is None:
+                result["errors"].append(
+                    (number, f"Unknown licence number {licence_number}")
+                )
+            elif (doctor_id, slot_date, timeslot) in existing:
+                result["errors"].append((number, "Slot already exists"))
+            else:
+                existing.add((doctor_id, slot_date, timeslot))
+                new_slots.append(DoctorSchedule(
+                    doctor_id=doctor_id, date=slot_date, timeslot=timeslot
+                ))
+        result["created"] += len(
+            DoctorSchedule.objects.bulk_create(new_slots)
+        )
+        invalidate_free_slots(*{slot.doctor_id for slot in new_slots})
+        refresh_slots_availability(new_slots)
+    result["errors"].sort()
+    versions.invalidate("schedules")
+    return result
+
+
+IMPORTS = {
+    "specialties": import_specialties,
+    "doctors": import_doctors,
+    "slots": import_slots,
+}
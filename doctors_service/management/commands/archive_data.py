@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from doctors_service.archive import BATCH_SIZE, archive_past_records
+
+
+class Command(BaseCommand):
+    help = "Move old slots and their appointments to the archive tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.ARCHIVE_AFTER_DAYS,
+            help="Archive slots older than this many days"
+        )
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        result = archive_past_records(options["days"], options["batch_size"])
+        self.stdout.write(
+            f"Archived {result['slots']} slots and "
+            f"{result['appointments']} appointments"
+        )
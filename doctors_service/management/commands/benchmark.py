@@ -0,0 +1,48 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from doctors_service.benchmark import check_budget, run_benchmark
+
+
+class Command(BaseCommand):
+    help = ("Measure latency percentiles and SQL query counts of every "
+            "doctors_service route and print them as JSON")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument(
+            "--username",
+            help="Log in as this user, the first doctor by default"
+        )
+        parser.add_argument("--output", help="Write the JSON to this file")
+        parser.add_argument(
+            "--budget",
+            help="JSON file with per-route limits, e.g. "
+                 '{"doctors-list": {"queries": 2, "p95_ms": 50}}'
+        )
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.order_by("pk")
+        if options["username"]:
+            users = users.filter(username=options["username"])
+        user = users.first()
+        if user is None:
+            raise CommandError("There is no user to log in with")
+
+        results = run_benchmark(repeat=options["repeat"], user=user)
+        output = json.dumps(results, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                file.write(output)
+        else:
+            self.stdout.write(output)
+
+        if options["budget"]:
+            with open(options["budget"]) as file:
+                violations = check_budget(results, json.load(file))
+            if violations:
+                raise CommandError(
+                    "Performance budget exceeded:\n" + "\n".join(violations)
+                )
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from doctors_service.exports import (
+    CHUNK_SIZE,
+    EXPORT_FORMATS,
+    EXPORTS,
+    export_lines
+)
+from doctors_service.forms import AppointmentSearchForm
+
+
+class Command(BaseCommand):
+    help = "Stream appointments or schedule slots as CSV or JSON lines"
+
+    def add_arguments(self, parser):
+        parser.add_argument("export_name", choices=EXPORTS)
+        parser.add_argument(
+            "--format",
+            choices=EXPORT_FORMATS,
+            default="csv",
+            dest="export_format"
+        )
+        parser.add_argument("--date-from", help="YYYY-MM-DD")
+        parser.add_argument("--date-to", help="YYYY-MM-DD")
+        parser.add_argument("--doctor", type=int, help="Doctor id")
+        parser.add_argument("--output", help="Write to this file")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=CHUNK_SIZE,
+            help="How many rows are fetched from the database at a time"
+        )
+
+    def handle(self, *args, **options):
+        form = AppointmentSearchForm({
+            "date_from": options["date_from"],
+            "date_to": options["date_to"],
+            "doctor": options["doctor"],
+        })
+        if not form.is_valid():
+            raise CommandError(form.errors.as_text())
+
+        get_queryset, columns = EXPORTS[options["export_name"]]
+        lines = export_lines(
+            get_queryset(form),
+            columns,
+            options["export_format"],
+            options["chunk_size"]
+        )
+        if options["output"]:
+            with open(options["output"], "w", newline="") as file:
+                file.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
@@ -0,0 +1,37 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from doctors_service.scheduling import BATCH_SIZE, fill_horizon
+
+
+class Command(BaseCommand):
+    help = ("Create free slots from the doctors' weekly schedules for the "
+            "next days")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="How many days ahead the slots should be published"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="How many slots are inserted per query"
+        )
+
+    def handle(self, *args, **options):
+        date_from = timezone.localdate()
+        date_to = date_from + timedelta(days=options["days"])
+        doctors_count = fill_horizon(
+            date_from,
+            date_to,
+            batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            f"Schedules filled up to {date_to} for {doctors_count} doctors"
+        )
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from doctors_service.imports import (
+    BATCH_SIZE,
+    IMPORT_FORMATS,
+    IMPORTS,
+    import_format_for,
+    read_rows
+)
+
+
+class Command(BaseCommand):
+    help = ("Import specialties, doctors or free slots from a CSV or JSON "
+            "lines file, invalid rows are reported and skipped")
+
+    def add_arguments(self, parser):
+        parser.add_argument("import_name", choices=IMPORTS)
+        parser.add_argument("path")
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            dest="import_format",
+            help="Taken from the file extension by default"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="How many rows are validated and inserted at a time"
+        )
+
+    def handle(self, *args, **options):
+        import_format = (
+            options["import_format"] or import_format_for(options["path"])
+        )
+        with open(options["path"], newline="", encoding="utf-8-sig") as file:
+            result = IMPORTS[options["import_name"]](
+                read_rows(file, import_format),
+                batch_size=options["batch_size"]
+            )
+        for number, message in result["errors"]:
+            self.stderr.write(f"Row {number}: {message}")
+        self.stdout.write(
+            f"Created {result['created']} {options['import_name']}, "
+            f"skipped {len(result['errors'])} rows"
+        )
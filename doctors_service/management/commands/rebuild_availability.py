@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from doctors_service.availability import (
+    BATCH_SIZE,
+    rebuild_daily_availability
+)
+
+
+class Command(BaseCommand):
+    help = "Recalculate the daily availability masks from the schedule"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        created = rebuild_daily_availability(options["batch_size"])
+        self.stdout.write(f"{created} doctor days with free slots")
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from doctors_service import counters
+
+
+class Command(BaseCommand):
+    help = "Recalculate the cached dashboard counters from the database"
+
+    def handle(self, *args, **options):
+        for name, value in counters.reconcile().items():
+            self.stdout.write(f"{name}: {value}")
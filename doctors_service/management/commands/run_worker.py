@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from doctors_service.queue import ensure_scheduled, run_due_tasks
+
+
+class Command(BaseCommand):
+    help = "Run the tasks of the database queue as they become due"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run the tasks that are due now and exit"
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds to wait when no task is due"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="How many tasks are claimed at a time"
+        )
+
+    def handle(self, *args, **options):
+        ensure_scheduled("cleanup_past_slots")
+        ensure_scheduled("archive_past_records")
+        while True:
+            count = run_due_tasks(options["batch_size"])
+            if count:
+                self.stdout.write(f"Ran {count} tasks")
+            if options["once"]:
+                return
+            if not count:
+                time.sleep(options["interval"])
@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from doctors_service.factories import BATCH_SIZE, seed
+
+
+class Command(BaseCommand):
+    help = "Fill the database with generated doctors, slots and appointments"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--doctors", type=int, default=1000)
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="Every doctor gets all 8 slots of each of these days"
+        )
+        parser.add_argument(
+            "--history-days",
+            type=int,
+            default=180,
+            help="How many of the days lie in the past"
+        )
+        parser.add_argument("--booked-ratio", type=float, default=0.3)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        seed(
+            doctors=options["doctors"],
+            days=options["days"],
+            date_from=timezone.localdate() - timedelta(
+                days=options["history_days"]
+            ),
+            booked_ratio=options["booked_ratio"],
+            random_seed=options["seed"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(
+            f"Seeded {options['doctors']} doctors with "
+            f"{options['doctors'] * options['days'] * 8} slots"
+        )
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.11 on 2026-10-18 14:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("doctors_service", "0006_alter_appointment_insurance_number"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="doctorschedule",
+            index=models.Index(
+                condition=models.Q(("is_booked", False)),
+                fields=["doctor", "date", "timeslot"],
+                name="schedule_free_slots_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="doctorschedule",
+            index=models.Index(
+                fields=["date", "timeslot"], name="schedule_date_timeslot_idx"
+            ),
+        ),
+    ]
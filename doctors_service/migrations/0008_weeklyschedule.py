@@ -0,0 +1,70 @@
+# Generated by Django 4.2.11 on 2026-10-18 14:37
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("doctors_service", "0007_doctorschedule_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WeeklySchedule",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "weekday",
+                    models.IntegerField(
+                        choices=[
+                            (0, "Monday"),
+                            (1, "Tuesday"),
+                            (2, "Wednesday"),
+                            (3, "Thursday"),
+                            (4, "Friday"),
+                            (5, "Saturday"),
+                            (6, "Sunday"),
+                        ]
+                    ),
+                ),
+                (
+                    "timeslot",
+                    models.IntegerField(
+                        choices=[
+                            (0, "09:00 – 10:00"),
+                            (1, "10:00 – 11:00"),
+                            (2, "11:00 – 12:00"),
+                            (3, "12:00 – 13:00"),
+                            (4, "14:00 – 15:00"),
+                            (5, "15:00 – 16:00"),
+                            (6, "16:00 – 17:00"),
+                            (7, "17:00 – 18:00"),
+                        ]
+                    ),
+                ),
+                (
+                    "doctor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="weekly_schedule",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("weekday", "timeslot"),
+                "unique_together": {("doctor", "weekday", "timeslot")},
+            },
+        ),
+    ]
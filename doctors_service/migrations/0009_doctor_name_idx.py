@@ -0,0 +1,19 @@
+# Generated by Django 4.2.11 on 2026-10-18 14:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("doctors_service", "0008_weeklyschedule"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="doctor",
+            index=models.Index(
+                fields=["first_name", "last_name", "id"], name="doctor_name_idx"
+            ),
+        ),
+    ]
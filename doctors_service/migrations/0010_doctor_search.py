@@ -0,0 +1,223 @@
+from django.db import migrations
+
+SEARCH_TABLE = "doctors_service_doctor_search"
+DOCTOR_TABLE = "doctors_service_doctor"
+LINK_TABLE = "doctors_service_doctor_specialty"
+SPECIALTY_TABLE = "doctors_service_doctorspecialty"
+SEARCH_ROWID = f"{SEARCH_TABLE}.rowid"
+
+SPECIALTIES_OF = """
+    COALESCE((
+        SELECT group_concat(s.specialty, ' ')
+        FROM doctors_service_doctor_specialty t
+        JOIN doctors_service_doctorspecialty s
+            ON s.id = t.doctorspecialty_id
+        WHERE t.doctor_id = {doctor_id}
+    ), '')
+"""
+
+SQLITE_FORWARD = [
+    f"""
+    CREATE VIRTUAL TABLE {SEARCH_TABLE}
+    USING fts5(name, city, hospital, specialty)
+    """,
+    f"""
+    INSERT INTO {SEARCH_TABLE} (rowid, name, city, hospital, specialty)
+    SELECT d.id, d.first_name || ' ' || d.last_name, d.city, d.hospital,
+        {SPECIALTIES_OF.format(doctor_id="d.id")}
+    FROM doctors_service_doctor d
+    """,
+    f"""
+    CREATE TRIGGER doctor_search_insert
+    AFTER INSERT ON doctors_service_doctor BEGIN
+        INSERT INTO {SEARCH_TABLE} (rowid, name, city, hospital, specialty)
+        VALUES (new.id, new.first_name || ' ' || new.last_name, new.city,
+            new.hospital, '');
+    END
+    """,
+    f"""
+    CREATE TRIGGER doctor_search_update
+    AFTER UPDATE OF first_name, last_name, city, hospital
+    ON doctors_service_doctor BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET name = new.first_name || ' ' || new.last_name,
+            city = new.city,
+            hospital = new.hospital
+        WHERE rowid = new.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER doctor_search_delete
+    AFTER DELETE ON doctors_service_doctor BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER doctor_search_specialty_insert
+    AFTER INSERT ON doctors_service_doctor_specialty BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET specialty = {SPECIALTIES_OF.format(doctor_id="new.doctor_id")}
+        WHERE rowid = new.doctor_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER doctor_search_specialty_delete
+    AFTER DELETE ON doctors_service_doctor_specialty BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET specialty = {SPECIALTIES_OF.format(doctor_id="old.doctor_id")}
+        WHERE rowid = old.doctor_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER doctor_search_specialty_rename
+    AFTER UPDATE OF specialty ON doctors_service_doctorspecialty BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET specialty = {SPECIALTIES_OF.format(doctor_id=SEARCH_ROWID)}
+        WHERE rowid IN (
+            SELECT doctor_id FROM doctors_service_doctor_specialty
+            WHERE doctorspecialty_id = new.id
+        );
+    END
+    """,
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER doctor_search_insert",
+    "DROP TRIGGER doctor_search_update",
+    "DROP TRIGGER doctor_search_delete",
+    "DROP TRIGGER doctor_search_specialty_insert",
+    "DROP TRIGGER doctor_search_specialty_delete",
+    "DROP TRIGGER doctor_search_specialty_rename",
+    f"DROP TABLE {SEARCH_TABLE}",
+]
+
+# The PostgreSQL counterpart of the FTS5 table: one document per doctor
+# with name, city, hospital and specialties, kept in sync by triggers and
+# searched word by word through one trigram index.
+POSTGRESQL_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"""
+    CREATE TABLE {SEARCH_TABLE} (
+        doctor_id bigint PRIMARY KEY
+            REFERENCES {DOCTOR_TABLE} (id) ON DELETE CASCADE,
+        document text NOT NULL
+    )
+    """,
+    f"""
+    CREATE FUNCTION doctor_search_document(doctor bigint) RETURNS text AS $$
+        SELECT d.first_name || ' ' || d.last_name || ' ' || d.city || ' '
+            || d.hospital || ' ' || COALESCE((
+                SELECT string_agg(s.specialty, ' ')
+                FROM {LINK_TABLE} t
+                JOIN {SPECIALTY_TABLE} s ON s.id = t.doctorspecialty_id
+                WHERE t.doctor_id = d.id
+            ), '')
+        FROM {DOCTOR_TABLE} d
+        WHERE d.id = doctor
+    $$ LANGUAGE sql STABLE
+    """,
+    f"""
+    INSERT INTO {SEARCH_TABLE} (doctor_id, document)
+    SELECT id, doctor_search_document(id) FROM {DOCTOR_TABLE}
+    """,
+    f"""
+    CREATE INDEX doctor_search_document_trgm_idx
+    ON {SEARCH_TABLE} USING gin (document gin_trgm_ops)
+    """,
+    f"""
+    CREATE FUNCTION doctor_search_doctor_changed() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO {SEARCH_TABLE} (doctor_id, document)
+        VALUES (NEW.id, doctor_search_document(NEW.id))
+        ON CONFLICT (doctor_id) DO UPDATE SET document = EXCLUDED.document;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    f"""
+    CREATE TRIGGER doctor_search_doctor
+    AFTER INSERT OR UPDATE OF first_name, last_name, city, hospital
+    ON {DOCTOR_TABLE}
+    FOR EACH ROW EXECUTE FUNCTION doctor_search_doctor_changed()
+    """,
+    f"""
+    CREATE FUNCTION doctor_search_link_changed() RETURNS trigger AS $$
+    DECLARE
+        doctor bigint;
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            doctor := OLD.doctor_id;
+        ELSE
+            doctor := NEW.doctor_id;
+        END IF;
+        UPDATE {SEARCH_TABLE}
+        SET document = doctor_search_document(doctor)
+        WHERE doctor_id = doctor;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    f"""
+    CREATE TRIGGER doctor_search_link
+    AFTER INSERT OR DELETE ON {LINK_TABLE}
+    FOR EACH ROW EXECUTE FUNCTION doctor_search_link_changed()
+    """,
+    f"""
+    CREATE FUNCTION doctor_search_specialty_renamed() RETURNS trigger AS $$
+    BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET document = doctor_search_document(doctor_id)
+        WHERE doctor_id IN (
+            SELECT doctor_id FROM {LINK_TABLE}
+            WHERE doctorspecialty_id = NEW.id
+        );
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    f"""
+    CREATE TRIGGER doctor_search_specialty
+    AFTER UPDATE OF specialty ON {SPECIALTY_TABLE}
+    FOR EACH ROW EXECUTE FUNCTION doctor_search_specialty_renamed()
+    """,
+]
+
+POSTGRESQL_BACKWARD = [
+    f"DROP TRIGGER doctor_search_specialty ON {SPECIALTY_TABLE}",
+    f"DROP TRIGGER doctor_search_link ON {LINK_TABLE}",
+    f"DROP TRIGGER doctor_search_doctor ON {DOCTOR_TABLE}",
+    "DROP FUNCTION doctor_search_specialty_renamed()",
+    "DROP FUNCTION doctor_search_link_changed()",
+    "DROP FUNCTION doctor_search_doctor_changed()",
+    f"DROP TABLE {SEARCH_TABLE}",
+    "DROP FUNCTION doctor_search_document(bigint)",
+]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        for sql in statements.get(vendor, ()):
+            schema_editor.execute(sql)
+
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("doctors_service", "0009_doctor_name_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run({
+                "sqlite": SQLITE_FORWARD,
+                "postgresql": POSTGRESQL_FORWARD,
+            }),
+            run({
+                "sqlite": SQLITE_BACKWARD,
+                "postgresql": POSTGRESQL_BACKWARD,
+            }),
+        ),
+    ]
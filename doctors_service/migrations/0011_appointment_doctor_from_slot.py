@@ -0,0 +1,114 @@
+from django.db import migrations
+from django.db.models import F, OuterRef, Subquery
+
+APPOINTMENT_TABLE = "doctors_service_appointment"
+SCHEDULE_TABLE = "doctors_service_doctorschedule"
+
+SLOT_DOCTOR = f"""
+    (SELECT doctor_id FROM {SCHEDULE_TABLE}
+     WHERE id = new.doctor_schedule_id)
+"""
+
+SQLITE_FORWARD = [
+    f"""
+    CREATE TRIGGER appointment_doctor_insert
+    BEFORE INSERT ON {APPOINTMENT_TABLE}
+    WHEN new.doctor_id IS NOT {SLOT_DOCTOR} BEGIN
+        SELECT RAISE(ABORT, 'appointment doctor differs from slot doctor');
+    END
+    """,
+    f"""
+    CREATE TRIGGER appointment_doctor_update
+    BEFORE UPDATE OF doctor_id, doctor_schedule_id ON {APPOINTMENT_TABLE}
+    WHEN new.doctor_id IS NOT {SLOT_DOCTOR} BEGIN
+        SELECT RAISE(ABORT, 'appointment doctor differs from slot doctor');
+    END
+    """,
+    f"""
+    CREATE TRIGGER schedule_doctor_update
+    AFTER UPDATE OF doctor_id ON {SCHEDULE_TABLE} BEGIN
+        UPDATE {APPOINTMENT_TABLE} SET doctor_id = new.doctor_id
+        WHERE doctor_schedule_id = new.id;
+    END
+    """,
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER appointment_doctor_insert",
+    "DROP TRIGGER appointment_doctor_update",
+    "DROP TRIGGER schedule_doctor_update",
+]
+
+# The pair (slot, doctor) of an appointment has to exist in the schedule,
+# moving a slot to another doctor carries its appointments along.
+POSTGRESQL_FORWARD = [
+    f"""
+    ALTER TABLE {SCHEDULE_TABLE}
+    ADD CONSTRAINT schedule_id_doctor_uniq UNIQUE (id, doctor_id)
+    """,
+    f"""
+    ALTER TABLE {APPOINTMENT_TABLE}
+    ADD CONSTRAINT appointment_slot_doctor_fk
+    FOREIGN KEY (doctor_schedule_id, doctor_id)
+    REFERENCES {SCHEDULE_TABLE} (id, doctor_id) ON UPDATE CASCADE
+    """,
+]
+
+POSTGRESQL_BACKWARD = [
+    f"""
+    ALTER TABLE {APPOINTMENT_TABLE}
+    DROP CONSTRAINT appointment_slot_doctor_fk
+    """,
+    f"""
+    ALTER TABLE {SCHEDULE_TABLE}
+    DROP CONSTRAINT schedule_id_doctor_uniq
+    """,
+]
+
+
+def backfill(apps, schema_editor):
+    Appointment = apps.get_model("doctors_service", "Appointment")
+    DoctorSchedule = apps.get_model("doctors_service", "DoctorSchedule")
+    mismatched = Appointment.objects.exclude(
+        doctor_id=F("doctor_schedule__doctor_id")
+    )
+    mismatched.update(doctor_id=Subquery(
+        DoctorSchedule.objects.filter(
+            pk=OuterRef("doctor_schedule_id")
+        ).values("doctor_id")[:1]
+    ))
+    if mismatched.exists():
+        raise RuntimeError(
+            "Some appointments still have a doctor different from the "
+            "doctor of their slot"
+        )
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        for sql in statements.get(vendor, ()):
+            schema_editor.execute(sql)
+
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("doctors_service", "0010_doctor_search"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+        migrations.RunPython(
+            run({
+                "sqlite": SQLITE_FORWARD,
+                "postgresql": POSTGRESQL_FORWARD,
+            }),
+            run({
+                "sqlite": SQLITE_BACKWARD,
+                "postgresql": POSTGRESQL_BACKWARD,
+            }),
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 4.2.11 on 2026-10-18 15:03
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+BATCH_SIZE = 1000
+
+
+def build_daily_availability(apps, schema_editor):
+    DoctorSchedule = apps.get_model("doctors_service", "DoctorSchedule")
+    DailyAvailability = apps.get_model("doctors_service", "DailyAvailability")
+    rows = DoctorSchedule.objects.filter(is_booked=False).order_by(
+        "doctor_id", "date"
+    ).values_list("doctor_id", "date", "timeslot").iterator(
+        chunk_size=BATCH_SIZE
+    )
+    masks = {}
+    for doctor_id, day, timeslot in rows:
+        if (doctor_id, day) not in masks and len(masks) >= BATCH_SIZE:
+            DailyAvailability.objects.bulk_create(
+                DailyAvailability(doctor_id=key[0], date=key[1],
+                                  free_slots=mask)
+                for key, mask in masks.items()
+            )
+            masks = {}
+        masks[doctor_id, day] = masks.get((doctor_id, day), 0) | 1 << timeslot
+    DailyAvailability.objects.bulk_create(
+        DailyAvailability(doctor_id=key[0], date=key[1], free_slots=mask)
+        for key, mask in masks.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("doctors_service", "0012_task"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyAvailability",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("free_slots", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "doctor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_availability",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "daily availability",
+                "ordering": ("date",),
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("free_slots__gt", 0)),
+                        fields=["date"],
+                        name="availability_free_date_idx",
+                    )
+                ],
+                "unique_together": {("doctor", "date")},
+            },
+        ),
+        migrations.RunPython(
+            build_daily_availability,
+            migrations.RunPython.noop
+        ),
+    ]
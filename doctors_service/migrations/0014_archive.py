@@ -0,0 +1,95 @@
+# Generated by Django 4.2.11 on 2026-10-18 15:06
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import phonenumber_field.modelfields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("doctors_service", "0013_dailyavailability"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedDoctorSchedule",
+            fields=[
+                (
+                    "id",
+                    models.BigIntegerField(primary_key=True, serialize=False),
+                ),
+                ("date", models.DateField()),
+                (
+                    "timeslot",
+                    models.IntegerField(
+                        choices=[
+                            (0, "09:00 – 10:00"),
+                            (1, "10:00 – 11:00"),
+                            (2, "11:00 – 12:00"),
+                            (3, "12:00 – 13:00"),
+                            (4, "14:00 – 15:00"),
+                            (5, "15:00 – 16:00"),
+                            (6, "16:00 – 17:00"),
+                            (7, "17:00 – 18:00"),
+                        ]
+                    ),
+                ),
+                ("is_booked", models.BooleanField(default=False)),
+                (
+                    "doctor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_schedule",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("date", "timeslot"),
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedAppointment",
+            fields=[
+                (
+                    "id",
+                    models.BigIntegerField(primary_key=True, serialize=False),
+                ),
+                ("first_name", models.CharField(max_length=255)),
+                ("last_name", models.CharField(max_length=255)),
+                ("email", models.EmailField(max_length=255)),
+                (
+                    "phone",
+                    phonenumber_field.modelfields.PhoneNumberField(
+                        max_length=128, region=None
+                    ),
+                ),
+                (
+                    "insurance_number",
+                    models.CharField(db_index=True, max_length=10),
+                ),
+                ("comments", models.TextField(blank=True)),
+                (
+                    "doctor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_appointments",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "doctor_schedule",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="appointments",
+                        to="doctors_service.archiveddoctorschedule",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("doctor_schedule",),
+            },
+        ),
+    ]
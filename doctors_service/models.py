@@ -1,7 +1,10 @@
+from datetime import datetime, time
+
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils import timezone
 from phonenumber_field.modelfields import PhoneNumberField
-from doctors_patients_service import settings
 
 
 class DoctorSpecialty(models.Model):
@@ -25,11 +28,33 @@ class Doctor(AbstractUser):
 
     class Meta:
         ordering = ("first_name", "last_name", )
+        indexes = [
+            models.Index(
+                fields=("first_name", "last_name", "id", ),
+                name="doctor_name_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
 
+class DoctorScheduleQuerySet(models.QuerySet):
+
+    def available(self):
+        # Free slots that haven't started yet. Today's started slots are
+        # excluded separately so "date >= today" stays an index range.
+        now = timezone.localtime()
+        available = self.filter(is_booked=False, date__gte=now.date())
+        started = DoctorSchedule.started_timeslots(now.time())
+        if started:
+            available = available.exclude(
+                date=now.date(),
+                timeslot__in=started
+            )
+        return available
+
+
 class DoctorSchedule(models.Model):
 
     TIMESLOT_LIST = (
@@ -51,18 +76,128 @@ class DoctorSchedule(models.Model):
     timeslot = models.IntegerField(choices=TIMESLOT_LIST)
     is_booked = models.BooleanField(default=False)
 
+    objects = DoctorScheduleQuerySet.as_manager()
+
     class Meta:
         unique_together = ("doctor", "date", "timeslot", )
         ordering = ("date", "timeslot",)
+        indexes = [
+            models.Index(
+                fields=("doctor", "date", "timeslot", ),
+                condition=models.Q(is_booked=False),
+                name="schedule_free_slots_idx",
+            ),
+            models.Index(
+                fields=("date", "timeslot", ),
+                name="schedule_date_timeslot_idx",
+            ),
+        ]
+
+    @classmethod
+    def started_timeslots(cls, now: time) -> list:
+        return [
+            timeslot
+            for timeslot, label in cls.TIMESLOT_LIST
+            if time.fromisoformat(label[:5]) <= now
+        ]
 
     @property
     def time(self):
         return self.TIMESLOT_LIST[self.timeslot][1]
 
+    @property
+    def starts_at(self) -> datetime:
+        start = time.fromisoformat(self.time[:5])
+        return timezone.make_aware(datetime.combine(self.date, start))
+
     def __str__(self):
         return f"{self.date} / {self.time}"
 
 
+class WeeklySchedule(models.Model):
+
+    WEEKDAY_LIST = (
+        (0, "Monday"),
+        (1, "Tuesday"),
+        (2, "Wednesday"),
+        (3, "Thursday"),
+        (4, "Friday"),
+        (5, "Saturday"),
+        (6, "Sunday"),
+    )
+    doctor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="weekly_schedule",
+    )
+    weekday = models.IntegerField(choices=WEEKDAY_LIST)
+    timeslot = models.IntegerField(choices=DoctorSchedule.TIMESLOT_LIST)
+
+    class Meta:
+        unique_together = ("doctor", "weekday", "timeslot", )
+        ordering = ("weekday", "timeslot",)
+
+    def __str__(self):
+        return (f"{self.WEEKDAY_LIST[self.weekday][1]} / "
+                f"{DoctorSchedule.TIMESLOT_LIST[self.timeslot][1]}")
+
+
+class DailyAvailabilityQuerySet(models.QuerySet):
+
+    def available(self):
+        # Days with a free slot that hasn't started yet. Timeslots follow
+        # the time of day, so today's started ones are the low bits and a
+        # later free slot means the mask is at least 1 << len(started).
+        now = timezone.localtime()
+        available = self.filter(free_slots__gt=0, date__gte=now.date())
+        started = DoctorSchedule.started_timeslots(now.time())
+        if started:
+            available = available.exclude(
+                date=now.date(),
+                free_slots__lt=1 << len(started)
+            )
+        return available
+
+
+class DailyAvailability(models.Model):
+    # One row per doctor and day: bit N of free_slots is set while timeslot
+    # N is published and not booked. Kept in sync with DoctorSchedule by
+    # doctors_service.availability. Only the next free day reads use it:
+    # pages that list bookable slots need their ids from DoctorSchedule.
+    doctor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="daily_availability",
+    )
+    date = models.DateField()
+    free_slots = models.PositiveSmallIntegerField(default=0)
+
+    objects = DailyAvailabilityQuerySet.as_manager()
+
+    class Meta:
+        unique_together = ("doctor", "date", )
+        ordering = ("date",)
+        verbose_name_plural = "daily availability"
+        indexes = [
+            models.Index(
+                fields=("date", ),
+                condition=models.Q(free_slots__gt=0),
+                name="availability_free_date_idx",
+            ),
+        ]
+
+    @property
+    def timeslots(self) -> list:
+        return [
+            timeslot
+            for timeslot, _ in DoctorSchedule.TIMESLOT_LIST
+            if self.free_slots >> timeslot & 1
+        ]
+
+    def __str__(self):
+        return f"{self.date} / {self.free_slots:08b}"
+
+
 class Appointment(models.Model):
     doctor = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -84,6 +219,97 @@ class Appointment(models.Model):
     class Meta:
         ordering = ("doctor_schedule",)
 
+    def save(self, *args, **kwargs):
+        # The doctor is a copy of the slot's one, kept so appointments can
+        # be filtered by doctor without joining the schedule. The database
+        # rejects a mismatch (migration 0011).
+        self.doctor_id = self.doctor_schedule.doctor_id
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return (f"patient {self.first_name} {self.last_name} has a visit - "
                 f"{self.doctor_schedule}")
+
+
+class ArchivedDoctorSchedule(models.Model):
+    # Slots moved out of DoctorSchedule by doctors_service.archive, under
+    # their original ids.
+    id = models.BigIntegerField(primary_key=True)
+    doctor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_schedule",
+    )
+    date = models.DateField()
+    timeslot = models.IntegerField(choices=DoctorSchedule.TIMESLOT_LIST)
+    is_booked = models.BooleanField(default=False)
+
+    class Meta:
+        ordering = ("date", "timeslot",)
+
+    def __str__(self):
+        return f"{self.date} / {self.get_timeslot_display()}"
+
+
+class ArchivedAppointment(models.Model):
+    # Appointments of archived slots. The insurance number is only indexed:
+    # uniqueness is enforced on the live table.
+    id = models.BigIntegerField(primary_key=True)
+    doctor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_appointments",
+    )
+    doctor_schedule = models.ForeignKey(
+        ArchivedDoctorSchedule,
+        on_delete=models.CASCADE,
+        related_name="appointments",
+    )
+    first_name = models.CharField(max_length=255)
+    last_name = models.CharField(max_length=255)
+    email = models.EmailField(max_length=255)
+    phone = PhoneNumberField()
+    insurance_number = models.CharField(max_length=10, db_index=True)
+    comments = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ("doctor_schedule",)
+
+    def __str__(self):
+        return (f"patient {self.first_name} {self.last_name} had a visit - "
+                f"{self.doctor_schedule}")
+
+
+class Task(models.Model):
+
+    STATUS_LIST = (
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    )
+    name = models.CharField(max_length=255)
+    kwargs = models.JSONField(default=dict)
+    run_at = models.DateTimeField(default=timezone.now)
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_LIST,
+        default="pending"
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("run_at",)
+        indexes = [
+            models.Index(
+                fields=("run_at", ),
+                condition=models.Q(status="pending"),
+                name="task_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} / {self.status}"
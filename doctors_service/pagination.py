@@ -0,0 +1,146 @@
+import base64
+import json
+from collections.abc import Sequence
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import Http404
+
+MIN_INT = -2 ** 63
+MAX_INT = 2 ** 63 - 1
+
+
+def encode_cursor(values) -> str:
+    data = json.dumps(list(values), cls=DjangoJSONEncoder)
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    # Only the scalars encode_cursor writes, anything else would reach the
+    # ORM lookups. Integers have to fit a 64-bit column.
+    if not isinstance(values, list) or not all(
+        isinstance(value, (str, int, float))
+        and not (isinstance(value, int) and not MIN_INT <= value <= MAX_INT)
+        for value in values
+    ):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def keyset_filter(ordering, values) -> Q:
+    # (a, b, pk) > (x, y, z) spelled out as
+    # a > x OR (a = x AND b > y) OR (a = x AND b = y AND pk > z),
+    # with the comparison flipped for descending keys.
+    if len(ordering) != len(values):
+        raise ValueError("Invalid cursor")
+    condition = Q()
+    equal = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        condition |= equal & Q(**{f"{name}__{lookup}": value})
+        equal &= Q(**{name: value})
+    return condition
+
+
+def resolve_value(obj, field: str):
+    for name in field.lstrip("-").split("__"):
+        obj = getattr(obj, name)
+    return obj
+
+
+def reverse_ordering(ordering) -> tuple:
+    return tuple(
+        field[1:] if field.startswith("-") else f"-{field}"
+        for field in ordering
+    )
+
+
+class KeysetPage(Sequence):
+    is_keyset = True
+
+    def __init__(self, object_list, ordering, has_next, has_previous):
+        self.object_list = object_list
+        self.ordering = ordering
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def cursor(self, obj) -> str:
+        return encode_cursor(
+            resolve_value(obj, field) for field in self.ordering
+        )
+
+    @property
+    def next_cursor(self):
+        if self.has_next() and self.object_list:
+            return self.cursor(self.object_list[-1])
+
+    @property
+    def previous_cursor(self):
+        if self.has_previous() and self.object_list:
+            return self.cursor(self.object_list[0])
+
+
+class KeysetPaginationMixin:
+    # Seek pagination for ListView: pages are addressed by the ordering
+    # values of their first/last row ("?after=" / "?before=") instead of an
+    # OFFSET, so no COUNT(*) is needed and every page costs the same.
+    keyset_ordering = None
+
+    def get_keyset_ordering(self):
+        return self.keyset_ordering
+
+    def paginate_queryset(self, queryset, page_size):
+        ordering = self.get_keyset_ordering()
+        after = self.request.GET.get("after")
+        before = self.request.GET.get("before")
+        try:
+            if before:
+                queryset = queryset.filter(keyset_filter(
+                    reverse_ordering(ordering),
+                    decode_cursor(before)
+                )).order_by(*reverse_ordering(ordering))
+            else:
+                if after:
+                    queryset = queryset.filter(
+                        keyset_filter(ordering, decode_cursor(after))
+                    )
+                queryset = queryset.order_by(*ordering)
+            object_list = list(queryset[:page_size + 1])
+        except (ValueError, OverflowError, ValidationError):
+            raise Http404("Invalid page cursor")
+
+        has_more = len(object_list) > page_size
+        object_list = object_list[:page_size]
+        if before:
+            object_list.reverse()
+            page = KeysetPage(
+                object_list, ordering, bool(object_list), has_more
+            )
+        else:
+            # A cursor past the last row (rows deleted meanwhile) gives an
+            # empty page without a way back from it.
+            page = KeysetPage(
+                object_list, ordering, has_more, bool(after and object_list)
+            )
+        return None, page, page.object_list, page.has_other_pages()
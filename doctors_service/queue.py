@@ -0,0 +1,140 @@
+import traceback
+from datetime import timedelta
+from functools import lru_cache, partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from doctors_service.models import Task
+
+TASKS = {}
+
+MAX_ATTEMPTS = 5
+
+RETRY_DELAY = timedelta(minutes=1)
+
+# A task still "running" after this long belongs to a worker that died.
+LEASE_TIMEOUT = timedelta(hours=1)
+
+
+def register(func):
+    TASKS[func.__name__] = func
+    return func
+
+
+class BaseBackend:
+    # A backend only has to deliver (name, kwargs) to a worker that calls
+    # run_task(name, kwargs) not before run_at.
+
+    def enqueue(self, name: str, kwargs: dict, run_at=None) -> None:
+        raise NotImplementedError
+
+
+class ImmediateBackend(BaseBackend):
+    # Runs the task in the calling process, meant for tests and debugging.
+
+    def enqueue(self, name, kwargs, run_at=None):
+        run_task(name, kwargs)
+
+
+class DatabaseBackend(BaseBackend):
+    # Tasks are rows of the Task table, executed by the run_worker command.
+
+    def enqueue(self, name, kwargs, run_at=None):
+        Task.objects.create(
+            name=name,
+            kwargs=kwargs,
+            run_at=run_at or timezone.now()
+        )
+
+
+@lru_cache
+def get_backend() -> BaseBackend:
+    return import_string(settings.TASK_QUEUE_BACKEND)()
+
+
+def enqueue(name: str, run_at=None, **kwargs) -> None:
+    # Sent once the surrounding transaction commits, so workers never see
+    # a task about rows they can't read yet or that were rolled back.
+    if name not in TASKS:
+        raise KeyError(f"Unknown task {name}")
+    transaction.on_commit(
+        partial(get_backend().enqueue, name, kwargs, run_at)
+    )
+
+
+def run_task(name: str, kwargs: dict) -> None:
+    TASKS[name](**kwargs)
+
+
+def release_stale_tasks() -> int:
+    # Tasks of a worker killed mid-batch go back to the queue, their
+    # interrupted run counts as a failed attempt.
+    stale = Task.objects.filter(
+        status="running",
+        started_at__lt=timezone.now() - LEASE_TIMEOUT
+    )
+    error = "The worker running the task stopped"
+    failed = stale.filter(attempts__gte=MAX_ATTEMPTS - 1).update(
+        status="failed",
+        attempts=F("attempts") + 1,
+        last_error=error,
+    )
+    return failed + stale.update(
+        status="pending",
+        attempts=F("attempts") + 1,
+        last_error=error,
+    )
+
+
+def claim_due_tasks(limit: int) -> list:
+    # Every task is claimed with a conditional UPDATE, so several workers
+    # can poll the same table without running a task twice.
+    release_stale_tasks()
+    candidates = Task.objects.filter(
+        status="pending",
+        run_at__lte=timezone.now()
+    ).values_list("pk", flat=True)[:limit]
+    claimed = []
+    for pk in candidates:
+        if Task.objects.filter(pk=pk, status="pending").update(
+            status="running",
+            started_at=timezone.now()
+        ):
+            claimed.append(pk)
+    return list(Task.objects.filter(pk__in=claimed))
+
+
+def execute(task: Task) -> None:
+    task.attempts += 1
+    try:
+        run_task(task.name, task.kwargs)
+    except Exception:
+        task.last_error = traceback.format_exc()
+        if task.attempts < MAX_ATTEMPTS:
+            task.status = "pending"
+            task.run_at = timezone.now() + RETRY_DELAY * 2 ** task.attempts
+        else:
+            task.status = "failed"
+    else:
+        task.status = "done"
+    task.save(update_fields=("status", "attempts", "last_error", "run_at"))
+
+
+def run_due_tasks(limit: int = 100) -> int:
+    tasks = claim_due_tasks(limit)
+    for task in tasks:
+        execute(task)
+    return len(tasks)
+
+
+def ensure_scheduled(name: str, **kwargs) -> None:
+    # For the database backend only: periodic tasks re-enqueue themselves,
+    # this starts the chain when none is pending.
+    release_stale_tasks()
+    if not Task.objects.filter(name=name, status__in=("pending", "running")
+                               ).exists():
+        Task.objects.create(name=name, kwargs=kwargs)
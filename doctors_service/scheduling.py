@@ -0,0 +1,65 @@
+from datetime import date, timedelta
+from itertools import groupby, islice
+
+
+from doctors_service import versions
+from doctors_service.availability import refresh_slots_availability
+from doctors_service.caching import invalidate_free_slots
+from doctors_service.models import DoctorSchedule, WeeklySchedule
+
+BATCH_SIZE = 1000
+
+
+def iter_slots(doctor_id, date_from: date, date_to: date, pattern):
+    timeslots = {}
+    for weekday, timeslot in pattern:
+        timeslots.setdefault(weekday, []).append(timeslot)
+
+    day = date_from
+    while day <= date_to:
+        for timeslot in sorted(timeslots.get(day.weekday(), ())):
+            yield DoctorSchedule(doctor_id=doctor_id, date=day,
+                                 timeslot=timeslot)
+        day += timedelta(days=1)
+
+
+def save_slots(slots, batch_size: int = BATCH_SIZE) -> None:
+    # Slots that already exist hit the (doctor, date, timeslot) unique
+    # constraint and are skipped, so filling the same range twice is safe.
+    slots = iter(slots)
+    while batch := list(islice(slots, batch_size)):
+        DoctorSchedule.objects.bulk_create(batch, ignore_conflicts=True)
+        invalidate_free_slots(*{slot.doctor_id for slot in batch})
+        refresh_slots_availability(batch)
+    versions.invalidate("schedules")
+
+
+def set_weekly_schedule(doctor_id, pattern) -> None:
+    WeeklySchedule.objects.filter(doctor_id=doctor_id).delete()
+    WeeklySchedule.objects.bulk_create(
+        WeeklySchedule(doctor_id=doctor_id, weekday=weekday, timeslot=timeslot)
+        for weekday, timeslot in pattern
+    )
+
+
+def generate_schedule(doctor_id, date_from: date, date_to: date, pattern,
+                      batch_size: int = BATCH_SIZE) -> None:
+    save_slots(iter_slots(doctor_id, date_from, date_to, pattern), batch_size)
+
+
+def fill_horizon(date_from: date, date_to: date,
+                 batch_size: int = BATCH_SIZE) -> int:
+    patterns = WeeklySchedule.objects.order_by("doctor_id").values_list(
+        "doctor_id", "weekday", "timeslot"
+    ).iterator(chunk_size=batch_size)
+    doctors_count = 0
+
+    def slots():
+        nonlocal doctors_count
+        for doctor_id, rows in groupby(patterns, key=lambda row: row[0]):
+            doctors_count += 1
+            pattern = [(weekday, timeslot) for _, weekday, timeslot in rows]
+            yield from iter_slots(doctor_id, date_from, date_to, pattern)
+
+    save_slots(slots(), batch_size)
+    return doctors_count
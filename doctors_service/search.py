@@ -0,0 +1,59 @@
+import re
+
+from django.db import connection
+from django.db.models import QuerySet
+from django.db.models.expressions import RawSQL
+
+SEARCH_TABLE = "doctors_service_doctor_search"
+
+
+def search_doctors(queryset: QuerySet, query: str) -> QuerySet:
+    # Returns only the doctors matching every word of the query, annotated
+    # with a "rank" where a higher value means a better match.
+    tokens = re.findall(r"\w+", query)
+    if not tokens:
+        return queryset
+    if connection.vendor == "postgresql":
+        return trigram_search(queryset, tokens)
+    return fts_search(queryset, tokens)
+
+
+def trigram_search(queryset: QuerySet, tokens: list) -> QuerySet:
+    # Every word has to be similar to a word of the doctor's document in
+    # the table of migration 0010, the same AND semantics as the FTS5 match.
+    # All the conditions are on one column, served by its trigram index.
+    table = queryset.model._meta.db_table
+    condition = " AND ".join(["document %%> %s"] * len(tokens))
+    similarity = " + ".join(["word_similarity(%s, document)"] * len(tokens))
+    return queryset.filter(
+        pk__in=RawSQL(
+            f"SELECT doctor_id FROM {SEARCH_TABLE} WHERE {condition}",
+            tokens
+        )
+    ).annotate(
+        rank=RawSQL(
+            f"SELECT {similarity} FROM {SEARCH_TABLE} "
+            f"WHERE doctor_id = {table}.id",
+            tokens
+        )
+    )
+
+
+def fts_search(queryset: QuerySet, tokens: list) -> QuerySet:
+    # SQLite fallback on the FTS5 table kept in sync by triggers, every
+    # word of the query is matched as a prefix.
+    match = " ".join(f'"{token}"*' for token in tokens)
+    table = queryset.model._meta.db_table
+    return queryset.filter(
+        pk__in=RawSQL(
+            f"SELECT rowid FROM {SEARCH_TABLE} "
+            f"WHERE {SEARCH_TABLE} MATCH %s",
+            (match,)
+        )
+    ).annotate(
+        rank=RawSQL(
+            f"SELECT -bm25({SEARCH_TABLE}) FROM {SEARCH_TABLE} "
+            f"WHERE {SEARCH_TABLE} MATCH %s AND rowid = {table}.id",
+            (match,)
+        )
+    )
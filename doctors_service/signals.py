@@ -0,0 +1,104 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from doctors_service import counters, versions
+from doctors_service.availability import refresh_slots_availability
+from doctors_service.caching import invalidate_free_slots
+from doctors_service.models import (
+    Appointment,
+    ArchivedAppointment,
+    Doctor,
+    DoctorSchedule,
+    DoctorSpecialty
+)
+
+
+def increment_on_commit(name, delta):
+    transaction.on_commit(partial(counters.increment, name, delta))
+
+
+def is_only_visit(appointment):
+    number = appointment.insurance_number
+    return not (
+        Appointment.objects.filter(
+            insurance_number=number
+        ).exclude(pk=appointment.pk).exists()
+        or ArchivedAppointment.objects.filter(
+            insurance_number=number
+        ).exists()
+    )
+
+
+@receiver(post_save, sender=Doctor)
+def doctor_saved(sender, instance, created, **kwargs):
+    if created:
+        increment_on_commit("num_doctors", 1)
+
+
+@receiver(post_delete, sender=Doctor)
+def doctor_deleted(sender, instance, **kwargs):
+    increment_on_commit("num_doctors", -1)
+
+
+@receiver(post_save, sender=DoctorSpecialty)
+def specialty_saved(sender, instance, created, **kwargs):
+    if created:
+        increment_on_commit("num_specialties", 1)
+
+
+@receiver(post_delete, sender=DoctorSpecialty)
+def specialty_deleted(sender, instance, **kwargs):
+    increment_on_commit("num_specialties", -1)
+
+
+@receiver(post_save, sender=Appointment)
+def appointment_saved(sender, instance, created, **kwargs):
+    if created:
+        increment_on_commit("num_appointments", 1)
+        if is_only_visit(instance):
+            increment_on_commit("num_patients", 1)
+
+
+@receiver(post_delete, sender=Appointment)
+def appointment_deleted(sender, instance, **kwargs):
+    increment_on_commit("num_appointments", -1)
+    if is_only_visit(instance):
+        increment_on_commit("num_patients", -1)
+
+
+@receiver(post_save, sender=Doctor)
+@receiver(post_delete, sender=Doctor)
+def doctor_changed(sender, **kwargs):
+    versions.invalidate("doctors")
+
+
+@receiver(post_save, sender=DoctorSpecialty)
+@receiver(post_delete, sender=DoctorSpecialty)
+def specialty_changed(sender, **kwargs):
+    versions.invalidate("specialties", "doctors")
+
+
+@receiver(m2m_changed, sender=Doctor.specialty.through)
+def doctor_specialties_changed(sender, action, **kwargs):
+    if action.startswith("post_"):
+        versions.invalidate("doctors")
+
+
+def deleted_with_doctor(origin):
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return issubclass(model, Doctor)
+
+
+@receiver(post_save, sender=DoctorSchedule)
+@receiver(post_delete, sender=DoctorSchedule)
+def schedule_changed(sender, instance, origin=None, **kwargs):
+    versions.invalidate("schedules")
+    invalidate_free_slots(instance.doctor_id)
+    # A doctor's availability rows are removed by the same cascade, so its
+    # slots aren't recounted one by one.
+    if not deleted_with_doctor(origin):
+        refresh_slots_availability([instance])
@@ -0,0 +1,103 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.utils import timezone
+
+from doctors_service import archive, versions
+from doctors_service.bulk import delete_rows
+from doctors_service.models import (
+    Appointment,
+    DailyAvailability,
+    DoctorSchedule
+)
+from doctors_service.queue import enqueue, register
+
+CLEANUP_BATCH_SIZE = 1000
+
+
+def appointment_message(appointment: Appointment) -> str:
+    doctor = appointment.doctor
+    return (
+        f"Dear {appointment.first_name} {appointment.last_name},\n\n"
+        f"your appointment No. {appointment.pk} with {doctor} is on "
+        f"{appointment.doctor_schedule}.\n"
+        f"{doctor.hospital}, {doctor.city}\n"
+    )
+
+
+def get_appointment(appointment_id):
+    return Appointment.objects.select_related(
+        "doctor",
+        "doctor_schedule"
+    ).filter(pk=appointment_id).first()
+
+
+@register
+def send_booking_confirmation(appointment_id):
+    appointment = get_appointment(appointment_id)
+    if appointment is None:
+        return
+    send_mail(
+        "Your appointment is confirmed",
+        appointment_message(appointment),
+        settings.DEFAULT_FROM_EMAIL,
+        [appointment.email],
+    )
+
+
+@register
+def send_appointment_reminder(appointment_id):
+    appointment = get_appointment(appointment_id)
+    if appointment is None:
+        return
+    send_mail(
+        "Reminder about your appointment",
+        appointment_message(appointment),
+        settings.DEFAULT_FROM_EMAIL,
+        [appointment.email],
+    )
+
+
+@register
+def cleanup_past_slots():
+    # Free slots of past days can't be booked anymore. Runs daily: the
+    # next run is enqueued by the current one. Rows are deleted without
+    # the per-row delete signals, the schedules version is bumped once.
+    today = timezone.localdate()
+    past_slots = DoctorSchedule.objects.filter(
+        is_booked=False,
+        date__lt=today,
+        appointments__isnull=True
+    ).values_list("pk", flat=True)
+    while batch := list(past_slots[:CLEANUP_BATCH_SIZE]):
+        delete_rows(DoctorSchedule, batch)
+    DailyAvailability.objects.filter(date__lt=today).delete()
+    versions.invalidate("schedules")
+    enqueue("cleanup_past_slots", run_at=timezone.now() + timedelta(days=1))
+
+
+@register
+def archive_past_records():
+    # Runs daily like cleanup_past_slots.
+    archive.archive_past_records()
+    enqueue(
+        "archive_past_records",
+        run_at=timezone.now() + timedelta(days=1)
+    )
+
+
+def schedule_appointment_tasks(appointment: Appointment) -> None:
+    enqueue("send_booking_confirmation", appointment_id=appointment.pk)
+    slot = DoctorSchedule.objects.only("date", "timeslot").get(
+        pk=appointment.doctor_schedule_id
+    )
+    reminder_at = slot.starts_at - timedelta(
+        hours=settings.APPOINTMENT_REMINDER_HOURS
+    )
+    if reminder_at > timezone.now():
+        enqueue(
+            "send_appointment_reminder",
+            run_at=reminder_at,
+            appointment_id=appointment.pk
+        )
@@ -1,20 +1,30 @@
 from django.urls import path
+from doctors_service.api import (
+    api_specialties_list,
+    api_doctors_list,
+    api_specialty_doctors_list,
+    api_doctor_slots_list,
+    api_doctor_free_slots,
+    api_availability_search
+)
 from doctors_service.views import (
     index,
     DoctorSpecialtyListView,
     DoctorSpecialtyDetailView,
     DoctorListView,
     DoctorDetailView,
+    AvailabilitySearchView,
     AppointmentListView,
     AppointmentDetailView,
     DoctorScheduleCreateView,
+    DoctorScheduleGenerateView,
     DoctorScheduleDeleteView,
     DoctorCreateView,
     DoctorUpdateView,
     DoctorDeleteView,
     AppointmentCreateView,
     AppointmentConfirmationDetailView,
-    load_doctor_schedule
+    export_data
 )
 
 
@@ -40,6 +50,11 @@ urlpatterns = [
         DoctorDetailView.as_view(),
         name="doctors-detail"
     ),
+    path(
+        "availability/",
+        AvailabilitySearchView.as_view(),
+        name="availability-search"
+    ),
     path(
         "appointments/",
         AppointmentListView.as_view(),
@@ -55,6 +70,11 @@ urlpatterns = [
         DoctorScheduleCreateView.as_view(),
         name="doctor-schedule-form"
     ),
+    path(
+        "doctors/<int:pk>/generate_schedule/",
+        DoctorScheduleGenerateView.as_view(),
+        name="doctor-schedule-generate"
+    ),
     path(
         "doctors/<int:doctor_id>/delete_schedule/<int:pk>/",
         DoctorScheduleDeleteView.as_view(),
@@ -86,9 +106,46 @@ urlpatterns = [
         name="appointment-confirm"
     ),
     path(
-        "ajax/load-doctor_schedules/",
-        load_doctor_schedule,
-        name="ajax_load_doctor_schedules"
+        "appointments/export/",
+        export_data,
+        {"export_name": "appointments"},
+        name="appointments-export"
+    ),
+    path(
+        "schedules/export/",
+        export_data,
+        {"export_name": "schedules"},
+        name="schedules-export"
+    ),
+    path(
+        "api/v1/specialties/",
+        api_specialties_list,
+        name="api-specialties-list"
+    ),
+    path(
+        "api/v1/specialties/<int:pk>/doctors/",
+        api_specialty_doctors_list,
+        name="api-specialty-doctors-list"
+    ),
+    path(
+        "api/v1/doctors/",
+        api_doctors_list,
+        name="api-doctors-list"
+    ),
+    path(
+        "api/v1/doctors/<int:pk>/slots/",
+        api_doctor_slots_list,
+        name="api-doctor-slots-list"
+    ),
+    path(
+        "api/v1/doctors/<int:pk>/free-slots/",
+        api_doctor_free_slots,
+        name="api-doctor-free-slots"
+    ),
+    path(
+        "api/v1/availability/",
+        api_availability_search,
+        name="api-availability-search"
     ),
 ]
 
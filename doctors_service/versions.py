@@ -0,0 +1,41 @@
+import time
+from datetime import datetime, timezone
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+
+CACHE_KEY_PREFIX = "versions"
+
+
+def cache_key(scope: str) -> str:
+    return f"{CACHE_KEY_PREFIX}:{scope}"
+
+
+def get_version(scope: str) -> float:
+    version = cache.get(cache_key(scope))
+    if version is None:
+        # Unknown history is treated as "changed just now".
+        cache.add(cache_key(scope), time.time(), timeout=None)
+        version = cache.get(cache_key(scope), time.time())
+    return version
+
+
+def bump(scope: str) -> None:
+    cache.set(cache_key(scope), time.time(), timeout=None)
+
+
+def invalidate(*scopes: str) -> None:
+    # Bumped right away so the writer's own transaction stops using the
+    # cached data, and again on commit so nothing cached by concurrent
+    # readers before the commit survives.
+    for scope in scopes:
+        bump(scope)
+        transaction.on_commit(partial(bump, scope))
+
+
+def last_modified(*scopes: str) -> datetime:
+    return datetime.fromtimestamp(
+        max(get_version(scope) for scope in scopes),
+        tz=timezone.utc
+    )
@@ -1,98 +1,200 @@
+from datetime import timedelta
+
+from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpRequest, HttpResponse
-from django.shortcuts import render
+from django.core.paginator import Paginator
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBadRequest,
+    HttpResponseRedirect,
+    StreamingHttpResponse
+)
+from django.db import transaction
+from django.shortcuts import get_object_or_404, render
 from django.urls import reverse_lazy
+from django.utils import timezone
 from django.views import generic
 
+from doctors_service import counters
+from doctors_service.availability import (
+    add_next_free_time,
+    annotate_next_free_slot,
+    annotate_specialty_availability
+)
+from doctors_service.booking import book_appointment, SlotAlreadyBooked
+from doctors_service.caching import PublicPageCacheMixin
+from doctors_service.exports import (
+    CONTENT_TYPES,
+    EXPORT_FORMATS,
+    EXPORTS,
+    export_lines
+)
 from doctors_service.forms import (
     DoctorCreationForm,
     DoctorUpdateForm,
     AppointmentCreationForm,
     DoctorSearchForm,
-    AppointmentSearchForm
+    CitySearchForm,
+    AppointmentSearchForm,
+    AvailabilitySearchForm,
+    DoctorScheduleGenerateForm
 )
 from doctors_service.models import (
     Doctor,
     DoctorSpecialty,
     Appointment,
-    DoctorSchedule
+    DoctorSchedule,
+    WeeklySchedule
 )
+from doctors_service.pagination import KeysetPaginationMixin
+from doctors_service.scheduling import generate_schedule, set_weekly_schedule
+from doctors_service.search import search_doctors
 
 
 def index(request: HttpRequest) -> HttpResponse:
-    num_doctors = Doctor.objects.count()
-    num_specialties = DoctorSpecialty.objects.count()
-    num_appointments = Appointment.objects.count()
-    num_patients = Appointment.objects.values(
-        "insurance_number").distinct().count()
-
-    context = {
-        "num_doctors": num_doctors,
-        "num_specialties": num_specialties,
-        "num_appointments": num_appointments,
-        "num_patients": num_patients,
-    }
+    context = counters.get_counters()
 
     return render(request, "doctors/index.html", context=context)
 
 
-class DoctorSpecialtyListView(generic.ListView):
+class DoctorSpecialtyListView(PublicPageCacheMixin, generic.ListView):
     model = DoctorSpecialty
+    cache_scopes = ("specialties", "doctors", "schedules")
     template_name = "doctors/specialties_list.html"
     context_object_name = "specialties_list"
 
+    def get_queryset(self):
+        return annotate_specialty_availability(super().get_queryset())
+
 
-class DoctorSpecialtyDetailView(generic.DetailView):
+class DoctorSpecialtyDetailView(
+    PublicPageCacheMixin,
+    KeysetPaginationMixin,
+    generic.DetailView
+):
     model = DoctorSpecialty
+    cache_scopes = ("specialties", "doctors", "schedules")
     template_name = "doctors/specialties_detail.html"
     context_object_name = "specialty"
+    paginate_by = 20
+    keyset_ordering = ("first_name", "last_name", "pk")
+
+    def get_doctors(self):
+        doctors = self.object.doctors.all()
+        form = CitySearchForm(self.request.GET)
+        if form.is_valid() and form.cleaned_data["city"]:
+            doctors = doctors.filter(
+                city__icontains=form.cleaned_data["city"]
+            )
+        return annotate_next_free_slot(doctors)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        specialty = self.get_object()
-        doctors = specialty.doctors.all()
+        _, page, doctors, is_paginated = self.paginate_queryset(
+            self.get_doctors(),
+            self.paginate_by
+        )
+        add_next_free_time(doctors)
         context["doctors_list"] = doctors
+        context["page_obj"] = page
+        context["is_paginated"] = is_paginated
+        context["search_form"] = CitySearchForm(
+            initial={"city": self.request.GET.get("city", "")}
+        )
         return context
 
 
-class DoctorListView(generic.ListView):
+class DoctorListView(
+    PublicPageCacheMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = Doctor
+    cache_scopes = ("doctors",)
     template_name = "doctors/doctors_list.html"
     context_object_name = "doctors_list"
     paginate_by = 5
+    keyset_ordering = ("first_name", "last_name", "pk")
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super(DoctorListView, self).get_context_data(**kwargs)
-        city = self.request.GET.get("city", "")
         context["search_form"] = DoctorSearchForm(
             initial={
-                "city": city
+                "query": self.get_search_query()
             }
         )
         return context
 
+    def get_search_query(self):
+        # ?city= is the parameter of the former city-only search, old links
+        # keep working.
+        form = DoctorSearchForm({
+            "query": self.request.GET.get(
+                "query", self.request.GET.get("city", "")
+            )
+        })
+        if form.is_valid():
+            return form.cleaned_data["query"]
+        return ""
+
+    def get_keyset_ordering(self):
+        if self.get_search_query():
+            return ("-rank", "pk")
+        return super().get_keyset_ordering()
+
     def get_queryset(self):
         queryset = Doctor.objects.prefetch_related("specialty")
-        form = DoctorSearchForm(self.request.GET)
-        if form.is_valid():
-            return queryset.filter(city__icontains=form.cleaned_data["city"])
-        return queryset
+        return search_doctors(queryset, self.get_search_query())
+
+
+class AvailabilitySearchView(
+    PublicPageCacheMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
+    cache_scopes = ("specialties", "doctors", "schedules")
+    template_name = "doctors/availability_search.html"
+    context_object_name = "slots_list"
+    paginate_by = 20
+    keyset_ordering = ("date", "timeslot", "pk")
+
+    def get_queryset(self):
+        form = AvailabilitySearchForm(self.request.GET)
+        return form.filter_slots(
+            DoctorSchedule.objects.available().select_related("doctor")
+        )
+
+    def get_context_data(self, *, object_list=None, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["search_form"] = AvailabilitySearchForm(
+            self.request.GET or None
+        )
+        return context
 
 
 class DoctorDetailView(generic.DetailView):
     model = Doctor
+    queryset = Doctor.objects.prefetch_related("specialty")
     template_name = "doctors/doctors_detail.html"
     context_object_name = "doctor"
+    schedule_paginate_by = 10
+    schedule_window_days = 90
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        doctor = self.get_object()
-
-        doctor_schedule = doctor.doctor_schedule.all()
-
-        available_schedule = [schedule for schedule in doctor_schedule
-                              if not schedule.is_booked]
-        context["available_schedule"] = available_schedule
+        window_end = timezone.localdate() + timedelta(
+            days=self.schedule_window_days
+        )
+        available_schedule = self.object.doctor_schedule.available().filter(
+            date__lt=window_end
+        )
+        paginator = Paginator(available_schedule, self.schedule_paginate_by)
+        page = paginator.get_page(self.request.GET.get("page"))
+        context["available_schedule"] = page
+        context["paginator"] = paginator
+        context["page_obj"] = page
+        context["is_paginated"] = page.has_other_pages()
         return context
 
 
@@ -122,19 +224,25 @@ class DoctorDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("doctors_service:doctors-list")
 
 
-class AppointmentListView(LoginRequiredMixin, generic.ListView):
+class AppointmentListView(
+    LoginRequiredMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = Appointment
     template_name = "doctors/appointments_list.html"
     context_object_name = "appointments_list"
     paginate_by = 5
+    keyset_ordering = (
+        "doctor_schedule__date",
+        "doctor_schedule__timeslot",
+        "pk",
+    )
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super(AppointmentListView, self).get_context_data(**kwargs)
-        date = self.request.GET.get("date", "")
         context["search_form"] = AppointmentSearchForm(
-            initial={
-                "date": date
-            }
+            initial=self.request.GET.dict()
         )
         return context
 
@@ -144,11 +252,7 @@ class AppointmentListView(LoginRequiredMixin, generic.ListView):
             "doctor_schedule"
         )
         form = AppointmentSearchForm(self.request.GET)
-        if form.is_valid() and form.cleaned_data["date"] is not None:
-            return queryset.filter(
-                doctor_schedule__date__icontains=form.cleaned_data["date"]
-            )
-        return queryset
+        return form.filter_appointments(queryset)
 
 
 class AppointmentDetailView(LoginRequiredMixin, generic.DetailView):
@@ -169,6 +273,12 @@ class AppointmentConfirmationDetailView(generic.DetailView):
     context_object_name = "appointment"
     template_name = "doctors/appointment_confirm.html"
 
+    def get_queryset(self):
+        return Appointment.objects.select_related(
+            "doctor",
+            "doctor_schedule"
+        )
+
 
 class AppointmentCreateView(generic.CreateView):
     model = Appointment
@@ -182,10 +292,12 @@ class AppointmentCreateView(generic.CreateView):
         )
 
     def form_valid(self, form):
-        response = super().form_valid(form)
-        self.object.doctor_schedule.is_booked = True
-        self.object.doctor_schedule.save()
-        return response
+        try:
+            self.object = book_appointment(form.save(commit=False))
+        except SlotAlreadyBooked as error:
+            form.add_error("doctor_schedule", str(error))
+            return self.form_invalid(form)
+        return HttpResponseRedirect(self.get_success_url())
 
 
 class DoctorScheduleCreateView(LoginRequiredMixin, generic.CreateView):
@@ -206,6 +318,44 @@ class DoctorScheduleCreateView(LoginRequiredMixin, generic.CreateView):
         )
 
 
+class DoctorScheduleGenerateView(LoginRequiredMixin, generic.FormView):
+    form_class = DoctorScheduleGenerateForm
+    template_name = "doctors/doctor_schedule_generate_form.html"
+
+    def get_initial(self):
+        initial = super().get_initial()
+        weekly_schedule = WeeklySchedule.objects.filter(
+            doctor_id=self.kwargs["pk"]
+        ).values_list("weekday", "timeslot")
+        initial["weekdays"] = sorted({row[0] for row in weekly_schedule})
+        initial["timeslots"] = sorted({row[1] for row in weekly_schedule})
+        return initial
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["doctor"] = get_object_or_404(Doctor, pk=self.kwargs["pk"])
+        return context
+
+    def form_valid(self, form):
+        doctor = get_object_or_404(Doctor, pk=self.kwargs["pk"])
+        with transaction.atomic():
+            set_weekly_schedule(doctor.pk, form.pattern)
+            generate_schedule(
+                doctor.pk,
+                form.cleaned_data["date_from"],
+                form.cleaned_data["date_to"],
+                form.pattern
+            )
+        return super().form_valid(form)
+
+    def get_success_url(self):
+        doctor_id = self.kwargs["pk"]
+        return reverse_lazy(
+            "doctors_service:doctors-detail",
+            kwargs={"pk": doctor_id}
+        )
+
+
 class DoctorScheduleDeleteView(LoginRequiredMixin, generic.DeleteView):
     model = DoctorSchedule
     template_name = "doctors/doctor_schedule_confirm_delete.html"
@@ -223,14 +373,23 @@ class DoctorScheduleDeleteView(LoginRequiredMixin, generic.DeleteView):
         return context
 
 
-def load_doctor_schedule(request):
-    doctor_id = request.GET.get("doctor")
-    doctor_schedules = DoctorSchedule.objects.filter(
-        doctor_id=doctor_id,
-        is_booked=False
+@login_required
+def export_data(request: HttpRequest, export_name: str) -> HttpResponse:
+    export_format = request.GET.get("format", "csv")
+    if export_format not in EXPORT_FORMATS:
+        return HttpResponseBadRequest(
+            f"format must be one of: {', '.join(EXPORT_FORMATS)}"
+        )
+    form = AppointmentSearchForm(request.GET)
+    if not form.is_valid():
+        return HttpResponseBadRequest(form.errors.as_text())
+
+    get_queryset, columns = EXPORTS[export_name]
+    response = StreamingHttpResponse(
+        export_lines(get_queryset(form), columns, export_format),
+        content_type=CONTENT_TYPES[export_format]
     )
-    return render(
-        request,
-        "doctors/doctor_schedules_dropdown_list_options.html",
-        {"doctor_schedules": doctor_schedules}
+    response["Content-Disposition"] = (
+        f'attachment; filename="{export_name}.{export_format}"'
     )
+    return response
@@ -0,0 +1,36 @@
+// Type-ahead for the selects rendered by DoctorPickerSelect: the page only
+// holds the selected doctor, matches are loaded from the doctors API.
+$("select[data-search-url]").each(function () {
+  var doctor = $(this);
+  var emptyLabel = doctor.find('option[value=""]').text();
+  var doctorSearch = $('<input type="search" class="form-control mb-2" placeholder="Type a doctor\'s name, city, hospital or specialty">');
+  var searchTimer = null;
+  doctor.before(doctorSearch);
+
+  // Up to 20 matches are shown, typing more narrows them down.
+  doctorSearch.on("input", function () {
+    clearTimeout(searchTimer);
+    var query = $(this).val().trim();
+    if (!query) {
+      return;
+    }
+    searchTimer = setTimeout(function () {
+      $.getJSON(doctor.attr("data-search-url"), {
+        search: query,
+        fields: "id,first_name,last_name,city",
+        limit: 20
+      }, function (data) {
+        doctor.html($("<option>").val("").text(emptyLabel));
+        $.each(data.results, function (index, result) {
+          doctor.append($("<option>").val(result.id).text(result.first_name + " " + result.last_name + " (" + result.city + ")"));
+        });
+        if (data.next) {
+          doctor.append($("<option disabled>").text("More doctors match, keep typing…"));
+        }
+        if (data.results.length === 1) {
+          doctor.val(data.results[0].id).change();
+        }
+      });
+    }, 250);
+  });
+});
@@ -0,0 +1,271 @@
+from datetime import datetime, time, timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from doctors_service.models import DoctorSchedule, DoctorSpecialty
+from doctors_service.pagination import encode_cursor
+
+API_DOCTORS_LIST = reverse("doctors_service:api-doctors-list")
+API_SPECIALTIES_LIST = reverse("doctors_service:api-specialties-list")
+
+
+class ApiTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.specialty1 = DoctorSpecialty.objects.create(
+            specialty="Cardiology"
+        )
+        self.specialty2 = DoctorSpecialty.objects.create(
+            specialty="Dermatology"
+        )
+        self.doctors = [
+            get_user_model().objects.create(
+                first_name=f"test_first_name_{number}",
+                last_name="test_last_name",
+                password="<PASSWORD>",
+                username=f"test_username_{number}",
+                licence_number=f"TES1234{number}",
+                city="Kyiv" if number % 2 else "Lviv",
+                hospital="test_hospital",
+            )
+            for number in range(5)
+        ]
+        self.doctors[0].specialty.add(self.specialty1, self.specialty2)
+
+    def test_doctors_list_serializes_fields(self):
+        response = self.client.get(API_DOCTORS_LIST)
+        self.assertEqual(response.status_code, 200)
+        first = response.json()["results"][0]
+        self.assertEqual(first["id"], self.doctors[0].pk)
+        self.assertEqual(first["city"], "Lviv")
+        self.assertEqual(
+            first["specialty"],
+            [self.specialty1.pk, self.specialty2.pk]
+        )
+
+    def test_doctors_list_field_selection(self):
+        response = self.client.get(API_DOCTORS_LIST, {"fields": "id,city"})
+        self.assertEqual(
+            set(response.json()["results"][0]),
+            {"id", "city"}
+        )
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.client.get(API_DOCTORS_LIST, {"fields": "password"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_pagination_walks_all_doctors(self):
+        ids = []
+        url = f"{API_DOCTORS_LIST}?limit=2"
+        pages = 0
+        while url:
+            data = self.client.get(url).json()
+            ids += [doctor["id"] for doctor in data["results"]]
+            url = data["next"]
+            pages += 1
+        self.assertEqual(pages, 3)
+        self.assertEqual(ids, [doctor.pk for doctor in self.doctors])
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(API_DOCTORS_LIST, {"cursor": "broken"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_with_non_scalar_value_is_rejected(self):
+        response = self.client.get(
+            API_DOCTORS_LIST,
+            {"cursor": encode_cursor(["a", "b", {"x": 1}])}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "Invalid cursor"})
+
+    def test_cursor_with_oversized_int_is_rejected(self):
+        for url, cursor in (
+            (API_DOCTORS_LIST, ["a", "b", 2 ** 64]),
+            (
+                reverse("doctors_service:api-availability-search"),
+                ["2026-10-20", 2 ** 64, 1]
+            ),
+        ):
+            response = self.client.get(url, {"cursor": encode_cursor(cursor)})
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json(), {"error": "Invalid cursor"})
+
+    def test_doctors_list_filter_by_city(self):
+        response = self.client.get(API_DOCTORS_LIST, {"city": "kyiv"})
+        self.assertEqual(
+            [doctor["id"] for doctor in response.json()["results"]],
+            [self.doctors[1].pk, self.doctors[3].pk]
+        )
+
+    def test_specialty_doctors_list(self):
+        response = self.client.get(
+            reverse(
+                "doctors_service:api-specialty-doctors-list",
+                kwargs={"pk": self.specialty2.pk}
+            )
+        )
+        self.assertEqual(
+            [doctor["id"] for doctor in response.json()["results"]],
+            [self.doctors[0].pk]
+        )
+
+    def test_doctor_slots_list_returns_free_future_slots(self):
+        tomorrow = timezone.localdate() + timedelta(days=1)
+        free = DoctorSchedule.objects.create(
+            doctor=self.doctors[0], date=tomorrow, timeslot=1
+        )
+        DoctorSchedule.objects.create(
+            doctor=self.doctors[0], date=tomorrow, timeslot=2, is_booked=True
+        )
+        DoctorSchedule.objects.create(
+            doctor=self.doctors[0],
+            date=tomorrow - timedelta(days=2),
+            timeslot=3
+        )
+        response = self.client.get(
+            reverse(
+                "doctors_service:api-doctor-slots-list",
+                kwargs={"pk": self.doctors[0].pk}
+            )
+        )
+        self.assertEqual(
+            response.json()["results"],
+            [{
+                "id": free.pk,
+                "date": tomorrow.isoformat(),
+                "timeslot": 1,
+                "time": "10:00 – 11:00",
+            }]
+        )
+
+    def test_etag_returns_not_modified_until_data_changes(self):
+        response = self.client.get(API_SPECIALTIES_LIST)
+        etag = response["ETag"]
+        self.assertTrue(response.has_header("Last-Modified"))
+
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                API_SPECIALTIES_LIST,
+                HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            DoctorSpecialty.objects.create(specialty="Neurology")
+        response = self.client.get(
+            API_SPECIALTIES_LIST,
+            HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 3)
+
+    def test_validators_change_when_a_timeslot_starts(self):
+        day = timezone.localdate() + timedelta(days=1)
+        for timeslot in (4, 5):
+            DoctorSchedule.objects.create(
+                doctor=self.doctors[0], date=day, timeslot=timeslot
+            )
+        url = reverse(
+            "doctors_service:api-doctor-slots-list",
+            kwargs={"pk": self.doctors[0].pk}
+        )
+
+        def at(hour, **headers):
+            now = timezone.make_aware(datetime.combine(day, time(hour, 30)))
+            with mock.patch("django.utils.timezone.now", return_value=now):
+                return self.client.get(url, **headers)
+
+        response = at(13)
+        etag, modified = response["ETag"], response["Last-Modified"]
+        self.assertEqual(at(13, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(
+            at(13, HTTP_IF_MODIFIED_SINCE=modified).status_code, 304
+        )
+
+        response = at(14, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [slot["timeslot"] for slot in response.json()["results"]], [5]
+        )
+        self.assertEqual(
+            at(14, HTTP_IF_MODIFIED_SINCE=modified).status_code, 200
+        )
+
+
+class FreeSlotsApiTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.doctor = get_user_model().objects.create(
+            first_name="test_first_name",
+            last_name="test_last_name",
+            password="<PASSWORD>",
+            username="test_username",
+            licence_number="TES12345",
+            city="Kyiv",
+            hospital="test_hospital",
+        )
+        self.tomorrow = timezone.localdate() + timedelta(days=1)
+        self.free = DoctorSchedule.objects.create(
+            doctor=self.doctor, date=self.tomorrow, timeslot=3
+        )
+        DoctorSchedule.objects.create(
+            doctor=self.doctor, date=self.tomorrow, timeslot=2, is_booked=True
+        )
+        DoctorSchedule.objects.create(
+            doctor=self.doctor,
+            date=self.tomorrow - timedelta(days=2),
+            timeslot=1
+        )
+        self.url = reverse(
+            "doctors_service:api-doctor-free-slots",
+            kwargs={"pk": self.doctor.pk}
+        )
+
+    async def test_returns_compact_future_free_slots(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(
+            data["slots"],
+            [[self.free.pk, self.tomorrow.isoformat(), 3]]
+        )
+        self.assertEqual(data["times"]["3"], "12:00 – 13:00")
+
+    def test_cached_until_booking(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+        self.client.post(reverse("doctors_service:appointment-form"), {
+            "doctor": self.doctor.pk,
+            "doctor_schedule": self.free.pk,
+            "first_name": "test_first_name",
+            "last_name": "test_last_name",
+            "email": "test@test.com",
+            "phone": "+380682222222",
+            "insurance_number": "1234567890",
+        })
+        self.assertTrue(
+            DoctorSchedule.objects.get(pk=self.free.pk).is_booked
+        )
+        self.assertEqual(self.client.get(self.url).json()["slots"], [])
+
+    def test_cache_invalidated_on_schedule_change(self):
+        self.client.get(self.url)
+        later = DoctorSchedule.objects.create(
+            doctor=self.doctor, date=self.tomorrow, timeslot=7
+        )
+        self.assertEqual(
+            [slot[0] for slot in self.client.get(self.url).json()["slots"]],
+            [self.free.pk, later.pk]
+        )
+
+    def test_only_get_is_allowed(self):
+        self.assertEqual(self.client.post(self.url).status_code, 405)
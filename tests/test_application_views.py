@@ -1,6 +1,9 @@
+from datetime import timedelta
+
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.urls import reverse
+from django.utils import timezone
 from doctors_service.models import (
     DoctorSchedule,
     DoctorSpecialty,
@@ -34,7 +37,7 @@ class PublicAppointmentViewsTestCase(TestCase):
 
         self.schedule1 = DoctorSchedule.objects.create(
             doctor=self.doctor,
-            date="2026-10-20",
+            date=timezone.localdate() + timedelta(days=1),
             timeslot=5,
             is_booked=False
         )
@@ -157,6 +160,60 @@ class PrivateAppointmentViewsTestCase(TestCase):
             [self.appointment1]
         )
 
+    def test_search_by_date_range(self):
+        response = self.client.get(
+            APPOINTMENTS_LIST,
+            {"date_from": "2026-10-20", "date_to": "2026-10-31"}
+        )
+        self.assertEqual(
+            list(response.context["object_list"]),
+            [self.appointment1]
+        )
+        response = self.client.get(
+            APPOINTMENTS_LIST,
+            {"date_to": "2026-10-19"}
+        )
+        self.assertEqual(
+            list(response.context["object_list"]),
+            [self.appointment2]
+        )
+
+    def test_search_by_doctor(self):
+        other_doctor = get_user_model().objects.create(
+            username="other_username",
+            licence_number="TES54321",
+        )
+        response = self.client.get(
+            APPOINTMENTS_LIST,
+            {"doctor": other_doctor.pk}
+        )
+        self.assertEqual(list(response.context["object_list"]), [])
+        response = self.client.get(
+            APPOINTMENTS_LIST,
+            {"doctor": self.doctor.pk, "date": "2026-10-19"}
+        )
+        self.assertEqual(
+            list(response.context["object_list"]),
+            [self.appointment2]
+        )
+
+    def test_search_form_renders_only_selected_doctor(self):
+        other_doctor = get_user_model().objects.create(
+            first_name="other_first_name",
+            username="other_username",
+            licence_number="TES54321",
+        )
+        response = self.client.get(APPOINTMENTS_LIST)
+        self.assertNotContains(response, "other_first_name")
+        self.assertContains(response, "All doctors")
+        response = self.client.get(
+            APPOINTMENTS_LIST,
+            {"doctor": other_doctor.pk}
+        )
+        self.assertContains(response, "other_first_name")
+        response = self.client.get(APPOINTMENTS_LIST, {"doctor": "abc"})
+        self.assertEqual(response.status_code, 200)
+
     def test_search_with_empty_query(self):
         response = self.client.get("/appointments/")
         self.assertEqual(response.status_code, 200)
@@ -186,3 +243,65 @@ class PrivateAppointmentViewsTestCase(TestCase):
             appointment_detail.doctor_schedule.time,
             self.appointment1.doctor_schedule.time
         )
+
+
+class AppointmentDoctorPickerTest(TestCase):
+
+    def setUp(self):
+        self.doctors = [
+            get_user_model().objects.create(
+                first_name=f"picker_first_name_{number}",
+                last_name="picker_last_name",
+                password="<PASSWORD>",
+                username=f"picker_username_{number}",
+                licence_number=f"PIC1234{number}",
+                city="test_city",
+                hospital="test_hospital",
+            )
+            for number in range(5)
+        ]
+
+    def test_form_does_not_render_every_doctor(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(APPOINTMENT_FORM)
+        self.assertNotContains(response, "picker_first_name")
+        self.assertContains(response, "data-search-url")
+
+    def test_selected_doctor_is_kept_after_invalid_post(self):
+        response = self.client.post(
+            APPOINTMENT_FORM,
+            {"doctor": self.doctors[2].pk}
+        )
+        self.assertContains(response, "picker_first_name_2")
+        self.assertNotContains(response, "picker_first_name_1")
+
+    def test_invalid_doctor_value_is_a_form_error(self):
+        response = self.client.post(APPOINTMENT_FORM, {"doctor": "abc"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["form"].errors["doctor"])
+        self.assertNotContains(response, "picker_first_name")
+
+    def test_doctors_api_search(self):
+        response = self.client.get(
+            reverse("doctors_service:api-doctors-list"),
+            {"search": "picker_first_name_3", "fields": "id"}
+        )
+        self.assertEqual(
+            response.json()["results"],
+            [{"id": self.doctors[3].pk}]
+        )
+
+    def test_doctors_api_search_orders_by_rank(self):
+        # Matches in two columns, but sorts after doctor 3 by name.
+        self.doctors[4].first_name = "zz"
+        self.doctors[4].last_name = "picker_first_name_3"
+        self.doctors[4].hospital = "picker_first_name_3"
+        self.doctors[4].save()
+        ids = []
+        url = reverse("doctors_service:api-doctors-list")
+        query = {"search": "picker_first_name_3", "fields": "id", "limit": 1}
+        while url:
+            data = self.client.get(url, query).json()
+            ids += [doctor["id"] for doctor in data["results"]]
+            url, query = data["next"], {}
+        self.assertEqual(ids, [self.doctors[4].pk, self.doctors[3].pk])
@@ -0,0 +1,104 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from doctors_service import counters
+from doctors_service.models import (
+    Appointment,
+    ArchivedAppointment,
+    ArchivedDoctorSchedule,
+    DoctorSchedule
+)
+
+
+class ArchiveTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.doctor = get_user_model().objects.create(
+            username="test_username",
+            licence_number="TES12345",
+            city="Kyiv",
+            hospital="test_hospital",
+        )
+        today = timezone.localdate()
+        self.old_slots = [
+            DoctorSchedule.objects.create(
+                doctor=self.doctor,
+                date=today - timedelta(days=400 + day),
+                timeslot=1,
+                is_booked=True
+            )
+            for day in range(3)
+        ]
+        self.recent = DoctorSchedule.objects.create(
+            doctor=self.doctor,
+            date=today - timedelta(days=10),
+            timeslot=1,
+            is_booked=True
+        )
+        self.appointments = [
+            Appointment.objects.create(
+                doctor_schedule=slot,
+                first_name="test_first_name",
+                last_name="test_last_name",
+                email="test@test.com",
+                phone="+380682222222",
+                insurance_number=f"{number:010d}",
+            )
+            for number, slot in enumerate(self.old_slots + [self.recent])
+        ]
+
+    def test_moves_old_slots_and_appointments_in_batches(self):
+        out = StringIO()
+        call_command("archive_data", days=365, batch_size=2, stdout=out)
+        self.assertIn("Archived 3 slots and 3 appointments", out.getvalue())
+        self.assertEqual(
+            list(DoctorSchedule.objects.values_list("pk", flat=True)),
+            [self.recent.pk]
+        )
+        self.assertEqual(
+            list(Appointment.objects.values_list("pk", flat=True)),
+            [self.appointments[-1].pk]
+        )
+        archived = ArchivedAppointment.objects.select_related(
+            "doctor_schedule"
+        ).get(pk=self.appointments[0].pk)
+        self.assertEqual(archived.doctor_schedule.pk, self.old_slots[0].pk)
+        self.assertEqual(archived.doctor_schedule.date, self.old_slots[0].date)
+        self.assertEqual(archived.insurance_number, "0000000000")
+        self.assertEqual(ArchivedDoctorSchedule.objects.count(), 3)
+
+    def test_counters_include_archive(self):
+        call_command("archive_data", days=365, stdout=StringIO())
+        cache.clear()
+        values = counters.get_counters()
+        self.assertEqual(values["num_appointments"], 4)
+        self.assertEqual(values["num_patients"], 4)
+
+    def test_archived_patient_is_not_counted_twice(self):
+        call_command("archive_data", days=365, stdout=StringIO())
+        self.assertEqual(counters.get_counters()["num_patients"], 4)
+        slot = DoctorSchedule.objects.create(
+            doctor=self.doctor,
+            date=timezone.localdate() + timedelta(days=1),
+            timeslot=2,
+            is_booked=True
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            Appointment.objects.create(
+                doctor_schedule=slot,
+                first_name="test_first_name",
+                last_name="test_last_name",
+                email="test@test.com",
+                phone="+380682222222",
+                insurance_number="0000000000",
+            )
+        values = counters.get_counters()
+        self.assertEqual(values["num_appointments"], 5)
+        self.assertEqual(values["num_patients"], 4)
@@ -0,0 +1,233 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from doctors_service.availability import rebuild_daily_availability
+from doctors_service.models import (
+    DailyAvailability,
+    DoctorSchedule,
+    DoctorSpecialty
+)
+from doctors_service.scheduling import generate_schedule
+
+AVAILABILITY_URL = reverse("doctors_service:availability-search")
+API_AVAILABILITY_URL = reverse("doctors_service:api-availability-search")
+
+
+class AvailabilitySearchTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.cardiology = DoctorSpecialty.objects.create(
+            specialty="Cardiology"
+        )
+        self.neurology = DoctorSpecialty.objects.create(
+            specialty="Neurology"
+        )
+        self.doctors = [
+            get_user_model().objects.create(
+                first_name=f"test_first_name_{number}",
+                last_name="test_last_name",
+                password="<PASSWORD>",
+                username=f"test_username_{number}",
+                licence_number=f"TES1234{number}",
+                city=city,
+                hospital="test_hospital",
+            )
+            for number, city in enumerate(("Kyiv", "kyiv", "Lviv"))
+        ]
+        for doctor in self.doctors:
+            doctor.specialty.add(self.cardiology)
+        self.tomorrow = timezone.localdate() + timedelta(days=1)
+        self.later = DoctorSchedule.objects.create(
+            doctor=self.doctors[0],
+            date=self.tomorrow + timedelta(days=1),
+            timeslot=0
+        )
+        self.earlier = DoctorSchedule.objects.create(
+            doctor=self.doctors[1], date=self.tomorrow, timeslot=5
+        )
+        self.earliest = DoctorSchedule.objects.create(
+            doctor=self.doctors[0], date=self.tomorrow, timeslot=2
+        )
+        DoctorSchedule.objects.create(
+            doctor=self.doctors[0],
+            date=self.tomorrow,
+            timeslot=1,
+            is_booked=True
+        )
+        DoctorSchedule.objects.create(
+            doctor=self.doctors[2], date=self.tomorrow, timeslot=0
+        )
+        self.query = {"specialty": self.cardiology.pk, "city": "KYIV"}
+
+    def test_returns_earliest_free_slots_across_doctors(self):
+        response = self.client.get(AVAILABILITY_URL, self.query)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            list(response.context["slots_list"]),
+            [self.earliest, self.earlier, self.later]
+        )
+
+    def test_filters_by_date_range_and_specialty(self):
+        response = self.client.get(AVAILABILITY_URL, {
+            **self.query,
+            "date_from": self.tomorrow + timedelta(days=1),
+            "date_to": self.tomorrow + timedelta(days=3),
+        })
+        self.assertEqual(list(response.context["slots_list"]), [self.later])
+
+        response = self.client.get(
+            AVAILABILITY_URL, {"specialty": self.neurology.pk}
+        )
+        self.assertEqual(list(response.context["slots_list"]), [])
+
+    def test_matches_part_of_non_ascii_city(self):
+        self.doctors[2].city = "Київ"
+        self.doctors[2].save()
+        for city in ("Київ", "Ки"):
+            response = self.client.get(AVAILABILITY_URL, {"city": city})
+            self.assertEqual(
+                [slot.doctor for slot in response.context["slots_list"]],
+                [self.doctors[2]]
+            )
+
+    def test_page_costs_two_queries(self):
+        # The slots with their doctors and the specialty choices.
+        with self.assertNumQueries(2):
+            self.client.get(AVAILABILITY_URL, {"city": "kyiv"})
+
+    def test_api_returns_paginated_slots(self):
+        response = self.client.get(
+            API_AVAILABILITY_URL, {**self.query, "limit": 2}
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["results"][0], {
+            "id": self.earliest.pk,
+            "date": self.tomorrow.isoformat(),
+            "timeslot": 2,
+            "time": "11:00 – 12:00",
+            "doctor_id": self.doctors[0].pk,
+            "doctor_first_name": "test_first_name_0",
+            "doctor_last_name": "test_last_name",
+            "doctor_city": "Kyiv",
+            "doctor_hospital": "test_hospital",
+        })
+        next_page = self.client.get(data["next"]).json()
+        self.assertEqual(
+            [slot["id"] for slot in data["results"] + next_page["results"]],
+            [self.earliest.pk, self.earlier.pk, self.later.pk]
+        )
+        self.assertIsNone(next_page["next"])
+
+    def test_api_rejects_invalid_date_range(self):
+        response = self.client.get(API_AVAILABILITY_URL, {
+            "date_from": self.tomorrow,
+            "date_to": self.tomorrow - timedelta(days=1),
+        })
+        self.assertEqual(response.status_code, 400)
+
+
+class DailyAvailabilityTest(TestCase):
+
+    def setUp(self):
+        self.doctor = get_user_model().objects.create(
+            username="test_username",
+            licence_number="TES12345",
+            city="Kyiv",
+            hospital="test_hospital",
+        )
+        self.tomorrow = timezone.localdate() + timedelta(days=1)
+
+    def free_slots(self):
+        return dict(
+            DailyAvailability.objects.filter(
+                doctor=self.doctor
+            ).values_list("date", "free_slots")
+        )
+
+    def test_single_slot_writes_update_mask(self):
+        slot = DoctorSchedule.objects.create(
+            doctor=self.doctor, date=self.tomorrow, timeslot=1
+        )
+        DoctorSchedule.objects.create(
+            doctor=self.doctor, date=self.tomorrow, timeslot=7
+        )
+        self.assertEqual(self.free_slots(), {self.tomorrow: 0b10000010})
+
+        slot.delete()
+        self.assertEqual(self.free_slots(), {self.tomorrow: 0b10000000})
+        self.assertEqual(
+            DailyAvailability.objects.get(doctor=self.doctor).timeslots,
+            [7]
+        )
+
+    def test_deleting_doctor_does_not_recount_each_slot(self):
+        def delete_queries(days):
+            doctor = get_user_model().objects.create(
+                username=f"test_username_{days}",
+                licence_number=f"TES5432{days}",
+            )
+            DoctorSchedule.objects.bulk_create(
+                DoctorSchedule(doctor=doctor,
+                               date=self.tomorrow + timedelta(days=day),
+                               timeslot=0)
+                for day in range(days)
+            )
+            rebuild_daily_availability()
+            with CaptureQueriesContext(connection) as queries:
+                doctor.delete()
+            return len(queries)
+
+        self.assertEqual(delete_queries(1), delete_queries(20))
+        self.assertFalse(DailyAvailability.objects.exists())
+
+    def test_generated_schedule_is_synced(self):
+        generate_schedule(
+            self.doctor.pk,
+            self.tomorrow,
+            self.tomorrow + timedelta(days=6),
+            [(self.tomorrow.weekday(), 0), (self.tomorrow.weekday(), 3)]
+        )
+        self.assertEqual(self.free_slots(), {self.tomorrow: 0b1001})
+
+    def test_booking_clears_timeslot_bit(self):
+        slot = DoctorSchedule.objects.create(
+            doctor=self.doctor, date=self.tomorrow, timeslot=2
+        )
+        DoctorSchedule.objects.create(
+            doctor=self.doctor, date=self.tomorrow, timeslot=4
+        )
+        self.client.post(reverse("doctors_service:appointment-form"), {
+            "doctor": self.doctor.pk,
+            "doctor_schedule": slot.pk,
+            "first_name": "test_first_name",
+            "last_name": "test_last_name",
+            "email": "test@test.com",
+            "phone": "+380682222222",
+            "insurance_number": "1234567890",
+        })
+        self.assertEqual(self.free_slots(), {self.tomorrow: 0b10000})
+
+    def test_fully_booked_day_is_not_available(self):
+        DoctorSchedule.objects.bulk_create([
+            DoctorSchedule(doctor=self.doctor, date=self.tomorrow,
+                           timeslot=0, is_booked=True),
+            DoctorSchedule(doctor=self.doctor,
+                           date=self.tomorrow + timedelta(days=1),
+                           timeslot=0),
+        ])
+        self.assertEqual(rebuild_daily_availability(), 1)
+        self.assertEqual(
+            list(DailyAvailability.objects.available().values_list(
+                "date", flat=True
+            )),
+            [self.tomorrow + timedelta(days=1)]
+        )
@@ -0,0 +1,66 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.urls import get_resolver
+
+from doctors_service.benchmark import route_requests, run_benchmark
+from doctors_service.factories import seed
+from doctors_service.models import Doctor
+
+
+class BenchmarkTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        seed(doctors=6, days=3)
+
+    def test_every_route_is_benchmarked(self):
+        resolver = get_resolver("doctors_service.urls")
+        names = {
+            pattern.name for pattern in resolver.url_patterns
+        }
+        self.assertEqual(set(route_requests()), names)
+
+    def test_every_route_responds(self):
+        results = run_benchmark(repeat=2, user=Doctor.objects.first())
+        for name, result in results.items():
+            self.assertEqual(result["status_code"], 200, name)
+
+    def test_query_counts_do_not_grow_with_data(self):
+        # An N+1 shows up as a route whose query count follows the
+        # number of rows on the page.
+        user = Doctor.objects.first()
+        small = run_benchmark(repeat=2, user=user)
+        seed(doctors=12, days=6)
+        cache.clear()
+        large = run_benchmark(repeat=2, user=user)
+        for name in small:
+            self.assertEqual(
+                small[name]["queries"],
+                large[name]["queries"],
+                name
+            )
+
+    def test_command_fails_on_budget_violation(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        budget = Path(directory.name) / "budget.json"
+        output = Path(directory.name) / "results.json"
+        budget.write_text(json.dumps({"doctors-list": {"queries": 0}}))
+
+        with self.assertRaisesMessage(CommandError, "doctors-list"):
+            call_command(
+                "benchmark",
+                repeat=1,
+                budget=str(budget),
+                output=str(output),
+                stdout=StringIO(),
+            )
+        results = json.loads(output.read_text())
+        self.assertIn("p95_ms", results["doctors-list"])
@@ -0,0 +1,152 @@
+import threading
+import time
+
+from django.contrib.auth import get_user_model
+from django.db import connection, IntegrityError, OperationalError
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+
+from doctors_service.booking import book_appointment, SlotAlreadyBooked
+from doctors_service.models import Appointment, DoctorSchedule
+
+APPOINTMENT_FORM = reverse("doctors_service:appointment-form")
+
+
+def create_doctor():
+    return get_user_model().objects.create(
+        first_name="test_first_name",
+        last_name="test_last_name",
+        password="<PASSWORD>",
+        username="test_username",
+        licence_number="TES12345",
+        city="test_city",
+        hospital="test_hospital",
+    )
+
+
+def new_appointment(schedule, insurance_number):
+    return Appointment(
+        doctor_id=schedule.doctor_id,
+        doctor_schedule=schedule,
+        first_name="test_patient_first_name",
+        last_name="test_patient_last_name",
+        email="test123@test.com",
+        phone="+380682222222",
+        insurance_number=insurance_number,
+    )
+
+
+class BookAppointmentTest(TestCase):
+
+    def setUp(self):
+        self.doctor = create_doctor()
+        self.schedule = DoctorSchedule.objects.create(
+            doctor=self.doctor,
+            date="2026-10-20",
+            timeslot=5,
+        )
+
+    def test_booking_marks_slot_as_booked(self):
+        appointment = book_appointment(
+            new_appointment(self.schedule, "2345678765")
+        )
+        self.schedule.refresh_from_db()
+        self.assertTrue(self.schedule.is_booked)
+        self.assertTrue(Appointment.objects.filter(pk=appointment.pk).exists())
+
+    def test_second_booking_of_stale_slot_is_rejected(self):
+        first = new_appointment(self.schedule, "2345678765")
+        second = new_appointment(self.schedule, "2345678766")
+        book_appointment(first)
+
+        with self.assertRaises(SlotAlreadyBooked):
+            book_appointment(second)
+        self.assertEqual(
+            Appointment.objects.filter(doctor_schedule=self.schedule).count(),
+            1
+        )
+
+    def test_failed_appointment_save_releases_slot(self):
+        book_appointment(new_appointment(self.schedule, "2345678765"))
+        other_slot = DoctorSchedule.objects.create(
+            doctor=self.doctor,
+            date="2026-10-20",
+            timeslot=6,
+        )
+
+        with self.assertRaises(IntegrityError):
+            book_appointment(new_appointment(other_slot, "2345678765"))
+        other_slot.refresh_from_db()
+        self.assertFalse(other_slot.is_booked)
+
+    def test_view_reports_taken_slot(self):
+        form_data = {
+            "doctor": self.doctor.pk,
+            "doctor_schedule": self.schedule.pk,
+            "first_name": "test_patient_first_name",
+            "last_name": "test_patient_last_name",
+            "email": "test123@test.com",
+            "phone": "+380682222222",
+            "insurance_number": "2345678765",
+        }
+        DoctorSchedule.objects.filter(pk=self.schedule.pk).update(
+            is_booked=True
+        )
+        response = self.client.post(APPOINTMENT_FORM, data=form_data)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Appointment.objects.exists())
+
+
+class ConcurrentBookingTest(TransactionTestCase):
+    workers = 12
+
+    def setUp(self):
+        self.doctor = create_doctor()
+        self.schedule = DoctorSchedule.objects.create(
+            doctor=self.doctor,
+            date="2026-10-20",
+            timeslot=5,
+        )
+
+    def book_in_thread(self, number, barrier, results):
+        appointment = new_appointment(self.schedule, f"{number:010d}")
+        barrier.wait()
+        try:
+            # SQLite reports concurrent writers as a locked table instead
+            # of waiting on the row like PostgreSQL does, so the client
+            # retries just as a real patient would resubmit the form.
+            for _ in range(100):
+                try:
+                    book_appointment(appointment)
+                    results.append("booked")
+                    return
+                except SlotAlreadyBooked:
+                    results.append("taken")
+                    return
+                except OperationalError:
+                    time.sleep(0.01)
+            results.append("error")
+        finally:
+            connection.close()
+
+    def test_only_one_of_parallel_bookings_wins(self):
+        barrier = threading.Barrier(self.workers)
+        results = []
+        threads = [
+            threading.Thread(
+                target=self.book_in_thread,
+                args=(number, barrier, results)
+            )
+            for number in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results.count("booked"), 1)
+        self.assertEqual(results.count("taken"), self.workers - 1)
+        self.assertEqual(
+            Appointment.objects.filter(doctor_schedule=self.schedule).count(),
+            1
+        )
@@ -0,0 +1,83 @@
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from doctors_service.models import DoctorSpecialty
+
+DOCTORS_LIST = reverse("doctors_service:doctors-list")
+SPECIALTIES_LIST = reverse("doctors_service:specialties-list")
+
+
+class PublicPageCacheTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.specialty = DoctorSpecialty.objects.create(
+            specialty="Cardiology"
+        )
+        self.doctor = self.create_doctor(1)
+
+    def create_doctor(self, number):
+        return get_user_model().objects.create(
+            first_name=f"test_first_name_{number}",
+            last_name="test_last_name",
+            password="<PASSWORD>",
+            username=f"test_username_{number}",
+            licence_number=f"TES1234{number}",
+            city="test_city",
+            hospital="test_hospital",
+        )
+
+    def test_repeated_anonymous_request_is_served_from_cache(self):
+        first = self.client.get(DOCTORS_LIST, {"query": "test"})
+        with self.assertNumQueries(0):
+            second = self.client.get(DOCTORS_LIST, {"query": "test"})
+        self.assertEqual(first.content, second.content)
+
+    def test_cache_is_keyed_by_query_string(self):
+        self.client.get(DOCTORS_LIST)
+        response = self.client.get(DOCTORS_LIST, {"query": "missing"})
+        self.assertNotContains(response, self.doctor.first_name)
+
+    def test_doctor_change_invalidates_cached_page(self):
+        self.client.get(DOCTORS_LIST)
+        doctor = self.create_doctor(2)
+        self.assertContains(self.client.get(DOCTORS_LIST), doctor.first_name)
+
+    def test_specialty_assignment_invalidates_cached_page(self):
+        self.assertNotContains(self.client.get(DOCTORS_LIST), "Cardiology")
+        self.doctor.specialty.add(self.specialty)
+        self.assertContains(self.client.get(DOCTORS_LIST), "Cardiology")
+
+    def test_specialty_rename_invalidates_cached_page(self):
+        self.client.get(SPECIALTIES_LIST)
+        self.specialty.specialty = "Cardiac surgery"
+        self.specialty.save()
+        self.assertContains(self.client.get(SPECIALTIES_LIST), "Cardiac")
+
+    def test_logged_in_users_bypass_page_cache(self):
+        self.client.get(SPECIALTIES_LIST)
+        self.client.force_login(self.doctor)
+        response = self.client.get(SPECIALTIES_LIST)
+        self.assertContains(response, self.doctor.username)
+
+
+class SerializingCacheBackendTest(PublicPageCacheTest):
+    # The file backend pickles every value like Redis or memcached do.
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased."
+                           "FileBasedCache",
+                "LOCATION": directory.name,
+            }
+        })
+        settings.enable()
+        self.addCleanup(settings.disable)
+        super().setUp()
@@ -0,0 +1,98 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from doctors_service import counters
+from doctors_service.models import (
+    Appointment,
+    DoctorSchedule,
+    DoctorSpecialty
+)
+
+INDEX_URL = reverse("doctors_service:index")
+
+
+class CountersTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.doctor = get_user_model().objects.create(
+            first_name="test_first_name",
+            last_name="test_last_name",
+            password="<PASSWORD>",
+            username="test_username",
+            licence_number="TES12345",
+            city="test_city",
+            hospital="test_hospital",
+        )
+        DoctorSpecialty.objects.create(specialty="Cardiology")
+        self.schedule = DoctorSchedule.objects.create(
+            doctor=self.doctor,
+            date="2026-10-20",
+            timeslot=5,
+        )
+
+    def create_appointment(self, insurance_number):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Appointment.objects.create(
+                doctor=self.doctor,
+                doctor_schedule=self.schedule,
+                first_name="test_patient_first_name",
+                last_name="test_patient_last_name",
+                email="test123@test.com",
+                phone="+380682222222",
+                insurance_number=insurance_number,
+            )
+
+    def test_index_counts_records(self):
+        self.create_appointment("2345678765")
+        response = self.client.get(INDEX_URL)
+        self.assertEqual(response.context["num_doctors"], 1)
+        self.assertEqual(response.context["num_specialties"], 1)
+        self.assertEqual(response.context["num_appointments"], 1)
+        self.assertEqual(response.context["num_patients"], 1)
+
+    def test_index_with_warm_cache_runs_no_queries(self):
+        counters.get_counters()
+        with self.assertNumQueries(0):
+            self.client.get(INDEX_URL)
+
+    def test_counters_follow_creation_and_deletion(self):
+        counters.get_counters()
+        appointment = self.create_appointment("2345678765")
+        self.create_appointment("2345678766")
+        self.assertEqual(counters.get_counters()["num_appointments"], 2)
+        self.assertEqual(counters.get_counters()["num_patients"], 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            appointment.delete()
+        self.assertEqual(counters.get_counters()["num_appointments"], 1)
+        self.assertEqual(counters.get_counters()["num_patients"], 1)
+
+    def test_deleting_doctor_updates_cascaded_counters(self):
+        self.create_appointment("2345678765")
+        counters.get_counters()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.doctor.delete()
+        self.assertEqual(
+            counters.get_counters(),
+            {
+                "num_doctors": 0,
+                "num_specialties": 1,
+                "num_appointments": 0,
+                "num_patients": 0,
+            }
+        )
+
+    def test_reconcile_command_fixes_drift(self):
+        counters.get_counters()
+        DoctorSpecialty.objects.bulk_create(
+            [DoctorSpecialty(specialty="Dermatology")]
+        )
+        self.assertEqual(counters.get_counters()["num_specialties"], 1)
+        call_command("reconcile_counters", stdout=StringIO())
+        self.assertEqual(counters.get_counters()["num_specialties"], 2)
@@ -0,0 +1,120 @@
+import csv
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from doctors_service.models import Appointment, DoctorSchedule
+
+APPOINTMENTS_EXPORT = reverse("doctors_service:appointments-export")
+SCHEDULES_EXPORT = reverse("doctors_service:schedules-export")
+
+
+class ExportTest(TestCase):
+
+    def setUp(self):
+        self.doctors = [
+            get_user_model().objects.create(
+                first_name=f"test_first_name_{number}",
+                last_name="test_last_name",
+                password="<PASSWORD>",
+                username=f"test_username_{number}",
+                licence_number=f"TES1234{number}",
+                city="test_city",
+                hospital="test_hospital",
+            )
+            for number in range(2)
+        ]
+        self.appointments = []
+        for day, doctor in zip((20, 21, 22), self.doctors * 2):
+            schedule = DoctorSchedule.objects.create(
+                doctor=doctor,
+                date=f"2026-10-{day}",
+                timeslot=2,
+                is_booked=True
+            )
+            self.appointments.append(Appointment.objects.create(
+                doctor=doctor,
+                doctor_schedule=schedule,
+                first_name="test_first_name",
+                last_name="test_last_name",
+                email="test@test.com",
+                phone="+380682222222",
+                insurance_number=f"123456789{day % 10}",
+            ))
+        DoctorSchedule.objects.create(
+            doctor=self.doctors[0], date="2026-10-20", timeslot=3
+        )
+        self.client.force_login(self.doctors[0])
+
+    def read(self, response):
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_requires_login(self):
+        self.client.logout()
+        response = self.client.get(APPOINTMENTS_EXPORT)
+        self.assertEqual(response.status_code, 302)
+
+    def test_appointments_csv(self):
+        response = self.client.get(APPOINTMENTS_EXPORT)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(csv.DictReader(io.StringIO(self.read(response))))
+        self.assertEqual(
+            [int(row["id"]) for row in rows],
+            [appointment.pk for appointment in self.appointments]
+        )
+        self.assertEqual(rows[0]["date"], "2026-10-20")
+        self.assertEqual(rows[0]["time"], "11:00 – 12:00")
+        self.assertEqual(rows[1]["doctor_first_name"], "test_first_name_1")
+        self.assertEqual(rows[0]["phone"], "+380682222222")
+
+    def test_appointments_jsonl_filtered_by_date_and_doctor(self):
+        response = self.client.get(APPOINTMENTS_EXPORT, {
+            "format": "jsonl",
+            "date_from": "2026-10-20",
+            "date_to": "2026-10-21",
+            "doctor": self.doctors[0].pk,
+        })
+        rows = [json.loads(line) for line in self.read(response).split("\n")
+                if line]
+        self.assertEqual(
+            [row["id"] for row in rows],
+            [self.appointments[0].pk]
+        )
+
+    def test_schedules_export(self):
+        response = self.client.get(
+            SCHEDULES_EXPORT,
+            {"date_to": "2026-10-20", "format": "jsonl"}
+        )
+        rows = [json.loads(line) for line in self.read(response).split("\n")
+                if line]
+        self.assertEqual(
+            [(row["timeslot"], row["is_booked"]) for row in rows],
+            [(2, True), (3, False)]
+        )
+
+    def test_invalid_filters_are_rejected(self):
+        response = self.client.get(APPOINTMENTS_EXPORT, {"format": "xml"})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(APPOINTMENTS_EXPORT, {"date_from": "x"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_command(self):
+        output = io.StringIO()
+        call_command(
+            "export_data",
+            "appointments",
+            "--doctor", str(self.doctors[1].pk),
+            "--chunk-size", "1",
+            stdout=output
+        )
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        self.assertEqual(
+            [int(row["id"]) for row in rows],
+            [self.appointments[1].pk]
+        )
@@ -1,5 +1,9 @@
+from datetime import datetime, timedelta
+from unittest import mock
+
 from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
 from doctors_service.forms import (
     DoctorCreationForm,
     DoctorUpdateForm,
@@ -130,7 +134,7 @@ class AppointmentCreateFormTest(TestCase):
 
         doctor_schedule = DoctorSchedule.objects.create(
             doctor=doctor,
-            date="2024-11-11",
+            date=timezone.localdate() + timedelta(days=1),
             timeslot=2,
             is_booked=False
         )
@@ -173,3 +177,74 @@ class AppointmentCreateFormTest(TestCase):
             form.cleaned_data["insurance_number"],
             form_data["insurance_number"]
         )
+
+
+class AppointmentSlotValidationTest(TestCase):
+
+    def setUp(self):
+        self.doctor, self.other_doctor = [
+            get_user_model().objects.create(
+                first_name="test_first_name",
+                last_name="test_last_name",
+                password="<PASSWORD>",
+                username=f"test_username{number}",
+                licence_number=f"TES1234{number}",
+                city="test_city",
+                hospital="test_hospital",
+            )
+            for number in range(2)
+        ]
+        self.tomorrow = timezone.localdate() + timedelta(days=1)
+
+    def form_for(self, schedule, doctor=None):
+        return AppointmentCreationForm(data={
+            "doctor": (doctor or self.doctor).pk,
+            "doctor_schedule": schedule.pk,
+            "first_name": "Test",
+            "last_name": "Test",
+            "email": "test@test.com",
+            "phone": "+380682444444",
+            "insurance_number": "9876543456",
+        })
+
+    def test_doctor_and_slot_validated_in_one_query(self):
+        schedule = DoctorSchedule.objects.create(
+            doctor=self.doctor, date=self.tomorrow, timeslot=2
+        )
+        form = self.form_for(schedule)
+        # The slot lookup and the unique insurance number check.
+        with self.assertNumQueries(2):
+            self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data["doctor"], self.doctor)
+
+    def test_booked_slot_is_rejected(self):
+        schedule = DoctorSchedule.objects.create(
+            doctor=self.doctor, date=self.tomorrow, timeslot=2, is_booked=True
+        )
+        form = self.form_for(schedule)
+        self.assertFalse(form.is_valid())
+        self.assertIn("doctor_schedule", form.errors)
+
+    def test_slot_of_another_doctor_is_rejected(self):
+        schedule = DoctorSchedule.objects.create(
+            doctor=self.other_doctor, date=self.tomorrow, timeslot=2
+        )
+        self.assertFalse(self.form_for(schedule).is_valid())
+
+    def test_past_and_started_slots_are_rejected(self):
+        today = timezone.localdate()
+        yesterday = DoctorSchedule.objects.create(
+            doctor=self.doctor, date=today - timedelta(days=1), timeslot=7
+        )
+        started = DoctorSchedule.objects.create(
+            doctor=self.doctor, date=today, timeslot=3
+        )
+        later = DoctorSchedule.objects.create(
+            doctor=self.doctor, date=today, timeslot=4
+        )
+        noon = timezone.make_aware(datetime.combine(today, datetime.min.time())
+                                   + timedelta(hours=12, minutes=30))
+        with mock.patch("django.utils.timezone.now", return_value=noon):
+            self.assertFalse(self.form_for(yesterday).is_valid())
+            self.assertFalse(self.form_for(started).is_valid())
+            self.assertTrue(self.form_for(later).is_valid())
@@ -0,0 +1,206 @@
+import io
+import json
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from doctors_service import counters
+from doctors_service.imports import import_doctors, import_slots, read_rows
+from doctors_service.models import Doctor, DoctorSchedule, DoctorSpecialty
+
+DOCTORS_CSV = (
+    "username,first_name,last_name,email,licence_number,city,hospital,"
+    "specialty"
+) + """
+ivan,Ivan,Franko,ivan@example.com,ABC12345,Lviv,Hospital,Cardiology;Surgery
+olha,Olha,Kobylianska,olha@example.com,ABC12346,Rivne,Hospital,Cardiology
+bad,Bad,Licence,bad@example.com,abc12347,Kyiv,Hospital 3,Cardiology
+copy,Copy,Licence,copy@example.com,ABC12345,Kyiv,Hospital 3,Cardiology
+taken,Taken,Licence,taken@example.com,TES12345,Kyiv,Hospital 3,Cardiology
+nospecialty,No,Specialty,no@example.com,ABC12348,Kyiv,Hospital 3,
+"""
+
+
+class ImportTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        DoctorSpecialty.objects.create(specialty="Cardiology")
+        self.doctor = get_user_model().objects.create(
+            first_name="test_first_name",
+            last_name="test_last_name",
+            password="<PASSWORD>",
+            username="test_username",
+            licence_number="TES12345",
+            city="test_city",
+            hospital="test_hospital",
+        )
+
+    def test_import_doctors_reports_invalid_rows(self):
+        result = import_doctors(
+            read_rows(io.StringIO(DOCTORS_CSV), "csv"),
+            batch_size=2
+        )
+        self.assertEqual(result["created"], 2)
+        self.assertEqual(
+            [number for number, _ in result["errors"]],
+            [3, 4, 5, 6]
+        )
+        ivan = Doctor.objects.get(username="ivan")
+        self.assertFalse(ivan.has_usable_password())
+        self.assertEqual(
+            sorted(ivan.specialty.values_list("specialty", flat=True)),
+            ["Cardiology", "Surgery"]
+        )
+        self.assertEqual(
+            DoctorSpecialty.objects.filter(specialty="Cardiology").count(), 1
+        )
+
+    def test_import_doctors_in_few_queries(self):
+        # Per batch: 2 duplicate checks, 2 specialty queries and 2 inserts.
+        rows = read_rows(io.StringIO(DOCTORS_CSV), "csv")
+        with self.assertNumQueries(10):
+            import_doctors(rows)
+
+    def test_import_refreshes_counters(self):
+        self.assertEqual(counters.get_counters()["num_doctors"], 1)
+        import_doctors(read_rows(io.StringIO(DOCTORS_CSV), "csv"))
+        self.assertEqual(counters.get_counters()["num_doctors"], 3)
+
+    def test_import_slots_from_jsonl(self):
+        DoctorSchedule.objects.create(
+            doctor=self.doctor, date="2026-10-20", timeslot=1
+        )
+        lines = "\n".join([
+            '{"licence_number": "TES12345", "date": "2026-10-20", '
+            '"timeslot": 2}',
+            '{"licence_number": "TES12345", "date": "2026-10-20", '
+            '"timeslot": 1}',
+            '{"licence_number": "XYZ00000", "date": "2026-10-20", '
+            '"timeslot": 2}',
+            '{"licence_number": "TES12345", "date": "20.10.2026", '
+            '"timeslot": 2}',
+            '{"licence_number": "TES12345", "date": "2026-10-20", '
+            '"timeslot": 9}',
+        ])
+        result = import_slots(read_rows(io.StringIO(lines), "jsonl"))
+        self.assertEqual(result["created"], 1)
+        self.assertEqual(
+            [number for number, _ in result["errors"]],
+            [2, 3, 4, 5]
+        )
+        self.assertEqual(self.doctor.doctor_schedule.count(), 2)
+
+    def test_import_reports_unusable_jsonl_lines(self):
+        lines = "\n".join([
+            '{"licence_number": "TES12345", "date": "2026-10-20", '
+            '"timeslot": 2}',
+            '{"licence_number": "TES12345",',
+            '["TES12345", "2026-10-20", 3]',
+        ])
+        result = import_slots(read_rows(io.StringIO(lines), "jsonl"))
+        self.assertEqual(result["created"], 1)
+        self.assertEqual(result["errors"], [
+            (2, "Invalid JSON"),
+            (3, "Row should be a JSON object"),
+        ])
+
+    def test_import_doctors_rejects_too_long_values(self):
+        rows = read_rows(io.StringIO(DOCTORS_CSV.replace(
+            "Rivne", "R" * 256
+        )), "csv")
+        result = import_doctors(rows)
+        self.assertIn(
+            (2, "city should be at most 255 characters"),
+            result["errors"]
+        )
+        self.assertFalse(Doctor.objects.filter(username="olha").exists())
+
+    def test_import_doctors_rejects_invalid_jsonl_specialties(self):
+        lines = "\n".join(
+            json.dumps({
+                "username": f"jsonl{number}",
+                "first_name": "Json",
+                "last_name": "Lines",
+                "email": f"jsonl{number}@example.com",
+                "licence_number": f"JSO1234{number}",
+                "city": "Kyiv",
+                "hospital": "Hospital",
+                "specialty": specialty,
+            })
+            for number, specialty in enumerate(
+                [5, True, [None, "Surgery"], [1], ["Surgery"]], start=1
+            )
+        )
+        result = import_doctors(read_rows(io.StringIO(lines), "jsonl"))
+        self.assertEqual(result["created"], 1)
+        self.assertEqual(result["errors"], [
+            (number, "specialty should be a string or a list of strings")
+            for number in range(1, 5)
+        ])
+        self.assertFalse(
+            DoctorSpecialty.objects.filter(specialty="None").exists()
+        )
+
+    def test_import_command(self):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with tempfile.NamedTemporaryFile("w", suffix=".csv") as file:
+            file.write(DOCTORS_CSV)
+            file.flush()
+            call_command(
+                "import_data", "doctors", file.name,
+                stdout=stdout, stderr=stderr
+            )
+        self.assertIn("Created 2 doctors, skipped 4 rows", stdout.getvalue())
+        self.assertIn("Row 3: First 3 characters", stderr.getvalue())
+
+    def test_admin_upload(self):
+        admin = get_user_model().objects.create_superuser(
+            username="admin", password="admin123"
+        )
+        self.client.force_login(admin)
+        response = self.client.post(
+            reverse("admin:doctors_service_doctor_import"),
+            {
+                "import_name": "doctors",
+                "file": SimpleUploadedFile(
+                    "doctors.csv", DOCTORS_CSV.encode()
+                ),
+            },
+            follow=True
+        )
+        self.assertContains(response, "Created 2 doctors, skipped 4 rows")
+        self.assertContains(response, "Row 4: Duplicate licence number")
+
+    def test_admin_upload_requires_add_permissions(self):
+        staff = get_user_model().objects.create_user(
+            username="staff", password="staff123", is_staff=True
+        )
+        staff.user_permissions.set(Permission.objects.filter(
+            codename__in=["view_doctor", "add_doctor", "add_doctorspecialty"]
+        ))
+        self.client.force_login(staff)
+        url = reverse("admin:doctors_service_doctor_import")
+        self.assertEqual(self.client.get(url).status_code, 403)
+        response = self.client.post(url, {
+            "import_name": "doctors",
+            "file": SimpleUploadedFile("doctors.csv", DOCTORS_CSV.encode()),
+        })
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Doctor.objects.filter(username="ivan").exists())
+        changelist = reverse("admin:doctors_service_doctor_changelist")
+        self.assertNotContains(self.client.get(changelist), url)
+
+        staff.user_permissions.add(
+            Permission.objects.get(codename="add_doctorschedule")
+        )
+        staff = get_user_model().objects.get(pk=staff.pk)
+        self.client.force_login(staff)
+        self.assertEqual(self.client.get(url).status_code, 200)
@@ -0,0 +1,87 @@
+from asgiref.sync import iscoroutinefunction
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from doctors_patients_service.metrics import registry
+from doctors_patients_service.middleware import PerformanceMetricsMiddleware
+from doctors_service.models import DoctorSpecialty
+
+METRICS_URL = reverse("metrics")
+SPECIALTIES_URL = reverse("doctors_service:specialties-list")
+FREE_SLOTS_URL = reverse(
+    "doctors_service:api-doctor-free-slots", kwargs={"pk": 1}
+)
+
+
+class PerformanceMetricsTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        registry.reset()
+        DoctorSpecialty.objects.create(specialty="Cardiology")
+
+    def test_server_timing_header(self):
+        response = self.client.get(SPECIALTIES_URL)
+        timings = [
+            part.split(";")[0]
+            for part in response["Server-Timing"].split(", ")
+        ]
+        self.assertEqual(timings, ["total", "db", "tpl"])
+
+    async def test_async_views_are_timed_without_a_thread(self):
+        async def get_response(request):
+            pass
+
+        self.assertTrue(iscoroutinefunction(
+            PerformanceMetricsMiddleware(get_response)
+        ))
+        response = await self.async_client.get(FREE_SLOTS_URL)
+        self.assertIn("Server-Timing", response)
+        self.assertEqual(
+            registry.requests[
+                ("doctors_service:api-doctor-free-slots", "GET", 200)
+            ],
+            1
+        )
+
+    def test_requests_are_recorded_by_url_name(self):
+        response = self.client.get(SPECIALTIES_URL)
+        view = "doctors_service:specialties-list"
+        self.assertEqual(registry.requests[(view, "GET", 200)], 1)
+        self.assertGreater(registry.counters[("db_queries_total", view)], 0)
+        self.assertGreater(
+            registry.counters[("template_render_seconds_total", view)], 0
+        )
+        self.assertEqual(
+            registry.counters[("response_bytes_total", view)],
+            len(response.content)
+        )
+
+    def test_metrics_endpoint_exposes_prometheus_text(self):
+        self.client.get(SPECIALTIES_URL)
+        response = self.client.get(METRICS_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(
+            response,
+            'doctors_service_http_requests_total{'
+            'view="doctors_service:specialties-list",'
+            'method="GET",status="200"} 1'
+        )
+        self.assertContains(
+            response,
+            "# TYPE doctors_service_http_request_duration_seconds histogram"
+        )
+
+    @override_settings(METRICS_TOKEN="", METRICS_REQUIRE_TOKEN=True)
+    def test_metrics_endpoint_hidden_without_token_in_prod(self):
+        self.assertEqual(self.client.get(METRICS_URL).status_code, 404)
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_metrics_endpoint_requires_token(self):
+        self.assertEqual(self.client.get(METRICS_URL).status_code, 403)
+        response = self.client.get(
+            METRICS_URL,
+            HTTP_AUTHORIZATION="Bearer secret"
+        )
+        self.assertEqual(response.status_code, 200)
@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 from doctors_service.models import (
     DoctorSpecialty,
@@ -132,3 +133,55 @@ class ModelsTestCase(TestCase):
             patient_insurance_number
         )
         self.assertEqual(appointment.comments, comments)
+
+
+class AppointmentDoctorConsistencyTest(TestCase):
+
+    def setUp(self):
+        self.doctor, self.other_doctor = [
+            get_user_model().objects.create(
+                username=f"test_username_{number}",
+                licence_number=f"TES1234{number}",
+            )
+            for number in range(2)
+        ]
+        self.schedule = DoctorSchedule.objects.create(
+            doctor=self.doctor, date="2026-12-24", timeslot=1
+        )
+
+    def appointment(self, **kwargs):
+        return Appointment(
+            doctor_schedule=self.schedule,
+            first_name="test_first_name",
+            last_name="test_last_name",
+            email="test@test.com",
+            phone="+380682222222",
+            insurance_number="1234567890",
+            **kwargs
+        )
+
+    def test_doctor_is_taken_from_slot(self):
+        appointment = self.appointment(doctor=self.other_doctor)
+        appointment.save()
+        appointment.refresh_from_db()
+        self.assertEqual(appointment.doctor, self.doctor)
+
+    def test_database_rejects_other_doctor(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Appointment.objects.bulk_create(
+                [self.appointment(doctor=self.other_doctor)]
+            )
+        appointment = self.appointment()
+        appointment.save()
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Appointment.objects.filter(pk=appointment.pk).update(
+                doctor=self.other_doctor
+            )
+
+    def test_moving_slot_moves_appointments(self):
+        appointment = self.appointment()
+        appointment.save()
+        self.schedule.doctor = self.other_doctor
+        self.schedule.save()
+        appointment.refresh_from_db()
+        self.assertEqual(appointment.doctor, self.other_doctor)
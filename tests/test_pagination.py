@@ -0,0 +1,141 @@
+import re
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from doctors_service.models import Appointment, DoctorSchedule
+from doctors_service.pagination import encode_cursor
+
+DOCTORS_LIST = reverse("doctors_service:doctors-list")
+APPOINTMENTS_LIST = reverse("doctors_service:appointments-list")
+
+
+def next_link(response):
+    match = re.search(r'href="\?([^"]*)" class="page-link">next', (
+        response.content.decode()
+    ))
+    return match and match.group(1).replace("&amp;", "&")
+
+
+def previous_link(response):
+    match = re.search(r'href="\?([^"]*)" class="page-link">prev', (
+        response.content.decode()
+    ))
+    return match and match.group(1).replace("&amp;", "&")
+
+
+class KeysetPaginationTest(TestCase):
+
+    def setUp(self):
+        self.doctors = [
+            get_user_model().objects.create(
+                first_name="Name" if number % 2 else "Other",
+                last_name=f"Last_name_{number % 3}",
+                password="<PASSWORD>",
+                username=f"test_username_{number}",
+                licence_number=f"TES{number:05d}",
+                city="test_city",
+                hospital="test_hospital",
+            )
+            for number in range(12)
+        ]
+        self.doctors.sort(
+            key=lambda doctor: (doctor.first_name, doctor.last_name, doctor.pk)
+        )
+
+    def test_walk_doctors_forward_and_back(self):
+        pages = []
+        response = self.client.get(DOCTORS_LIST)
+        pages.append(list(response.context["doctors_list"]))
+        while query := next_link(response):
+            response = self.client.get(f"{DOCTORS_LIST}?{query}")
+            pages.append(list(response.context["doctors_list"]))
+
+        self.assertEqual([len(page) for page in pages], [5, 5, 2])
+        self.assertEqual(sum(pages, []), self.doctors)
+
+        response = self.client.get(
+            f"{DOCTORS_LIST}?{previous_link(response)}"
+        )
+        self.assertEqual(list(response.context["doctors_list"]), pages[1])
+        response = self.client.get(
+            f"{DOCTORS_LIST}?{previous_link(response)}"
+        )
+        self.assertEqual(list(response.context["doctors_list"]), pages[0])
+        self.assertIsNone(previous_link(response))
+
+    def test_pages_keep_search_query(self):
+        response = self.client.get(DOCTORS_LIST, {"query": "test"})
+        self.assertIn("query=test", next_link(response))
+
+    def test_no_count_query_and_constant_cost(self):
+        self.client.force_login(self.doctors[0])
+        response = self.client.get(DOCTORS_LIST)
+        with CaptureQueriesContext(connection) as first_page:
+            self.client.get(DOCTORS_LIST)
+        with CaptureQueriesContext(connection) as last_page:
+            response = self.client.get(
+                f"{DOCTORS_LIST}?{next_link(response)}"
+            )
+            self.client.get(f"{DOCTORS_LIST}?{next_link(response)}")
+        self.assertEqual(len(last_page) / 2, len(first_page))
+        for query in first_page.captured_queries:
+            self.assertNotIn("COUNT(", query["sql"])
+
+    def test_invalid_cursor_returns_not_found(self):
+        response = self.client.get(DOCTORS_LIST, {"after": "broken"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_cursor_past_last_row_gives_empty_page(self):
+        last = self.doctors[-1]
+        cursor = encode_cursor([last.first_name, last.last_name, last.pk])
+        response = self.client.get(DOCTORS_LIST, {"after": cursor})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context["doctors_list"]), [])
+        self.assertIsNone(previous_link(response))
+
+    def test_cursor_with_non_scalar_value_returns_not_found(self):
+        cursor = encode_cursor(["a", "b", {"x": 1}])
+        response = self.client.get(DOCTORS_LIST, {"after": cursor})
+        self.assertEqual(response.status_code, 404)
+
+    def test_cursor_with_oversized_int_returns_not_found(self):
+        cursor = encode_cursor(["a", "b", 2 ** 64])
+        response = self.client.get(DOCTORS_LIST, {"after": cursor})
+        self.assertEqual(response.status_code, 404)
+
+    def test_walk_appointments_in_schedule_order(self):
+        doctor = self.doctors[0]
+        self.client.force_login(doctor)
+        appointments = []
+        for number in range(7):
+            schedule = DoctorSchedule.objects.create(
+                doctor=doctor,
+                date=date(2026, 10, 20) - timedelta(days=number // 2),
+                timeslot=number % 2,
+            )
+            appointments.append(Appointment.objects.create(
+                doctor=doctor,
+                doctor_schedule=schedule,
+                first_name="test_patient_first_name",
+                last_name="test_patient_last_name",
+                email="test123@test.com",
+                phone="+380682222222",
+                insurance_number=f"{number:010d}",
+            ))
+
+        response = self.client.get(APPOINTMENTS_LIST)
+        first_page = list(response.context["appointments_list"])
+        response = self.client.get(
+            f"{APPOINTMENTS_LIST}?{next_link(response)}"
+        )
+        second_page = list(response.context["appointments_list"])
+        self.assertEqual(
+            first_page + second_page,
+            list(Appointment.objects.all())
+        )
+        self.assertIsNone(next_link(response))
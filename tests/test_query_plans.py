@@ -0,0 +1,145 @@
+import re
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import RequestFactory, TestCase
+
+from doctors_service.forms import AvailabilitySearchForm
+from doctors_service.models import Appointment, DoctorSchedule
+from doctors_service.views import AppointmentListView
+
+SCHEDULE_TABLE = DoctorSchedule._meta.db_table
+APPOINTMENT_TABLE = Appointment._meta.db_table
+
+
+class QueryPlanTestCase(TestCase):
+    doctors_count = 20
+    days_count = 60
+
+    @classmethod
+    def setUpTestData(cls):
+        doctors = get_user_model().objects.bulk_create(
+            get_user_model()(
+                username=f"doctor_{number}",
+                first_name=f"first_name_{number}",
+                last_name=f"last_name_{number}",
+                licence_number=f"TES{number:05d}",
+                city="test_city",
+                hospital="test_hospital",
+            )
+            for number in range(cls.doctors_count)
+        )
+        start = date(2026, 1, 1)
+        schedules = DoctorSchedule.objects.bulk_create(
+            DoctorSchedule(
+                doctor=doctor,
+                date=start + timedelta(days=day),
+                timeslot=timeslot,
+                is_booked=bool((day + timeslot) % 3),
+            )
+            for doctor in doctors
+            for day in range(cls.days_count)
+            for timeslot, _ in DoctorSchedule.TIMESLOT_LIST
+        )
+        Appointment.objects.bulk_create(
+            Appointment(
+                doctor_id=schedule.doctor_id,
+                doctor_schedule=schedule,
+                first_name="test_patient_first_name",
+                last_name="test_patient_last_name",
+                email="test123@test.com",
+                phone="+380682222222",
+                insurance_number=f"{number:010d}",
+            )
+            for number, schedule in enumerate(schedules)
+            if schedule.is_booked
+        )
+        cls.doctor = doctors[0]
+        cls.day = start + timedelta(days=cls.days_count // 2)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def assertNoFullScan(self, queryset, table):
+        plan = queryset.explain()
+        if connection.vendor == "postgresql":
+            full_scan = rf"Seq Scan on {table}\b"
+        else:
+            full_scan = rf"\bSCAN {table}\b"
+        self.assertIsNone(
+            re.search(full_scan, plan),
+            f"{table} is scanned sequentially:\n{plan}"
+        )
+
+
+class HotQueryPlanTest(QueryPlanTestCase):
+
+    def test_free_slots_of_doctor_use_index(self):
+        queryset = DoctorSchedule.objects.filter(
+            doctor_id=self.doctor.pk,
+            is_booked=False
+        )
+        self.assertNoFullScan(queryset, SCHEDULE_TABLE)
+
+    def test_slots_by_date_use_index(self):
+        queryset = DoctorSchedule.objects.filter(date=self.day)
+        self.assertNoFullScan(queryset, SCHEDULE_TABLE)
+
+    def test_appointments_by_slot_date_use_index(self):
+        queryset = Appointment.objects.select_related(
+            "doctor",
+            "doctor_schedule"
+        ).filter(doctor_schedule__date=self.day)
+        self.assertNoFullScan(queryset, SCHEDULE_TABLE)
+        self.assertNoFullScan(queryset, APPOINTMENT_TABLE)
+
+
+class AppointmentSearchPlanTest(QueryPlanTestCase):
+
+    def view_queryset(self, **params):
+        view = AppointmentListView()
+        view.setup(RequestFactory().get("/appointments/", params))
+        return view.get_queryset()
+
+    def test_search_by_date_uses_index(self):
+        queryset = self.view_queryset(date=self.day.isoformat())
+        self.assertTrue(queryset.exists())
+        self.assertNoFullScan(queryset, SCHEDULE_TABLE)
+        self.assertNoFullScan(queryset, APPOINTMENT_TABLE)
+
+    def test_search_by_date_range_uses_index(self):
+        queryset = self.view_queryset(
+            date_from=self.day.isoformat(),
+            date_to=(self.day + timedelta(days=2)).isoformat(),
+        )
+        self.assertTrue(queryset.exists())
+        self.assertNoFullScan(queryset, SCHEDULE_TABLE)
+        self.assertNoFullScan(queryset, APPOINTMENT_TABLE)
+
+    def test_search_by_doctor_and_range_uses_index(self):
+        queryset = self.view_queryset(
+            doctor=self.doctor.pk,
+            date_from=self.day.isoformat(),
+            date_to=(self.day + timedelta(days=2)).isoformat(),
+        )
+        self.assertTrue(queryset.exists())
+        self.assertNoFullScan(queryset, SCHEDULE_TABLE)
+        self.assertNoFullScan(queryset, APPOINTMENT_TABLE)
+
+
+class AvailabilitySearchPlanTest(QueryPlanTestCase):
+
+    def search_queryset(self, **params):
+        form = AvailabilitySearchForm(params)
+        return form.filter_slots(
+            DoctorSchedule.objects.filter(is_booked=False)
+        ).order_by("date", "timeslot", "pk")
+
+    def test_search_by_city_and_range_uses_index(self):
+        queryset = self.search_queryset(
+            city="TEST_CITY",
+            date_from=self.day.isoformat(),
+            date_to=(self.day + timedelta(days=2)).isoformat(),
+        )
+        self.assertTrue(queryset.exists())
+        self.assertNoFullScan(queryset, SCHEDULE_TABLE)
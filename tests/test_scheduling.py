@@ -0,0 +1,127 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from doctors_service.models import DoctorSchedule, WeeklySchedule
+from doctors_service.scheduling import generate_schedule
+
+MONDAY = date(2026, 10, 19)
+
+
+class GenerateScheduleTest(TestCase):
+
+    def setUp(self):
+        self.doctor = get_user_model().objects.create(
+            first_name="test_first_name",
+            last_name="test_last_name",
+            password="<PASSWORD>",
+            username="test_username",
+            licence_number="TES12345",
+            city="test_city",
+            hospital="test_hospital",
+        )
+
+    def test_generate_schedule_follows_pattern(self):
+        generate_schedule(
+            self.doctor.pk,
+            MONDAY,
+            MONDAY + timedelta(days=13),
+            [(0, 1), (0, 2), (2, 5)]
+        )
+        self.assertEqual(
+            list(
+                DoctorSchedule.objects.filter(doctor=self.doctor)
+                .values_list("date", "timeslot")
+            ),
+            [
+                (MONDAY, 1),
+                (MONDAY, 2),
+                (MONDAY + timedelta(days=2), 5),
+                (MONDAY + timedelta(days=7), 1),
+                (MONDAY + timedelta(days=7), 2),
+                (MONDAY + timedelta(days=9), 5),
+            ]
+        )
+
+    def test_generate_schedule_skips_existing_slots(self):
+        DoctorSchedule.objects.create(
+            doctor=self.doctor,
+            date=MONDAY,
+            timeslot=1,
+            is_booked=True
+        )
+        generate_schedule(self.doctor.pk, MONDAY, MONDAY, [(0, 1), (0, 2)])
+        self.assertEqual(
+            DoctorSchedule.objects.filter(doctor=self.doctor).count(),
+            2
+        )
+        self.assertTrue(
+            DoctorSchedule.objects.get(date=MONDAY, timeslot=1).is_booked
+        )
+
+    def test_generate_schedule_view_saves_weekly_schedule(self):
+        self.client.force_login(self.doctor)
+        response = self.client.post(
+            reverse(
+                "doctors_service:doctor-schedule-generate",
+                kwargs={"pk": self.doctor.pk}
+            ),
+            data={
+                "date_from": MONDAY.isoformat(),
+                "date_to": (MONDAY + timedelta(days=6)).isoformat(),
+                "weekdays": [0, 4],
+                "timeslots": [0, 7],
+            }
+        )
+        self.assertRedirects(
+            response,
+            reverse(
+                "doctors_service:doctors-detail",
+                kwargs={"pk": self.doctor.pk}
+            )
+        )
+        self.assertEqual(
+            WeeklySchedule.objects.filter(doctor=self.doctor).count(),
+            4
+        )
+        self.assertEqual(
+            DoctorSchedule.objects.filter(doctor=self.doctor).count(),
+            4
+        )
+
+    def test_generate_schedule_view_rejects_reversed_range(self):
+        self.client.force_login(self.doctor)
+        response = self.client.post(
+            reverse(
+                "doctors_service:doctor-schedule-generate",
+                kwargs={"pk": self.doctor.pk}
+            ),
+            data={
+                "date_from": MONDAY.isoformat(),
+                "date_to": (MONDAY - timedelta(days=1)).isoformat(),
+                "weekdays": [0],
+                "timeslots": [0],
+            }
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(DoctorSchedule.objects.exists())
+
+    def test_generate_schedules_command_fills_horizon(self):
+        WeeklySchedule.objects.bulk_create(
+            WeeklySchedule(doctor=self.doctor, weekday=weekday, timeslot=3)
+            for weekday in range(7)
+        )
+        call_command("generate_schedules", days=13, stdout=StringIO())
+        today = timezone.localdate()
+        self.assertEqual(
+            list(
+                DoctorSchedule.objects.filter(doctor=self.doctor)
+                .values_list("date", flat=True)
+            ),
+            [today + timedelta(days=day) for day in range(14)]
+        )
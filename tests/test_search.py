@@ -0,0 +1,77 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from doctors_service.models import DoctorSpecialty
+from doctors_service.search import search_doctors
+
+DOCTORS_LIST = reverse("doctors_service:doctors-list")
+
+
+class DoctorSearchTest(TestCase):
+
+    def setUp(self):
+        self.cardiology = DoctorSpecialty.objects.create(
+            specialty="Cardiology"
+        )
+        self.kyiv_doctor = self.create_doctor(
+            "Olena", "Shevchenko", "Kyiv", "Kyiv City Hospital", 1
+        )
+        self.lviv_doctor = self.create_doctor(
+            "Taras", "Kovalenko", "Lviv", "Kyiv Clinic", 2
+        )
+        self.lviv_doctor.specialty.add(self.cardiology)
+
+    def create_doctor(self, first_name, last_name, city, hospital, number):
+        return get_user_model().objects.create(
+            first_name=first_name,
+            last_name=last_name,
+            password="<PASSWORD>",
+            username=f"test_username_{number}",
+            licence_number=f"TES1234{number}",
+            city=city,
+            hospital=hospital,
+        )
+
+    def search(self, query):
+        return list(
+            search_doctors(get_user_model().objects.all(), query)
+            .order_by("-rank", "pk")
+        )
+
+    def test_search_by_name_prefix(self):
+        self.assertEqual(self.search("shev"), [self.kyiv_doctor])
+
+    def test_search_by_specialty(self):
+        self.assertEqual(self.search("cardio"), [self.lviv_doctor])
+
+    def test_search_all_words_must_match(self):
+        self.assertEqual(self.search("taras kyiv"), [self.lviv_doctor])
+
+    def test_search_ranks_better_matches_first(self):
+        self.assertEqual(
+            self.search("kyiv"),
+            [self.kyiv_doctor, self.lviv_doctor]
+        )
+
+    def test_index_follows_changes(self):
+        self.kyiv_doctor.specialty.add(self.cardiology)
+        self.assertEqual(len(self.search("cardiology")), 2)
+
+        self.cardiology.specialty = "Cardiac surgery"
+        self.cardiology.save()
+        self.assertEqual(len(self.search("surgery")), 2)
+
+        self.lviv_doctor.city = "Odesa"
+        self.lviv_doctor.save()
+        self.assertEqual(self.search("odesa"), [self.lviv_doctor])
+
+        self.lviv_doctor.delete()
+        self.assertEqual(self.search("surgery"), [self.kyiv_doctor])
+
+    def test_doctors_list_search(self):
+        response = self.client.get(DOCTORS_LIST, {"query": "Cardiology"})
+        self.assertEqual(
+            list(response.context["doctors_list"]),
+            [self.lviv_doctor]
+        )
@@ -0,0 +1,82 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+PROFILE_SCRIPT = """
+import json
+import django
+from django.conf import settings
+from django.urls import get_resolver
+
+django.setup()
+print(json.dumps({
+    "debug": settings.DEBUG,
+    "installed_apps": settings.INSTALLED_APPS,
+    "middleware": settings.MIDDLEWARE,
+    "routes": [str(route.pattern) for route in get_resolver().url_patterns],
+    "loaders": settings.TEMPLATES[0]["OPTIONS"].get("loaders"),
+    "conn_health_checks": settings.DATABASES["default"]["CONN_HEALTH_CHECKS"],
+    "cache": settings.CACHES["default"]["BACKEND"],
+    "staticfiles": settings.STORAGES["staticfiles"]["BACKEND"],
+    "metrics_require_token": settings.METRICS_REQUIRE_TOKEN,
+}))
+"""
+
+
+def load_profile(module: str) -> dict:
+    # Settings are process-wide, so each profile is booted in a fresh
+    # interpreter.
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": module,
+        "DJANGO_SECRET_KEY": "test",
+    }
+    env.pop("REDIS_URL", None)
+    output = subprocess.run(
+        [sys.executable, "-c", PROFILE_SCRIPT],
+        cwd=settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+class SettingsProfileTest(SimpleTestCase):
+
+    def test_prod_drops_debug_toolbar(self):
+        profile = load_profile("doctors_patients_service.settings.prod")
+        self.assertFalse(profile["debug"])
+        self.assertNotIn("debug_toolbar", profile["installed_apps"])
+        self.assertNotIn(
+            "debug_toolbar.middleware.DebugToolbarMiddleware",
+            profile["middleware"]
+        )
+        self.assertNotIn("__debug__/", profile["routes"])
+
+    def test_prod_enables_production_backends(self):
+        profile = load_profile("doctors_patients_service.settings.prod")
+        self.assertEqual(
+            profile["loaders"][0][0],
+            "django.template.loaders.cached.Loader"
+        )
+        self.assertTrue(profile["conn_health_checks"])
+        self.assertTrue(profile["metrics_require_token"])
+        self.assertNotIn("locmem", profile["cache"])
+        self.assertEqual(
+            profile["staticfiles"],
+            "django.contrib.staticfiles.storage.ManifestStaticFilesStorage"
+        )
+
+    def test_dev_keeps_debug_toolbar(self):
+        profile = load_profile("doctors_patients_service.settings.dev")
+        self.assertIn(
+            "debug_toolbar.middleware.DebugToolbarMiddleware",
+            profile["middleware"]
+        )
+        self.assertIn("__debug__/", profile["routes"])
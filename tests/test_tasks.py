@@ -0,0 +1,147 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from doctors_service import queue
+from doctors_service.models import (
+    Appointment,
+    DailyAvailability,
+    DoctorSchedule,
+    Task
+)
+
+APPOINTMENT_FORM = reverse("doctors_service:appointment-form")
+
+
+class TaskQueueTest(TestCase):
+
+    def setUp(self):
+        self.doctor = get_user_model().objects.create(
+            first_name="test_first_name",
+            last_name="test_last_name",
+            password="<PASSWORD>",
+            username="test_username",
+            licence_number="TES12345",
+            city="test_city",
+            hospital="test_hospital",
+        )
+        self.slot = DoctorSchedule.objects.create(
+            doctor=self.doctor,
+            date=timezone.localdate() + timedelta(days=3),
+            timeslot=2
+        )
+
+    def book(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(APPOINTMENT_FORM, {
+                "doctor": self.doctor.pk,
+                "doctor_schedule": self.slot.pk,
+                "first_name": "test_first_name",
+                "last_name": "test_last_name",
+                "email": "patient@test.com",
+                "phone": "+380682222222",
+                "insurance_number": "1234567890",
+            })
+        self.assertEqual(response.status_code, 302)
+        return Appointment.objects.get()
+
+    def test_booking_enqueues_confirmation_and_reminder(self):
+        appointment = self.book()
+        self.assertEqual(len(mail.outbox), 0)
+        tasks = Task.objects.order_by("run_at")
+        self.assertEqual(
+            [task.name for task in tasks],
+            ["send_booking_confirmation", "send_appointment_reminder"]
+        )
+        self.assertEqual(
+            tasks[1].run_at,
+            self.slot.starts_at - timedelta(hours=24)
+        )
+        self.assertEqual(tasks[0].kwargs, {"appointment_id": appointment.pk})
+
+    def test_worker_runs_due_tasks_only(self):
+        self.book()
+        call_command("run_worker", once=True, stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["patient@test.com"])
+        self.assertIn("test_hospital", mail.outbox[0].body)
+        self.assertEqual(
+            Task.objects.get(name="send_appointment_reminder").status,
+            "pending"
+        )
+
+        later = self.slot.starts_at - timedelta(hours=23)
+        with mock.patch("django.utils.timezone.now", return_value=later):
+            queue.run_due_tasks()
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_failed_task_is_retried_later(self):
+        Task.objects.create(
+            name="send_booking_confirmation",
+            kwargs={"unexpected": 1}
+        )
+        queue.run_due_tasks()
+        task = Task.objects.get()
+        self.assertEqual(task.status, "pending")
+        self.assertEqual(task.attempts, 1)
+        self.assertIn("TypeError", task.last_error)
+        self.assertGreater(task.run_at, timezone.now())
+
+    def test_tasks_of_a_dead_worker_are_run_again(self):
+        task = Task.objects.create(name="cleanup_past_slots")
+        queue.claim_due_tasks(10)
+        Task.objects.filter(pk=task.pk).update(
+            started_at=timezone.now() - queue.LEASE_TIMEOUT * 2
+        )
+        queue.ensure_scheduled("cleanup_past_slots")
+        task.refresh_from_db()
+        self.assertEqual(task.status, "pending")
+        self.assertEqual(task.attempts, 1)
+        self.assertEqual(Task.objects.count(), 1)
+
+        self.assertEqual(queue.run_due_tasks(), 1)
+        task.refresh_from_db()
+        self.assertEqual(task.status, "done")
+
+    def test_running_task_keeps_its_lease(self):
+        Task.objects.create(name="cleanup_past_slots")
+        queue.claim_due_tasks(10)
+        self.assertEqual(queue.release_stale_tasks(), 0)
+        self.assertEqual(queue.run_due_tasks(), 0)
+
+    def test_cleanup_removes_past_free_slots_and_reschedules(self):
+        yesterday = timezone.localdate() - timedelta(days=1)
+        DoctorSchedule.objects.create(
+            doctor=self.doctor, date=yesterday, timeslot=1
+        )
+        booked = DoctorSchedule.objects.create(
+            doctor=self.doctor, date=yesterday, timeslot=2, is_booked=True
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("run_worker", once=True, stdout=StringIO())
+        self.assertEqual(
+            set(DoctorSchedule.objects.values_list("pk", flat=True)),
+            {self.slot.pk, booked.pk}
+        )
+        self.assertFalse(
+            DailyAvailability.objects.filter(date=yesterday).exists()
+        )
+        task = Task.objects.get(name="cleanup_past_slots", status="pending")
+        self.assertGreater(task.run_at, timezone.now() + timedelta(hours=23))
+
+    @override_settings(
+        TASK_QUEUE_BACKEND="doctors_service.queue.ImmediateBackend"
+    )
+    def test_backend_is_pluggable(self):
+        queue.get_backend.cache_clear()
+        self.addCleanup(queue.get_backend.cache_clear)
+        self.book()
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertFalse(Task.objects.exists())
@@ -1,11 +1,13 @@
-from datetime import date
+from datetime import date, timedelta
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.test import TestCase
 from django.urls import reverse
+from django.utils import timezone
 from django.contrib.auth import get_user_model
 from doctors_service.models import DoctorSpecialty, DoctorSchedule
 from doctors_service.forms import DoctorUpdateForm
+from doctors_service.views import DoctorDetailView
 
 
 DOCTORS_LIST = reverse("doctors_service:doctors-list")
@@ -90,6 +92,11 @@ class PublicDoctorTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(list(response.context["object_list"]), [self.doctor])
 
+    def test_query_search_by_any_field_of_doctor(self):
+        response = self.client.get("/doctors/", {"query": "tes"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context["object_list"]), [self.doctor])
+
     def test_search_with_empty_query(self):
         response = self.client.get("/doctors/")
         self.assertEqual(response.status_code, 200)
@@ -224,15 +231,16 @@ class PrivateDoctorTest(TestCase):
         )
 
     def test_only_free_times_retrieve_on_doctors_detail_page(self):
+        tomorrow = timezone.localdate() + timedelta(days=1)
         schedule_not_booked = DoctorSchedule.objects.create(
             doctor=self.doctor,
-            date="2026-10-20",
+            date=tomorrow + timedelta(days=1),
             timeslot=5,
             is_booked=False
         )
         schedule_booked = DoctorSchedule.objects.create(
             doctor=self.doctor,
-            date="2026-10-19",
+            date=tomorrow,
             timeslot=3,
             is_booked=True
         )
@@ -245,3 +253,69 @@ class PrivateDoctorTest(TestCase):
         available_schedule = response.context["available_schedule"]
         self.assertIn(schedule_not_booked, available_schedule)
         self.assertNotIn(schedule_booked, available_schedule)
+
+    def test_doctor_detail_hides_past_slots(self):
+        today = timezone.localdate()
+        past_schedule = DoctorSchedule.objects.create(
+            doctor=self.doctor,
+            date=today - timedelta(days=1),
+            timeslot=5,
+        )
+        future_schedule = DoctorSchedule.objects.create(
+            doctor=self.doctor,
+            date=today + timedelta(days=1),
+            timeslot=5,
+        )
+        response = self.client.get(
+            reverse(
+                "doctors_service:doctors-detail",
+                kwargs={"pk": self.doctor.pk}
+            )
+        )
+        available_schedule = response.context["available_schedule"]
+        self.assertIn(future_schedule, available_schedule)
+        self.assertNotIn(past_schedule, available_schedule)
+
+    def test_doctor_detail_schedule_pagination(self):
+        tomorrow = timezone.localdate() + timedelta(days=1)
+        DoctorSchedule.objects.bulk_create(
+            DoctorSchedule(
+                doctor=self.doctor,
+                date=tomorrow + timedelta(days=day),
+                timeslot=timeslot,
+            )
+            for day in range(2)
+            for timeslot, _ in DoctorSchedule.TIMESLOT_LIST
+        )
+        url = reverse(
+            "doctors_service:doctors-detail",
+            kwargs={"pk": self.doctor.pk}
+        )
+        response = self.client.get(url)
+        self.assertTrue(response.context["is_paginated"])
+        self.assertEqual(
+            len(response.context["available_schedule"]),
+            DoctorDetailView.schedule_paginate_by
+        )
+        response = self.client.get(url, {"page": 2})
+        self.assertEqual(len(response.context["available_schedule"]), 6)
+
+    def test_doctor_detail_queries_do_not_grow_with_history(self):
+        DoctorSchedule.objects.bulk_create(
+            DoctorSchedule(
+                doctor=self.doctor,
+                date=date(2020, 1, 1) + timedelta(days=day),
+                timeslot=timeslot,
+                is_booked=True,
+            )
+            for day in range(30)
+            for timeslot, _ in DoctorSchedule.TIMESLOT_LIST
+        )
+        self.client.logout()
+        url = reverse(
+            "doctors_service:doctors-detail",
+            kwargs={"pk": self.doctor.pk}
+        )
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        self.assertEqual(len(response.context["available_schedule"]), 0)
@@ -1,7 +1,13 @@
+from datetime import timedelta
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
-from doctors_service.models import DoctorSpecialty
+from django.utils import timezone
+
+from doctors_service.availability import rebuild_daily_availability
+from doctors_service.models import DoctorSchedule, DoctorSpecialty
 
 DOCTOR_SPECIALTY_URL = reverse("doctors_service:specialties-list")
 DOCTOR_SPECIALTY_DETAIL_URL = reverse(
@@ -59,3 +65,122 @@ class PublicDoctorSpecialtyTest(TestCase):
             response.context["specialty"],
             doctor.specialty.first()
         )
+
+
+class SpecialtyDetailDoctorsTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.specialty = DoctorSpecialty.objects.create(specialty="Therapist")
+        self.doctors = [
+            get_user_model().objects.create(
+                first_name=f"test_first_name_{number:02d}",
+                last_name="test_last_name",
+                password="<PASSWORD>",
+                username=f"test_username_{number}",
+                licence_number=f"TES123{number:02d}",
+                city="Kyiv" if number % 2 else "Lviv",
+                hospital="test_hospital",
+            )
+            for number in range(25)
+        ]
+        self.specialty.doctors.add(*self.doctors)
+        self.url = reverse(
+            "doctors_service:specialties-detail",
+            kwargs={"pk": self.specialty.pk}
+        )
+
+    def test_doctors_are_paginated(self):
+        response = self.client.get(self.url)
+        self.assertTrue(response.context["is_paginated"])
+        self.assertEqual(len(response.context["doctors_list"]), 20)
+        response = self.client.get(
+            self.url,
+            {"after": response.context["page_obj"].next_cursor}
+        )
+        self.assertEqual(
+            [doctor.pk for doctor in response.context["doctors_list"]],
+            [doctor.pk for doctor in self.doctors[20:]]
+        )
+
+    def test_filter_by_city(self):
+        response = self.client.get(self.url, {"city": "kyiv"})
+        self.assertEqual(
+            {doctor.city for doctor in response.context["doctors_list"]},
+            {"Kyiv"}
+        )
+        self.assertEqual(len(response.context["doctors_list"]), 12)
+
+    def test_next_free_slot(self):
+        tomorrow = timezone.localdate() + timedelta(days=1)
+        DoctorSchedule.objects.create(
+            doctor=self.doctors[0], date=tomorrow, timeslot=1, is_booked=True
+        )
+        DoctorSchedule.objects.create(
+            doctor=self.doctors[0], date=tomorrow, timeslot=6
+        )
+        DoctorSchedule.objects.create(
+            doctor=self.doctors[0], date=tomorrow, timeslot=2
+        )
+        response = self.client.get(self.url)
+        first, second = response.context["doctors_list"][:2]
+        self.assertEqual(first.next_free_date, tomorrow)
+        self.assertEqual(first.next_free_time, "11:00 – 12:00")
+        self.assertIsNone(second.next_free_date)
+
+    def test_queries_do_not_grow_with_doctors(self):
+        # The specialty and one page of annotated doctors.
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+
+class SpecialtyListAvailabilityTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.cardiology = DoctorSpecialty.objects.create(
+            specialty="Cardiology"
+        )
+        self.dermatology = DoctorSpecialty.objects.create(
+            specialty="Dermatology"
+        )
+        self.doctors = [
+            get_user_model().objects.create(
+                username=f"test_username_{number}",
+                licence_number=f"TES1234{number}",
+            )
+            for number in range(3)
+        ]
+        self.cardiology.doctors.add(*self.doctors)
+        self.dermatology.doctors.add(self.doctors[0])
+        today = timezone.localdate()
+        self.in_two_days = today + timedelta(days=2)
+        DoctorSchedule.objects.bulk_create([
+            DoctorSchedule(doctor=self.doctors[0], date=self.in_two_days,
+                           timeslot=1),
+            DoctorSchedule(doctor=self.doctors[1],
+                           date=today + timedelta(days=1),
+                           timeslot=1, is_booked=True),
+            DoctorSchedule(doctor=self.doctors[2],
+                           date=today - timedelta(days=1), timeslot=1),
+            DoctorSchedule(doctor=self.doctors[2],
+                           date=today + timedelta(days=5), timeslot=1),
+        ])
+        rebuild_daily_availability()
+
+    def test_counts_and_next_free_date(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(DOCTOR_SPECIALTY_URL)
+        cardiology, dermatology = response.context["specialties_list"]
+        self.assertEqual(cardiology.doctors_count, 3)
+        self.assertEqual(cardiology.next_free_date, self.in_two_days)
+        self.assertEqual(dermatology.doctors_count, 1)
+        self.assertContains(response, "3 doctors")
+
+    def test_specialty_without_doctors(self):
+        DoctorSpecialty.objects.create(specialty="Surgery")
+        surgery = self.client.get(
+            DOCTOR_SPECIALTY_URL
+        ).context["specialties_list"][2]
+        self.assertEqual(surgery.doctors_count, 0)
+        self.assertIsNone(surgery.next_free_date)